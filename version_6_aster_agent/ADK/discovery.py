@@ -1,9 +1,158 @@
+# =============================================================================
+# ADK/discovery.py
+# =============================================================================
+# 🎯 Purpose:
+# Registry of in-process agents, searchable by capability.
+#
+# ✅ Includes:
+# - AgentRegistry: register/unregister agents; every change publishes a new
+#   immutable RegistrySnapshot, so readers never take a lock and never see
+#   a half-applied change
+# - RegistrySnapshot: an inverted index capability → agent names;
+#   discover() looks one capability up, discover_all()/discover_any()
+#   intersect/union several (AND/OR)
+#
+# An agent's capabilities are its `capabilities` and `tags` attributes
+# (lists of strings). Results keep registration order.
+# =============================================================================
+
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping
+
+
+def _capabilities(agent: Any) -> FrozenSet[str]:
+    found = set()
+    for attribute in ("capabilities", "tags"):
+        values = getattr(agent, attribute, None)
+        if isinstance(values, str):
+            found.add(values)
+        elif isinstance(values, (list, tuple, set, frozenset)):
+            found.update(value for value in values if isinstance(value, str))
+    return frozenset(found)
+
+
+class RegistrySnapshot:
+    """One immutable version of the registry. Safe to query from any thread."""
+
+    def __init__(
+        self,
+        version: int,
+        agents: Dict[str, Any],
+        index: Dict[str, FrozenSet[str]],
+        order: Dict[str, int],
+    ):
+        self.version = version
+        self.agents: Mapping[str, Any] = MappingProxyType(agents)
+        self._index = index    # capability → names of agents that have it
+        self._order = order    # name → registration sequence number
+        self._sorted: Dict[str, List[Any]] = {}  # Memoized discover() results
+
+    def _in_order(self, names: Iterable[str]) -> List[Any]:
+        return [self.agents[name] for name in sorted(names, key=self._order.__getitem__)]
+
+    def capabilities(self) -> List[str]:
+        return list(self._index)
+
+    def discover(self, capability: str) -> List[Any]:
+        result = self._sorted.get(capability)
+        if result is None:
+            result = self._sorted[capability] = self._in_order(self._index.get(capability, ()))
+        return list(result)
+
+    def discover_all(self, *capabilities: str) -> List[Any]:
+        """Agents that have every one of `capabilities` (AND)."""
+        if not capabilities:
+            return []
+        sets = sorted((self._index.get(capability, frozenset()) for capability in capabilities), key=len)
+        names = set(sets[0])
+        for other in sets[1:]:
+            if not names:
+                break
+            names &= other
+        return self._in_order(names)
+
+    def discover_any(self, *capabilities: str) -> List[Any]:
+        """Agents that have at least one of `capabilities` (OR)."""
+        names = set()
+        for capability in capabilities:
+            names |= self._index.get(capability, frozenset())
+        return self._in_order(names)
+
+
 class AgentRegistry:
     def __init__(self):
-        self.agents = {}
+        self._snapshot = RegistrySnapshot(0, {}, {}, {})
+        self._write_lock = threading.Lock()  # Writers only; readers use the current snapshot
+        self._sequence = 0
+
+    @property
+    def agents(self) -> Mapping[str, Any]:
+        return self._snapshot.agents
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def snapshot(self) -> RegistrySnapshot:
+        """The current version; use it to run several queries against the same state."""
+        return self._snapshot
 
     def register(self, name, agent):
-        self.agents[name] = agent
+        self.register_many({name: agent})
+
+    def register_many(self, agents: Mapping[str, Any]) -> None:
+        """Add or replace agents, publishing one new version for the whole batch."""
+        self._apply(upserts=agents, removals=())
+
+    def unregister(self, name) -> None:
+        self._apply(upserts={}, removals=(name,))
 
     def discover(self, capability):
-        return [agent for agent in self.agents.values() if capability in agent.capabilities]
\ No newline at end of file
+        return self._snapshot.discover(capability)
+
+    def discover_all(self, *capabilities):
+        return self._snapshot.discover_all(*capabilities)
+
+    def discover_any(self, *capabilities):
+        return self._snapshot.discover_any(*capabilities)
+
+    def _apply(self, upserts: Mapping[str, Any], removals: Iterable[str]) -> None:
+        """Copy-on-write: only the index entries of affected capabilities are rebuilt."""
+        with self._write_lock:
+            old = self._snapshot
+            agents = dict(old.agents)
+            order = dict(old._order)
+            changed: Dict[str, set] = {}  # capability → mutable copy of its agent set
+
+            def entry(capability: str) -> set:
+                if capability not in changed:
+                    changed[capability] = set(old._index.get(capability, ()))
+                return changed[capability]
+
+            def drop(name: str) -> None:
+                for capability in _capabilities(agents.pop(name)):
+                    entry(capability).discard(name)
+
+            for name in removals:
+                if name in agents:
+                    drop(name)
+                    del order[name]
+            for name, agent in upserts.items():
+                if name in agents:
+                    drop(name)  # Re-registering keeps the original position
+                else:
+                    self._sequence += 1
+                    order[name] = self._sequence
+                agents[name] = agent
+                for capability in _capabilities(agent):
+                    entry(capability).add(name)
+
+            index = dict(old._index)
+            for capability, names in changed.items():
+                if names:
+                    index[capability] = frozenset(names)
+                else:
+                    index.pop(capability, None)
+            # Publishing is a single reference assignment, so readers see old or new, never a mix
+            self._snapshot = RegistrySnapshot(old.version + 1, agents, index, order)
@@ -20,9 +20,10 @@ logger = logging.getLogger(__name__)
     help="Path to agent registry JSON. Defaults to utilities/agent_registry.json"
 )
 def main(host, port, registry):
-    # DiscoveryClient로 AgentCard 리스트 비동기 로드
+    # DiscoveryClient로 AgentCard 리스트 비동기 로드 (같은 agent_id를 여러 URL이 제공하면 replica)
     discovery = DiscoveryClient(registry_file=registry)
-    agent_cards = asyncio.run(discovery.list_agent_cards())
+    replicas = asyncio.run(discovery.list_agent_replicas())
+    agent_cards = {agent_id: cards[0] for agent_id, cards in replicas.items()}
     if not agent_cards:
         logger.warning("No agents found in registry. Orchestrator will have nothing to call.")
     capabilities = AgentCapabilities(streaming=False)
@@ -44,7 +45,11 @@ def main(host, port, registry):
         skills=[skill]
     )
     server = A2AServer(host=host, port=port)
-    server.register_agent("aster", agent_card, AsterTaskManager(agent=AsterAgent(agent_cards)))
+    server.register_agent("aster", agent_card, AsterTaskManager(agent=AsterAgent(
+        agent_cards,
+        replicas={agent_id: [card.url for card in cards] for agent_id, cards in replicas.items()},
+        discovery=discovery,  # replica 추가/제거를 주기적으로 반영
+    )))
     server.start()
 
 if __name__ == "__main__":
@@ -1,39 +1,85 @@
 import uuid
 import logging
-from dotenv import load_dotenv
-load_dotenv()
-
-from google.adk.agents.llm_agent import LlmAgent
-from google.adk.sessions import InMemorySessionService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.runners import Runner
-from google.adk.agents.readonly_context import ReadonlyContext
-from google.adk.tools.tool_context import ToolContext
-from google.adk.tools.function_tool import FunctionTool
-from google.genai import types
+from typing import TYPE_CHECKING
+
+# Google ADK / genai / dotenv는 처음 사용할 때 import (_build_runner 참고) → 서버 시작 시간 단축
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.runners import Runner
+    from google.adk.agents.readonly_context import ReadonlyContext
+    from google.adk.tools.tool_context import ToolContext
 
 #from utilities.agent_registry import load_agent_registry  # 유틸리티에서 agent registry 로드 함수 필요
 #from utilities.agent_connect import AgentConnector        # 각 agent에 task를 보낼 커넥터
 from utilities.a2a.agent_connect import AgentConnector        # 각 agent에 task를 보낼 커넥터
 from utilities.a2a.agent_discovery import DiscoveryClient
+from utilities.a2a.health import BreakerPolicy, CircuitOpenError, HealthMonitor  # 장애 agent는 빠르게 실패 + LLM 후보에서 제외
+from utilities.a2a.load_balancer import BalancerPolicy, ReplicaConnector          # agent replica 간 부하 분산
+from utilities.a2a.hedging import HedgePolicy                                    # p95를 넘은 위임은 다른 replica에 중복 전송
+from utilities.metrics import LlmCallTimer                # LLM 호출 시간을 /metrics 로 기록
+from utilities.llm.runner_pool import RunnerPool, RunnerPoolConfig  # 에이전트별 Runner pool + warm-up
+from utilities.llm.context_window import ContextWindow, ContextPolicy  # 모델 호출마다 prompt를 token budget 안으로 압축
+from utilities.tool_cache import CachePolicy, fold_text, tool_cache                # 같은 인자의 위임 결과 재사용
+from utilities.a2a.skill_router import SkillRouter                       # 명확한 질의는 LLM 없이 바로 위임
+try:
+    from utilities.a2a.skill_index import SkillIndex                     # 질의와 가까운 top-k agent만 LLM에 노출
+except ImportError:  # NumPy 미설치: 모든 agent를 LLM에 노출
+    SkillIndex = None
 from agents.aster_agent.task_manager import AsterTaskManager
 #from server.server import A2AServer
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
+from models.task import Message, Task, TaskState
+from representation.text import to_llm_text                             # 하위 agent의 DataPart는 JSON 그대로 LLM에 전달
 import asyncio
 
 logger = logging.getLogger(__name__)
 
+
+class DelegationError(Exception):
+    """하위 task가 COMPLETED가 아닌 상태(FAILED, INPUT_REQUIRED 등)로 끝남: 응답은 e.reply, 캐시하지 않음"""
+
+    def __init__(self, agent_name: str, task: Task):
+        self.task = task
+        self.reply = task.history[-1] if len(task.history) > 1 else None
+        super().__init__(f"Agent {agent_name} ended task {task.id} as {task.status.state}")
+
+
 class AsterAgent:
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain"] ##????
     #capabilities = ['orchestrate', 'render']
 
-    def __init__(self, agent_cards):
-        # 1. AgentConnector 생성
+    def __init__(
+        self,
+        agent_cards,
+        pool: RunnerPoolConfig | None = None,
+        context: ContextPolicy | None = None,
+        fast_route: bool = True,
+        candidates: int = 5,
+        breaker: BreakerPolicy | None = None,
+        probe_interval: float = 10.0,
+        replicas=None,
+        balancer: BalancerPolicy | None = None,
+        discovery: DiscoveryClient | None = None,
+        discovery_interval: float = 60.0,
+        hedge: HedgePolicy | None = None,
+    ):
+        # 1. agent별 ReplicaConnector 생성 (replica URL마다 circuit breaker 보유)
+        #    replicas: agent_id → replica URL 목록 (없으면 card.url 하나)
+        self.agent_cards = {}
         self.connectors = {}
+        self._cache_policies = {}  # agent_id → AgentCard skill의 cacheTtl/cacheScope로 정한 캐시 정책
+        self._breaker = breaker
+        self._balancer = balancer
+        self._hedge = hedge  # None: hedging 끔 (replica가 2개 이상일 때만 의미 있음)
         for agent_id, card in agent_cards.items():
-            self.connectors[agent_id] = AgentConnector(agent_id, card.url)
-            logger.info(f"Registered connector for: {agent_id}")
+            self._add_connector(agent_id, card, (replicas or {}).get(agent_id))
+        # 주기적으로 /.well-known/agent.json을 확인해서 breaker 상태 갱신 (서버 lifespan에서 start/stop)
+        # discovery가 있으면 discovery_interval마다 replica 목록도 다시 읽음
+        self._discovery = discovery
+        self.health_monitor = HealthMonitor(
+            self.connectors, probe_interval,
+            refresh=self.refresh_agents if discovery else None, refresh_interval=discovery_interval,
+        )
 
         # 2. (선택) MCP/Tool 래핑 (여기선 생략, 필요시 FunctionTool 패턴 추가)
         self._tools = [
@@ -41,48 +87,181 @@ class AsterAgent:
             self._delegate_task
         ]
 
-        # 3. LlmAgent/Runner 통합
-        self._agent = self._build_agent()
+        # 3. LlmAgent/Runner 통합 (처음 사용할 때 생성, 동시 요청마다 pool에서 하나씩 사용)
+        #    합성 요청은 하위 agent로 위임될 수 있으므로 기본값은 warm-up 시 생략
         self._user_id = "aster_orchestrator_user"
-        self._runner = Runner(
-            app_name=self._agent.name,
-            agent=self._agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
-        )
+        self._services = None  # 모든 Runner가 공유하는 session/memory/artifact 서비스
+        self.runner_pool = RunnerPool(self._build_runner, pool)
+
+        # 4. 긴 세션: 최근 turn만 그대로 보내고 이전 turn/큰 _delegate_task 결과는 요약으로 대체
+        self.context_window = ContextWindow("aster_orchestrator_agent", context)
+
+        # 5. LLM 전 routing 단계: AgentSkill tags/examples TF-IDF index로 확실한 경우만 바로 위임
+        self._fast_route = fast_route
+        self.router = SkillRouter(agent_cards) if fast_route and agent_cards else None
+
+        # 6. agent가 많을 때: LLM에는 질의와 가까운 top-k 후보만 보여줌 (card 변경 시 해당 row만 갱신)
+        self.candidates = candidates
+        self.skill_index = SkillIndex(agent_cards) if SkillIndex is not None else None
+
+    def _add_connector(self, agent_id: str, card: AgentCard, urls=None) -> None:
+        self.agent_cards[agent_id] = card
+        urls = list(urls or [card.url])
+        existing = self.connectors.get(agent_id)
+        if existing is None:
+            self.connectors[agent_id] = ReplicaConnector(agent_id, urls, self._balancer, self._breaker, self._hedge)
+        else:
+            existing.set_replicas(urls)  # 남아 있는 replica는 health/latency 상태 유지
+        self._cache_policies[agent_id] = CachePolicy.from_skills(card.skills)
+        logger.info(f"Registered connector for: {agent_id} ({len(urls)} replica(s))")
+
+    def upsert_agent(self, agent_id: str, card: AgentCard, urls=None) -> None:
+        """agent 추가/card 변경을 재시작 없이 반영 (index는 해당 agent만 다시 계산)"""
+        self._add_connector(agent_id, card, urls)
+        if self._fast_route:
+            self.router = SkillRouter(self.agent_cards)  # IDF가 전체 agent에 의존하므로 재구성 (작은 index)
+        if self.skill_index is not None:
+            self.skill_index.upsert(agent_id, card)
+
+    def remove_agent(self, agent_id: str) -> None:
+        self.agent_cards.pop(agent_id, None)
+        self.connectors.pop(agent_id, None)
+        self._cache_policies.pop(agent_id, None)
+        if self._fast_route:
+            self.router = SkillRouter(self.agent_cards) if self.agent_cards else None
+        if self.skill_index is not None:
+            self.skill_index.remove(agent_id)
+
+    def set_replicas(self, agent_id: str, urls) -> None:
+        """card는 그대로 두고 replica 목록만 교체 (index 재계산 없음)"""
+        self.connectors[agent_id].set_replicas(urls)
+
+    async def refresh_agents(self) -> None:
+        """
+        discovery를 다시 실행해서 이미 아는 agent의 replica 목록(과 변경된 card)을 반영.
+        - 새 agent_id는 추가하지 않음 (registry에 orchestrator 자신도 있음) → upsert_agent 사용
+        - 응답한 replica가 하나도 없는 agent는 그대로 둠 (일시 장애는 circuit breaker가 처리)
+        """
+        discovered = await self._discovery.list_agent_replicas()
+        for agent_id, cards in discovered.items():
+            if agent_id not in self.connectors:
+                continue
+            urls = [card.url for card in cards]
+            if self.agent_cards[agent_id] != cards[0]:
+                self.upsert_agent(agent_id, cards[0], urls)
+            else:
+                self.set_replicas(agent_id, urls)
+
+    def _available_agents(self) -> list[str]:
+        """호출 가능한 replica가 하나라도 있는 agent"""
+        return [agent_id for agent_id, connector in self.connectors.items() if connector.available]
+
+    def _candidate_agents(self, query: str) -> list[str]:
+        """호출 가능한 agent 중 query와 가장 가까운 top-k (agent가 적거나 index가 없으면 전체)"""
+        available = self._available_agents()
+        if self.skill_index is None or len(available) <= self.candidates or not query:
+            return available
+        # 장애 agent만큼 더 뽑은 뒤 제외
+        k = self.candidates + len(self.connectors) - len(available)
+        healthy = set(available)
+        ranked = [agent_id for agent_id, _ in self.skill_index.top_k(query, k) if agent_id in healthy]
+        return ranked[:self.candidates]
+
+    @property
+    def _runner(self) -> "Runner":
+        return self.runner_pool.primary
+
+    @property
+    def _agent(self) -> "LlmAgent":
+        return self._runner.agent
+
+    def _build_runner(self) -> "Runner":
+        from google.adk.sessions import InMemorySessionService
+        from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+        from google.adk.artifacts import InMemoryArtifactService
+        from google.adk.runners import Runner
+        from dotenv import load_dotenv
+        load_dotenv()
+
+        if self._services is None:
+            self._services = dict(
+                artifact_service=InMemoryArtifactService(),
+                session_service=InMemorySessionService(),
+                memory_service=InMemoryMemoryService(),
+            )
+
+        agent = self._build_agent()
+        return Runner(app_name=agent.name, agent=agent, **self._services)
+
+    def _build_agent(self) -> "LlmAgent":
+        from google.adk.agents.llm_agent import LlmAgent
+        from utilities.llm.replay_llm import resolve_model        # A2A_LLM_REPLAY 설정 시 오프라인 replay 모델 사용
 
-    def _build_agent(self) -> LlmAgent:
+        callbacks = LlmCallTimer("aster_orchestrator_agent").callbacks()          # LLM 호출 시간 측정
+        callbacks["before_model_callback"] = [self.context_window.before_model,   # prompt 압축 후 시간 측정 시작
+                                              callbacks["before_model_callback"]]
         return LlmAgent(
-            model="gemini-1.5-flash-latest",
+            model=resolve_model("gemini-1.5-flash-latest", "aster_orchestrator_agent"),
             name="aster_orchestrator_agent",
             description="Orchestrates and routes tasks to domain agents.",
             instruction=self._root_instruction,
             tools=self._tools,
+            **callbacks,
         )
 
-    def _root_instruction(self, context: ReadonlyContext) -> str:
+    def _root_instruction(self, context: "ReadonlyContext") -> str:
+        candidates = "\n".join(
+            f"- {agent_id}: {self.agent_cards[agent_id].description}"
+            for agent_id in self._candidate_agents(_user_text(context.user_content))
+        )
         return (
             "You are an orchestrator. Use list_agents() to see available agents. "
-            "Use delegate_task(agent_name, message) to route user queries."
+            "Use delegate_task(agent_name, message) to route user queries.\n"
+            f"Candidate agents for this request:\n{candidates}"
         )
 
-    def _list_agents(self) -> list[str]:
-        return list(self.connectors.keys())
+    def _list_agents(self, tool_context: "ToolContext") -> list[str]:
+        # 전체 agent 대신 현재 질의에 가까운 후보만 반환
+        return self._candidate_agents(_user_text(tool_context.user_content))
 
-    async def _delegate_task(self, agent_name: str, message: str, tool_context: ToolContext) -> str:
+    async def _delegate_task(self, agent_name: str, message: str, tool_context: "ToolContext") -> str:
         if agent_name not in self.connectors:
             raise ValueError(f"Unknown agent: {agent_name}")
         state = tool_context.state
         if "session_id" not in state:
             state["session_id"] = str(uuid.uuid4())
-        session_id = state["session_id"]
+        try:
+            return to_llm_text(await self._delegate(agent_name, message, state["session_id"]))
+        except CircuitOpenError as e:
+            # 예외 대신 결과로 돌려줘서 LLM이 다른 agent를 고르거나 사용자에게 알릴 수 있게 함
+            logger.warning(str(e))
+            return f"Agent {agent_name} is temporarily unavailable. Choose another agent or tell the user."
+        except DelegationError as e:
+            # 실패/추가 입력 요청도 LLM에는 그대로 전달 (tool_cache에는 남지 않음)
+            logger.warning(str(e))
+            return to_llm_text(e.reply) or str(e)
+
+    async def _delegate(self, agent_name: str, message: str, session_id: str) -> Message | None:
+        # 같은 세션(또는 global 정책이면 전체)에서 같은 agent/message 위임은 캐시된 결과 사용
+        return await tool_cache.get_or_call(
+            f"_delegate_task:{agent_name}",
+            {"message": fold_text(message)},  # 대소문자/공백만 다른 같은 질의는 같은 캐시 항목
+            self._cache_policies[agent_name],
+            lambda: self._send_task(agent_name, message, session_id),
+            session_id=session_id,
+        )
+
+    async def _send_task(self, agent_name: str, message: str, session_id: str) -> Message | None:
+        # 이 호출이 cancel되면 AgentConnector가 원격 하위 task에도 tasks/cancel을 보냄
+        # 응답 Message(DataPart 포함)를 그대로 반환: 텍스트 변환은 필요한 쪽에서 (representation/text.py)
         task = await self.connectors[agent_name].send_task(message, session_id)
+        if task.status.state != TaskState.COMPLETED:
+            raise DelegationError(agent_name, task)  # 예외는 캐시되지 않음 → 일시적 실패가 재사용되지 않음
         if task.history and len(task.history) > 1:
-            return task.history[-1].parts[0].text
-        return ""
+            return task.history[-1]
+        return None
 
-    def invoke(self, query: str, session_id: str) -> str:
+    def _get_or_create_session(self, session_id: str):
         session = self._runner.session_service.get_session(
             app_name=self._agent.name,
             user_id=self._user_id,
@@ -95,6 +274,12 @@ class AsterAgent:
                 session_id=session_id,
                 state={}
             )
+        return session
+
+    def invoke(self, query: str, session_id: str) -> str:
+        from google.genai import types
+
+        session = self._get_or_create_session(session_id)
         content = types.Content(
             role="user",
             parts=[types.Part.from_text(text=query)]
@@ -108,6 +293,65 @@ class AsterAgent:
             return ""
         return "\n".join(p.text for p in events[-1].content.parts if p.text)
 
+    async def ainvoke(self, query: str, session_id: str) -> str | Message:
+        # run_async를 현재 이벤트 루프에서 실행: task cancel 시 LLM 호출과
+        # _delegate_task로 위임된 하위 task까지 함께 취소됨
+        from google.genai import types
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+
+        # ⚡ Fast path: 질의가 한 agent의 skill과 확실히 일치하면 LLM 왕복 없이 바로 위임
+        decision = self.router.route(query) if self.router else None
+        if decision is not None and not self.connectors[decision.agent_id].available:
+            decision = None  # 장애 agent: LLM이 다른 agent를 고르게 함
+        if self.router:
+            self.router.record(decision)
+        if decision is not None:
+            return await self._fast_delegate(decision.agent_id, query, session_id, content)
+
+        last_event = None
+        # pool에서 Runner를 빌려 실행 (오래된 세션 정리/히스토리 압축 포함)
+        async for event in self.runner_pool.run_async(self._user_id, session_id, content):
+            last_event = event
+        if not last_event or not last_event.content or not last_event.content.parts:
+            return ""
+        return "\n".join(p.text for p in last_event.content.parts if p.text)
+
+    async def _fast_delegate(self, agent_name: str, query: str, session_id: str, content) -> str | Message:
+        # LLM 경로의 _delegate_task와 같은 하위 session_id(state["session_id"])를 사용하고,
+        # 이번 turn을 ADK 세션에 기록해서 이후 LLM 호출도 대화 맥락을 볼 수 있게 함
+        # 하위 agent의 Message는 그대로 반환 → DataPart가 client까지 전달됨
+        from google.genai import types
+
+        state = await self.runner_pool.session_state(self._user_id, session_id)
+        downstream_session = state.get("session_id") or str(uuid.uuid4())
+        try:
+            reply = await self._delegate(agent_name, query, downstream_session)
+        except DelegationError as e:
+            logger.warning(str(e))
+            reply = e.reply
+        await self.runner_pool.record_turn(
+            self._user_id, session_id, content,
+            types.Content(role="model", parts=[types.Part.from_text(text=to_llm_text(reply))]),
+            state_delta=None if "session_id" in state else {"session_id": downstream_session},
+        )
+        logger.info(f"⚡ Routed directly to {agent_name} (no LLM call)")
+        return reply if reply is not None else ""
+
+    async def warm_up(self) -> None:
+        # Runner pool 생성 + 모델 클라이언트 초기화 (config.warmup_query가 있으면 합성 요청도 실행)
+        await self.runner_pool.warm_up(self._user_id)
+
+def _user_text(content) -> str:
+    """ADK user_content(types.Content)에서 text만 추출"""
+    if content is None or not content.parts:
+        return ""
+    return " ".join(part.text for part in content.parts if part.text)
+
+
 def main(host, port, registry):
     discovery = DiscoveryClient(registry_file=registry)
     agent_cards = asyncio.run(discovery.list_agent_cards())
@@ -1,6 +1,12 @@
+import logging
+
 from server.task_manager import InMemoryTaskManager
-from models.request import SendTaskRequest, SendTaskResponse
-from models.task import Message, TaskStatus, TaskState, TextPart
+from models.request import SendTaskRequest
+from models.task import Message, StoredTask, TaskState, TextPart
+from representation.text import to_text
+from utilities.tracing import tracer
+
+logger = logging.getLogger(__name__)
 
 class AsterTaskManager(InMemoryTaskManager):
     def __init__(self, agent):
@@ -8,19 +14,28 @@ class AsterTaskManager(InMemoryTaskManager):
         self.agent = agent
 
     def _get_user_query(self, request: SendTaskRequest) -> str:
-        return request.params.message.parts[0].text
+        return request.params.message.text()
 
     def _get_metadata(self, request: SendTaskRequest):
         return getattr(request.params, "metadata", None)
 
-    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
-        task = await self.upsert_task(request.params)
+    async def process_task(self, request: SendTaskRequest, task: StoredTask) -> None:
+        await self.update_status(task, TaskState.WORKING)
         query = self._get_user_query(request)
         session_id = request.params.sessionId
-        # invoke()를 통해 LLM 오케스트레이션 및 agent 연결
-        reply = self.agent.invoke(query, session_id)
-        agent_message = Message(role="agent", parts=[TextPart(text=str(reply))])
-        async with self.lock:
-            task.status = TaskStatus(state=TaskState.COMPLETED)
-            task.history.append(agent_message)
-        return SendTaskResponse(id=request.id, result=task)
+        try:
+            # ainvoke()를 통해 LLM 오케스트레이션 및 agent 연결 (tasks/cancel 시 함께 취소됨)
+            with tracer.span("agent.invoke", agent="aster", session_id=session_id):
+                reply = await self.agent.ainvoke(query, session_id)
+        except Exception as e:
+            logger.error(f"Error processing task: {e}")
+            error_message = Message(role="agent", parts=[TextPart(text=f"Error processing request: {str(e)}")])
+            await self.update_status(task, TaskState.FAILED, error_message)
+            return
+        # 위임 결과 Message: 사용자에게 보여줄 text(여기서 처음 포맷)와 원본 DataPart/FilePart를 함께 전달
+        if isinstance(reply, Message):
+            parts = [TextPart(text=to_text(reply)), *(part for part in reply.parts if part.type != "text")]
+        else:
+            parts = [TextPart(text=str(reply))]
+        agent_message = Message(role="agent", parts=parts)
+        await self.update_status(task, TaskState.COMPLETED, agent_message)
@@ -76,7 +76,9 @@ def main(host: str, port: int, debug: bool):
                 "Tell me about Paris",
                 "What are the attractions in Tokyo?",
                 "Show me city information from Expedia"
-            ]
+            ],
+            cacheTtl=3600,       # City facts rarely change: callers may reuse answers for an hour
+            cacheScope="global",
         )
         
         # Create agent card (metadata)
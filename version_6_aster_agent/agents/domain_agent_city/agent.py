@@ -32,25 +32,18 @@ class DomainAgentCity:
 # -----------------------------------------------------------------------------
 # 📦 Built-in & External Library Imports
 # -----------------------------------------------------------------------------
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 
-# 🧠 Gemini-based AI agent provided by Google's ADK
-from google.adk.agents.llm_agent import LlmAgent
+# 📈 Records every LLM call's duration for /metrics
+from utilities.metrics import LlmCallTimer
+# 🏊 Per-agent Runner pool and startup warm-up
+from utilities.llm.runner_pool import RunnerPool, RunnerPoolConfig
 
-# 📚 ADK services for session, memory, and file-like "artifacts"
-from google.adk.sessions import InMemorySessionService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.artifacts import InMemoryArtifactService
-
-# 🏃 The "Runner" connects the agent, session, memory, and files into a complete system
-from google.adk.runners import Runner
-
-# 🧾 Gemini-compatible types for formatting input/output messages
-from google.genai import types
-
-# 🔐 Load environment variables (like API keys) from a `.env` file
-from dotenv import load_dotenv
-load_dotenv()  # Load variables like GOOGLE_API_KEY into the system
+# ⏳ Google ADK, genai and dotenv are imported on first use (see `_build_runner`),
+# so importing this module (and starting the server) stays fast
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.runners import Runner
 
 # -----------------------------------------------------------------------------
 # 🏙️ CityAgent: Your AI agent that provides city information
@@ -60,33 +53,74 @@ class CityAgent:
     # This agent supports plain text and structured data
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain", "application/json"]
 
-    def __init__(self):
+    def __init__(self, pool: RunnerPoolConfig | None = None):
         """
         👷 Initialize the CityAgent:
         - Creates the LLM agent (powered by Gemini)
         - Sets up session handling, memory, and a runner to execute tasks
+
+        Args:
+            pool (RunnerPoolConfig | None): Runner pool size and warm-up settings
         """
-        self._agent = self._build_agent()  # Set up the Gemini agent
         self._user_id = "city_agent_user"  # Use a fixed user ID for simplicity
-
-        # 🧠 The Runner is what actually manages the agent and its environment
-        self._runner = Runner(
-            app_name=self._agent.name,
-            agent=self._agent,
-            artifact_service=InMemoryArtifactService(),  # For files (not used here)
-            session_service=InMemorySessionService(),    # Keeps track of conversations
-            memory_service=InMemoryMemoryService(),      # Optional: remembers past messages
+        self._services = None              # Session/memory/artifact services shared by all Runners
+        # 🏊 Runners are built on first use (or during warm-up), one per concurrent request
+        self.runner_pool = RunnerPool(
+            self._build_runner,
+            pool or RunnerPoolConfig(warmup_query="Tell me about Paris"),
         )
 
-    def _build_agent(self) -> LlmAgent:
+    @property
+    def _runner(self) -> "Runner":
+        """🧠 The primary ADK Runner, built the first time the agent is used"""
+        return self.runner_pool.primary
+
+    @property
+    def _agent(self) -> "LlmAgent":
+        return self._runner.agent
+
+    def _build_runner(self) -> "Runner":
+        """
+        ⚙️ Import Google ADK and set up the Gemini agent and its Runner.
+
+        Returns:
+            Runner: Manages the agent and its environment (sessions, memory, files)
+        """
+        # 📚 ADK services for session, memory, and file-like "artifacts"
+        from google.adk.sessions import InMemorySessionService
+        from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+        from google.adk.artifacts import InMemoryArtifactService
+        # 🏃 The "Runner" connects the agent, session, memory, and files into a complete system
+        from google.adk.runners import Runner
+        # 🔐 Load environment variables (like API keys) from a `.env` file
+        from dotenv import load_dotenv
+        load_dotenv()  # Load variables like GOOGLE_API_KEY into the system
+
+        if self._services is None:
+            self._services = dict(
+                artifact_service=InMemoryArtifactService(),  # For files (not used here)
+                session_service=InMemorySessionService(),    # Keeps track of conversations
+                memory_service=InMemoryMemoryService(),      # Optional: remembers past messages
+            )
+
+        agent = self._build_agent()  # Set up the Gemini agent
+        return Runner(app_name=agent.name, agent=agent, **self._services)
+
+    def _build_agent(self) -> "LlmAgent":
         """
         ⚙️ Creates and returns a Gemini agent with city-specific settings.
 
         Returns:
             LlmAgent: An agent object from Google's ADK
         """
+        # 🧠 Gemini-based AI agent provided by Google's ADK
+        from google.adk.agents.llm_agent import LlmAgent
+        # 📼 Offline replay model for load testing (see utilities/llm/replay_llm.py)
+        from utilities.llm.replay_llm import resolve_model
+
         return LlmAgent(
-            model="gemini-1.5-flash-latest",         # Gemini model version
+            # Gemini model version (or the offline replay model when A2A_LLM_REPLAY is set)
+            model=resolve_model("gemini-1.5-flash-latest", "city_info_agent"),
             name="city_info_agent",                  # Name of the agent
             description="Provides detailed city information",    # Description for metadata
             instruction="""
@@ -95,25 +129,16 @@ class CityAgent:
             2. Include key tourist attractions
             3. Add relevant travel information
             Format responses as structured data when possible.
-            """
+            """,
+            **LlmCallTimer("city_info_agent").callbacks(),  # Time each model call
         )
 
     def get_supported_representation(self) -> List[str]:
         """Returns the supported representation types for city data"""
         return ["card", "table", "list"]
 
-    def invoke(self, query: str, session_id: str) -> Dict[str, Any]:
-        """
-        📥 Handle a user query about cities and return structured data.
-
-        Args:
-            query (str): What the user asked about cities
-            session_id (str): Helps group messages into a session
-
-        Returns:
-            Dict[str, Any]: Structured city data with representation preference
-        """
-        # 🔁 Try to reuse an existing session (or create one if needed)
+    def _get_or_create_session(self, session_id: str):
+        """🔁 Reuse an existing session for this session_id, or create one"""
         session = self._runner.session_service.get_session(
             app_name=self._agent.name,
             user_id=self._user_id,
@@ -127,21 +152,10 @@ class CityAgent:
                 session_id=session_id,
                 state={}
             )
+        return session
 
-        # 📨 Format the user message for Gemini
-        content = types.Content(
-            role="user",
-            parts=[types.Part.from_text(text=query)]
-        )
-
-        # 🚀 Run the agent and collect response
-        events = list(self._runner.run(
-            user_id=self._user_id,
-            session_id=session.id,
-            new_message=content
-        ))
-
-        # Process the response into structured data
+    def _build_response(self, query: str) -> Dict[str, Any]:
+        """Turn the query into structured city data with a representation preference"""
         if "expedia" in query.lower() or "city" in query.lower():
             return {
                 "data": [
@@ -158,6 +172,60 @@ class CityAgent:
             "desired_representation": "list"
         }
 
+    def invoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        """
+        📥 Handle a user query about cities and return structured data.
+
+        Args:
+            query (str): What the user asked about cities
+            session_id (str): Helps group messages into a session
+
+        Returns:
+            Dict[str, Any]: Structured city data with representation preference
+        """
+        from google.genai import types  # 🧾 Gemini-compatible message types
+
+        session = self._get_or_create_session(session_id)
+
+        # 📨 Format the user message for Gemini
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+
+        # 🚀 Run the agent and collect response
+        events = list(self._runner.run(
+            user_id=self._user_id,
+            session_id=session.id,
+            new_message=content
+        ))
+
+        # Process the response into structured data
+        return self._build_response(query)
+
+    async def ainvoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        """
+        📥 Async version of `invoke()` that runs on the caller's event loop.
+
+        Because the model call is awaited (not run in a thread), cancelling the
+        calling asyncio task stops the in-flight LLM request.
+        """
+        from google.genai import types
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+        # 🏊 Runs on a borrowed Runner, so concurrent requests don't share one;
+        # the pool also evicts idle sessions and compacts long histories
+        async for _ in self.runner_pool.run_async(self._user_id, session_id, content):
+            pass
+        return self._build_response(query)
+
+    async def warm_up(self) -> None:
+        """🔥 Build the Runner pool and run a synthetic request before real traffic arrives"""
+        await self.runner_pool.warm_up(self._user_id)
+
     async def stream(self, query: str, session_id: str):
         """
         🌀 Provides streaming responses for city information requests.
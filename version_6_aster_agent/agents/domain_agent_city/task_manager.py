@@ -14,8 +14,9 @@ import asyncio
 import logging
 
 from server.task_manager import InMemoryTaskManager
-from models.request import SendTaskRequest, SendTaskResponse
-from models.task import Message, TaskStatus, TaskState, TextPart
+from models.request import SendTaskRequest
+from models.task import DataPart, Message, StoredTask, TaskState, TextPart
+from utilities.tracing import tracer
 #from google.adk.tasks import Task, TaskResult
 #from google.adk.messages import MessageService
 
@@ -26,7 +27,7 @@ class CityTaskManager(InMemoryTaskManager):
     🎯 Manages tasks for the CityAgent, handling:
     - Task creation and updates
     - Message processing
-    - Response formatting
+    - Structured responses (DataPart)
     """
     
     def __init__(self, agent):
@@ -50,7 +51,7 @@ class CityTaskManager(InMemoryTaskManager):
         Returns:
             str: The extracted user query
         """
-        return request.params.message.parts[0].text
+        return request.params.message.text()
 
     async def _process_agent_response(self, response: Dict[str, Any]) -> Message:
         """
@@ -60,81 +61,45 @@ class CityTaskManager(InMemoryTaskManager):
             response: Raw response from the agent
             
         Returns:
-            Message: Formatted message with the response
+            Message: The structured response as a DataPart (formatted only
+            when a text consumer asks, see representation/text.py)
         """
-        # Convert the structured response to a formatted message
-        formatted_text = self._format_city_data(response)
         return Message(
             role="agent",
-            parts=[TextPart(text=formatted_text)]
+            parts=[DataPart(data=response, metadata={"schema": "city"})]
         )
 
-    def _format_city_data(self, response: Dict[str, Any]) -> str:
+    async def process_task(self, request: SendTaskRequest, task: StoredTask) -> None:
         """
-        Format city data into a readable string
-        
-        Args:
-            response: The structured city data
-            
-        Returns:
-            str: Formatted string representation
-        """
-        if not response.get("data"):
-            return "No city information found."
-            
-        result = []
-        for city in response["data"]:
-            city_info = [
-                f"🏙️ {city['city']}, {city['country']}",
-                f"👥 Population: {city['population']}"
-            ]
-            if "attractions" in city:
-                attractions = ", ".join(city["attractions"])
-                city_info.append(f"🎯 Attractions: {attractions}")
-            result.append("\n".join(city_info))
-            
-        return "\n\n".join(result)
-
-    async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
-        """
-        Handle incoming task requests
+        Run the CityAgent for a stored task and record the outcome
         
         Args:
             request: The task request to process
-            
-        Returns:
-            SendTaskResponse: The response containing results
+            task: The stored task to update
         """
-        # Create or update task
-        task = await self.upsert_task(request.params)
+        await self.update_status(task, TaskState.WORKING)
         
         try:
             # Get the user's query
             query = self._get_user_query(request)
             
-            # Get response from the agent
-            result = self.agent.invoke(
-                query=query,
-                session_id=str(task.id)  # Use task ID as session ID
-            )
+            # Get response from the agent (awaited, so tasks/cancel can interrupt it)
+            with tracer.span("agent.invoke", agent="city", task_id=task.id):
+                result = await self.agent.ainvoke(
+                    query=query,
+                    session_id=str(task.id)  # Use task ID as session ID
+                )
             
             # Process the response
             agent_message = await self._process_agent_response(result)
             
             # Update task status and history
-            async with self.lock:
-                task.status = TaskStatus(state=TaskState.COMPLETED)
-                task.history.append(agent_message)
-                
-            return SendTaskResponse(id=request.id, result=task)
+            await self.update_status(task, TaskState.COMPLETED, agent_message)
             
         except Exception as e:
             logger.error(f"Error processing task: {e}")
-            async with self.lock:
-                task.status = TaskStatus(state=TaskState.FAILED)
-                error_message = Message(
-                    role="agent",
-                    parts=[TextPart(text=f"Error processing request: {str(e)}")]
-                )
-                task.history.append(error_message)
-            return SendTaskResponse(id=request.id, result=task)
+            error_message = Message(
+                role="agent",
+                parts=[TextPart(text=f"Error processing request: {str(e)}")]
+            )
+            await self.update_status(task, TaskState.FAILED, error_message)
@@ -38,7 +38,9 @@ def main(host: str, port: int, debug: bool):
             examples=[
                 "What's the weather in Seoul?",
                 "Give me the weather forecast for London."
-            ]
+            ],
+            cacheTtl=300,        # Weather changes: reuse answers within one conversation for 5 minutes
+            cacheScope="session",
         )
         agent_card = AgentCard(
             name="WeatherAgent",
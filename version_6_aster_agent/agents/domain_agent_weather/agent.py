@@ -5,47 +5,73 @@
 # This file defines a WeatherAgent that provides weather information using Google's ADK.
 # =============================================================================
 
-from typing import List, Dict, Any
-from google.adk.agents.llm_agent import LlmAgent
-from google.adk.sessions import InMemorySessionService
-from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
-from google.adk.artifacts import InMemoryArtifactService
-from google.adk.runners import Runner
-from google.genai import types
-from dotenv import load_dotenv
-load_dotenv()
+from typing import TYPE_CHECKING, List, Dict, Any
+from utilities.metrics import LlmCallTimer
+from utilities.llm.runner_pool import RunnerPool, RunnerPoolConfig
+
+# Google ADK, genai and dotenv are imported on first use (see _build_runner)
+if TYPE_CHECKING:
+    from google.adk.agents.llm_agent import LlmAgent
+    from google.adk.runners import Runner
 
 class WeatherAgent:
     SUPPORTED_CONTENT_TYPES = ["text", "text/plain", "application/json"]
 
-    def __init__(self):
-        self._agent = self._build_agent()
+    def __init__(self, pool: RunnerPoolConfig | None = None):
         self._user_id = "weather_agent_user"
-        self._runner = Runner(
-            app_name=self._agent.name,
-            agent=self._agent,
-            artifact_service=InMemoryArtifactService(),
-            session_service=InMemorySessionService(),
-            memory_service=InMemoryMemoryService(),
+        self._services = None  # 모든 Runner가 공유하는 session/memory/artifact 서비스
+        self.runner_pool = RunnerPool(
+            self._build_runner,
+            pool or RunnerPoolConfig(warmup_query="What's the weather in Seoul?"),
         )
 
-    def _build_agent(self) -> LlmAgent:
+    @property
+    def _runner(self) -> "Runner":
+        return self.runner_pool.primary
+
+    @property
+    def _agent(self) -> "LlmAgent":
+        return self._runner.agent
+
+    def _build_runner(self) -> "Runner":
+        from google.adk.sessions import InMemorySessionService
+        from google.adk.memory.in_memory_memory_service import InMemoryMemoryService
+        from google.adk.artifacts import InMemoryArtifactService
+        from google.adk.runners import Runner
+        from dotenv import load_dotenv
+        load_dotenv()
+
+        if self._services is None:
+            self._services = dict(
+                artifact_service=InMemoryArtifactService(),
+                session_service=InMemorySessionService(),
+                memory_service=InMemoryMemoryService(),
+            )
+
+        agent = self._build_agent()
+        return Runner(app_name=agent.name, agent=agent, **self._services)
+
+    def _build_agent(self) -> "LlmAgent":
+        from google.adk.agents.llm_agent import LlmAgent
+        from utilities.llm.replay_llm import resolve_model
+
         return LlmAgent(
-            model="gemini-1.5-flash-latest",
+            model=resolve_model("gemini-1.5-flash-latest", "weather_info_agent"),
             name="weather_info_agent",
             description="Provides current weather information",
             instruction=(
                 "You are a weather information expert. "
                 "When asked about the weather, provide current temperature, condition, and tips. "
                 "Format responses as structured data when possible."
-            )
+            ),
+            **LlmCallTimer("weather_info_agent").callbacks(),
         )
 
     def get_supported_representation(self) -> List[str]:
         return ["card", "table", "list"]
         #return ["list_images", "markdown", "list"]
 
-    def invoke(self, query: str, session_id: str) -> Dict[str, Any]:
+    def _get_or_create_session(self, session_id: str):
         session = self._runner.session_service.get_session(
             app_name=self._agent.name,
             user_id=self._user_id,
@@ -58,16 +84,9 @@ class WeatherAgent:
                 session_id=session_id,
                 state={}
             )
-        content = types.Content(
-            role="user",
-            parts=[types.Part.from_text(text=query)]
-        )
-        events = list(self._runner.run(
-            user_id=self._user_id,
-            session_id=session.id,
-            new_message=content
-        ))
+        return session
 
+    def _build_response(self, query: str) -> Dict[str, Any]:
         # 실제로는 외부 API 연동, 여기선 예시 데이터
         if "weather" in query.lower() or "forecast" in query.lower():
             return {
@@ -82,6 +101,38 @@ class WeatherAgent:
             "desired_representation": "list"
         }
 
+    def invoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        from google.genai import types
+
+        session = self._get_or_create_session(session_id)
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+        events = list(self._runner.run(
+            user_id=self._user_id,
+            session_id=session.id,
+            new_message=content
+        ))
+        return self._build_response(query)
+
+    async def ainvoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        # run_async를 직접 await 하므로 호출한 asyncio task를 cancel하면 LLM 호출도 중단됨
+        from google.genai import types
+
+        content = types.Content(
+            role="user",
+            parts=[types.Part.from_text(text=query)]
+        )
+        # 동시 요청끼리 Runner를 공유하지 않도록 pool에서 하나 빌려 씀 (오래된 세션 정리/히스토리 압축 포함)
+        async for _ in self.runner_pool.run_async(self._user_id, session_id, content):
+            pass
+        return self._build_response(query)
+
+    async def warm_up(self) -> None:
+        # 서버 시작 시 Runner pool 생성 + 합성 요청 1회 실행
+        await self.runner_pool.warm_up(self._user_id)
+
     async def stream(self, query: str, session_id: str):
         yield {
             "is_task_complete": True,
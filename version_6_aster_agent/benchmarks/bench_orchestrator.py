@@ -0,0 +1,61 @@
+# =============================================================================
+# benchmarks/bench_orchestrator.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures orchestrator multi-hop latency:
+#   client → Aster server → AgentConnector → Weather/City server → back
+# All agents are stubs, so the numbers reflect HTTP, JSON-RPC validation and
+# task bookkeeping on both hops, not model time.
+# =============================================================================
+
+import uuid
+from typing import Any, Dict
+
+import httpx
+
+from server.server import A2AServer
+from agents.aster_agent.task_manager import AsterTaskManager
+from agents.domain_agent_city.task_manager import CityTaskManager
+from agents.domain_agent_weather.task_manager import WeatherTaskManager
+from benchmarks.harness import ServerThread, free_port, run_load
+from benchmarks.stub_agents import StubAsterAgent, StubCityAgent, StubWeatherAgent, make_card
+
+
+def _single_agent_server(agent_id: str, card_name: str, task_manager, port: int) -> A2AServer:
+    server = A2AServer(host="127.0.0.1", port=port)
+    card = make_card(card_name, f"http://127.0.0.1:{port}/", agent_id, [agent_id])
+    server.register_agent(agent_id, card, task_manager)
+    return server
+
+
+async def bench_orchestrator(total: int, concurrency: int) -> Dict[str, Any]:
+    """Send weather/city queries to a stub Aster server that delegates over HTTP."""
+    weather_port, city_port, aster_port = free_port(), free_port(), free_port()
+    weather = _single_agent_server("weather", "WeatherAgent", WeatherTaskManager(agent=StubWeatherAgent()), weather_port)
+    city = _single_agent_server("city", "CityAgent", CityTaskManager(agent=StubCityAgent()), city_port)
+
+    with ServerThread(weather.app, weather_port) as weather_url, ServerThread(city.app, city_port) as city_url:
+        aster_agent = StubAsterAgent({"weather": weather_url, "city": city_url})
+        aster = _single_agent_server("aster", "AsterAgent", AsterTaskManager(agent=aster_agent), aster_port)
+
+        with ServerThread(aster.app, aster_port) as aster_url:
+            limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+            async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+
+                async def hop(i: int):
+                    text = "weather in Seoul" if i % 2 == 0 else "tell me about a city"
+                    response = await client.post(aster_url, json={
+                        "jsonrpc": "2.0",
+                        "id": uuid.uuid4().hex,
+                        "method": "tasks/send",
+                        "params": {
+                            "id": f"hop-{i}",
+                            "sessionId": f"bench-{i % concurrency}",
+                            "message": {"role": "user", "parts": [{"type": "text", "text": text}]},
+                        },
+                    })
+                    response.raise_for_status()
+                    if response.json()["result"]["status"]["state"] != "completed":
+                        raise RuntimeError("Orchestrated task did not complete")
+
+                return {"concurrency": concurrency, "multi_hop_send": await run_load(hop, total, concurrency)}
@@ -0,0 +1,134 @@
+# =============================================================================
+# benchmarks/bench_registry.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures ADK AgentRegistry with many agents (10k by default):
+# - Bulk and incremental register / unregister cost
+# - discover (one capability), discover_all (AND) and discover_any (OR)
+#   against a linear scan over every agent, as discover() used to do
+# - Query latency while another thread keeps registering and unregistering
+# =============================================================================
+
+import time
+import random
+import threading
+from typing import Any, Callable, Dict, List
+
+from ADK.discovery import AgentRegistry
+from benchmarks.harness import percentile
+
+
+class _StubAgent:
+    def __init__(self, capabilities: List[str], tags: List[str]):
+        self.capabilities = capabilities
+        self.tags = tags
+
+
+def _agents(count: int, capabilities: int, seed: int = 7) -> Dict[str, _StubAgent]:
+    """Agents with 3 capabilities and 2 tags each; low-numbered capabilities are the common ones."""
+    rng = random.Random(seed)
+    weights = [1 / (rank + 1) for rank in range(capabilities)]
+    names = [f"cap-{rank}" for rank in range(capabilities)]
+    return {
+        f"agent-{i}": _StubAgent(
+            capabilities=list(set(rng.choices(names, weights, k=3))),
+            tags=[f"tag-{rng.randrange(capabilities)}" for _ in range(2)],
+        )
+        for i in range(count)
+    }
+
+
+def _time_per_op(count: int, op: Callable[[int], Any]) -> float:
+    """Average microseconds per call of `op(i)` over `count` calls."""
+    start = time.perf_counter()
+    for i in range(count):
+        op(i)
+    return round((time.perf_counter() - start) / count * 1e6, 3)
+
+
+def _linear_scan(agents: Dict[str, Any], *capabilities: str) -> List[Any]:
+    return [agent for agent in agents.values() if all(c in agent.capabilities for c in capabilities)]
+
+
+def bench_registry(agent_count: int = 10_000, capabilities: int = 200, ops: int = 1000) -> Dict[str, Any]:
+    agents = _agents(agent_count, capabilities)
+    extra = _agents(ops, capabilities, seed=11)
+
+    registry = AgentRegistry()
+    start = time.perf_counter()
+    registry.register_many(agents)
+    bulk_ms = (time.perf_counter() - start) * 1000
+
+    extra_names = list(extra)
+    register_us = _time_per_op(ops, lambda i: registry.register(f"extra-{i}", extra[extra_names[i]]))
+    unregister_us = _time_per_op(ops, lambda i: registry.unregister(f"extra-{i}"))
+
+    # Queries on a common, a mid-frequency and a rare capability
+    queries = {"common": "cap-0", "medium": f"cap-{capabilities // 10}", "rare": f"cap-{capabilities - 1}"}
+    discover = []
+    for label, capability in queries.items():
+        snapshot = registry.snapshot()
+        discover.append({
+            "capability": label,
+            "matches": len(snapshot.discover(capability)),
+            "indexed_us": _time_per_op(ops, lambda i: snapshot.discover(capability)),
+            "indexed_uncached_us": _time_per_op(ops, lambda i: snapshot.discover_any(capability)),
+            "linear_scan_us": _time_per_op(max(1, ops // 10), lambda i: _linear_scan(snapshot.agents, capability)),
+        })
+
+    snapshot = registry.snapshot()
+    and_query = ("cap-0", "cap-1")
+    or_query = ("cap-1", "cap-5", f"cap-{capabilities - 1}")
+    combined = {
+        "and_matches": len(snapshot.discover_all(*and_query)),
+        "and_us": _time_per_op(ops, lambda i: snapshot.discover_all(*and_query)),
+        "and_linear_scan_us": _time_per_op(max(1, ops // 10), lambda i: _linear_scan(snapshot.agents, *and_query)),
+        "or_matches": len(snapshot.discover_any(*or_query)),
+        "or_us": _time_per_op(ops, lambda i: snapshot.discover_any(*or_query)),
+    }
+
+    return {
+        "agents": agent_count,
+        "capabilities": capabilities,
+        "register_many_ms": round(bulk_ms, 2),
+        "register_us": register_us,
+        "unregister_us": unregister_us,
+        "discover": discover,
+        "combined": combined,
+        "under_writes": _bench_under_writes(registry, extra, ops),
+    }
+
+
+def _bench_under_writes(registry: AgentRegistry, extra: Dict[str, Any], ops: int) -> Dict[str, Any]:
+    """Query latency while a writer thread churns registrations (readers take no lock)."""
+    stop = threading.Event()
+    writes = 0
+
+    def writer():
+        nonlocal writes
+        names = list(extra)
+        while not stop.is_set():
+            name = names[writes % len(names)]
+            registry.register(name, extra[name])
+            registry.unregister(name)
+            writes += 2
+
+    thread = threading.Thread(target=writer, daemon=True)
+    thread.start()
+    latencies = []
+    try:
+        for i in range(ops):
+            start = time.perf_counter()
+            registry.discover_all("cap-0", f"cap-{i % 20 + 1}")
+            latencies.append((time.perf_counter() - start) * 1e6)
+    finally:
+        stop.set()
+        thread.join()
+
+    latencies.sort()
+    return {
+        "queries": ops,
+        "writes": writes,
+        "p50_us": round(percentile(latencies, 50), 3),
+        "p99_us": round(percentile(latencies, 99), 3),
+    }
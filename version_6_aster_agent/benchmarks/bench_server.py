@@ -0,0 +1,72 @@
+# =============================================================================
+# benchmarks/bench_server.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures A2AServer over real HTTP with a stub CityAgent behind it:
+# - tasks/send throughput and p50/p99 latency
+# - tasks/get throughput and p50/p99 latency
+# - discovery endpoint (/.well-known/agent.json) throughput
+# =============================================================================
+
+import uuid
+from typing import Any, Dict
+
+import httpx
+
+from server.server import A2AServer
+from agents.domain_agent_city.task_manager import CityTaskManager
+from benchmarks.harness import ServerThread, free_port, run_load
+from benchmarks.stub_agents import StubCityAgent, make_card
+
+
+def _send_body(task_id: str, text: str = "Tell me about Paris city") -> Dict[str, Any]:
+    return {
+        "jsonrpc": "2.0",
+        "id": uuid.uuid4().hex,
+        "method": "tasks/send",
+        "params": {
+            "id": task_id,
+            "sessionId": "bench-session",
+            "message": {"role": "user", "parts": [{"type": "text", "text": text}]},
+        },
+    }
+
+
+def _get_body(task_id: str) -> Dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": uuid.uuid4().hex, "method": "tasks/get", "params": {"id": task_id}}
+
+
+def build_server(port: int, latency: float = 0.0) -> A2AServer:
+    server = A2AServer(host="127.0.0.1", port=port)
+    card = make_card("CityAgent", f"http://127.0.0.1:{port}/", "city_info", ["city"])
+    server.register_agent("city", card, CityTaskManager(agent=StubCityAgent(latency=latency)))
+    return server
+
+
+async def bench_server(total: int, concurrency: int) -> Dict[str, Any]:
+    """Run the send/get/discovery benchmarks against one stub server."""
+    port = free_port()
+    server = build_server(port)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    results: Dict[str, Any] = {"concurrency": concurrency}
+
+    with ServerThread(server.app, port) as url:
+        async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+            async def send(i: int):
+                response = await client.post(url, json=_send_body(f"send-{i}"))
+                response.raise_for_status()
+
+            async def get(i: int):
+                response = await client.post(url, json=_get_body(f"send-{i}"))
+                response.raise_for_status()
+
+            async def discover(i: int):
+                response = await client.get(url + ".well-known/agent.json")
+                response.raise_for_status()
+
+            results["tasks_send"] = await run_load(send, total, concurrency)
+            results["tasks_get"] = await run_load(get, total, concurrency)
+            results["discovery"] = await run_load(discover, total, concurrency)
+
+    return results
@@ -0,0 +1,67 @@
+# =============================================================================
+# benchmarks/bench_startup.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures cold import time of the server and agent entry points, each in a
+# fresh interpreter, and checks it against a budget. Also reports whether
+# importing the module pulled in Google ADK (it should not: ADK is loaded
+# when an agent is first used).
+# =============================================================================
+
+import sys
+import json
+import statistics
+import subprocess
+from typing import Any, Dict, List
+
+from benchmarks.harness import VERSION_ROOT
+
+# Modules whose import cost is paid on every (auto-scaled) process start
+STARTUP_MODULES = [
+    "server.server",
+    "agents.aster_agent.__main__",
+    "agents.domain_agent_city.__main__",
+    "agents.domain_agent_weather.__main__",
+]
+
+_PROBE = """
+import sys, time, json
+start = time.perf_counter()
+import {module}
+print(json.dumps({{
+    "import_ms": (time.perf_counter() - start) * 1000,
+    "adk_loaded": any(name.startswith("google.adk") for name in sys.modules),
+}}))
+"""
+
+
+def _probe(module: str) -> Dict[str, Any]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module)],
+        cwd=VERSION_ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def bench_startup(repeats: int = 5, budget_ms: float = 500.0) -> List[Dict[str, Any]]:
+    """
+    Import each startup module `repeats` times in a new interpreter.
+
+    Returns:
+        One row per module with median/max import time and whether the
+        median stayed within `budget_ms`.
+    """
+    rows = []
+    for module in STARTUP_MODULES:
+        probes = [_probe(module) for _ in range(repeats)]
+        times = [probe["import_ms"] for probe in probes]
+        median_ms = statistics.median(times)
+        rows.append({
+            "module": module,
+            "median_import_ms": round(median_ms, 1),
+            "max_import_ms": round(max(times), 1),
+            "adk_loaded": probes[-1]["adk_loaded"],
+            "budget_ms": budget_ms,
+            "within_budget": median_ms <= budget_ms,
+        })
+    return rows
@@ -0,0 +1,91 @@
+# =============================================================================
+# benchmarks/bench_task_manager.py
+# =============================================================================
+# 🎯 Purpose:
+# Measures InMemoryTaskManager in-process (no HTTP):
+# - upsert_task / on_get_task cost as the number of stored tasks grows
+# - upsert_task / on_get_task cost as one task's history grows
+# - Memory held per stored history message
+# =============================================================================
+
+import time
+import tracemalloc
+from typing import Any, Dict, List
+
+from server.task_manager import InMemoryTaskManager
+from models.request import GetTaskRequest
+from models.task import Message, TaskQueryParams, TaskSendParams, TextPart
+
+
+def _params(task_id: str, turn: int = 0) -> TaskSendParams:
+    # Each turn has its own text: an identical message would be taken for a retried send
+    return TaskSendParams(
+        id=task_id,
+        sessionId="bench-session",
+        message=Message(role="user", parts=[TextPart(text=f"What's the weather in Seoul? ({turn})")]),
+    )
+
+
+async def _time_per_op(count: int, op) -> float:
+    """Average microseconds per call of `op(i)` over `count` calls."""
+    start = time.perf_counter()
+    for i in range(count):
+        await op(i)
+    return round((time.perf_counter() - start) / count * 1e6, 3)
+
+
+async def bench_task_count(task_counts: List[int], ops: int = 1000) -> List[Dict[str, Any]]:
+    rows = []
+    for task_count in task_counts:
+        manager = InMemoryTaskManager()
+        fill_start = time.perf_counter()
+        for i in range(task_count):
+            await manager.upsert_task(_params(f"task-{i}"))
+        fill_s = time.perf_counter() - fill_start
+
+        get_us = await _time_per_op(ops, lambda i: manager.on_get_task(
+            GetTaskRequest(params=TaskQueryParams(id=f"task-{i % task_count}"))
+        ))
+        rows.append({
+            "tasks": task_count,
+            "upsert_new_us": round(fill_s / task_count * 1e6, 3),
+            "get_us": get_us,
+        })
+    return rows
+
+
+async def bench_history_length(history_lengths: List[int], ops: int = 1000) -> List[Dict[str, Any]]:
+    rows = []
+    for history_length in history_lengths:
+        manager = InMemoryTaskManager()
+        tracemalloc.start()
+        for turn in range(history_length):
+            # Each request is parsed fresh and dropped, as in the server
+            await manager.upsert_task(_params("long-task", turn))
+        bytes_per_message = tracemalloc.get_traced_memory()[0] / history_length
+        tracemalloc.stop()
+
+        append_us = await _time_per_op(ops, lambda i: manager.upsert_task(_params("long-task", history_length + i)))
+        # Reset to the target length so reads measure exactly `history_length` messages
+        manager.tasks["long-task"].history = manager.tasks["long-task"].history[:history_length]
+        get_full_us = await _time_per_op(ops, lambda i: manager.on_get_task(
+            GetTaskRequest(params=TaskQueryParams(id="long-task"))
+        ))
+        get_last_us = await _time_per_op(ops, lambda i: manager.on_get_task(
+            GetTaskRequest(params=TaskQueryParams(id="long-task", historyLength=1))
+        ))
+        rows.append({
+            "history_length": history_length,
+            "bytes_per_message": round(bytes_per_message, 1),
+            "upsert_append_us": append_us,
+            "get_full_history_us": get_full_us,
+            "get_last_message_us": get_last_us,
+        })
+    return rows
+
+
+async def bench_task_manager(task_counts: List[int], history_lengths: List[int]) -> Dict[str, Any]:
+    return {
+        "by_task_count": await bench_task_count(task_counts),
+        "by_history_length": await bench_history_length(history_lengths),
+    }
@@ -0,0 +1,155 @@
+# =============================================================================
+# benchmarks/harness.py
+# =============================================================================
+# 🎯 Purpose:
+# Shared helpers for the benchmark suite:
+# - Running an A2AServer (or any ASGI app) on a background thread
+# - Driving a coroutine under fixed concurrency and collecting latencies
+# - Summarizing latencies (req/s, p50/p99) into plain dicts
+# - Writing machine-readable results (JSON) tagged with version and commit
+# =============================================================================
+
+import os
+import sys
+import json
+import time
+import socket
+import asyncio
+import platform
+import threading
+import subprocess
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List
+
+import uvicorn
+
+# Root of this version directory (e.g. ".../version_6_aster_agent")
+VERSION_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# -----------------------------------------------------------------------------
+# 📊 Statistics
+# -----------------------------------------------------------------------------
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int = 0) -> Dict[str, Any]:
+    """Turn raw latencies (seconds) into a result dict with millisecond percentiles."""
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "elapsed_s": round(elapsed, 4),
+        "rps": round(count / elapsed, 2) if elapsed > 0 else 0.0,
+        "mean_ms": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+        "p50_ms": round(percentile(ordered, 50) * 1000, 3),
+        "p99_ms": round(percentile(ordered, 99) * 1000, 3),
+        "max_ms": round(ordered[-1] * 1000, 3) if count else 0.0,
+    }
+
+
+# -----------------------------------------------------------------------------
+# 🏋️ Load generator
+# -----------------------------------------------------------------------------
+async def run_load(
+    call: Callable[[int], Awaitable[Any]],
+    total: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    """
+    Run `call(i)` for i in range(total) with at most `concurrency` in flight.
+
+    Returns:
+        The `summarize()` dict for the measured calls.
+    """
+    latencies: List[float] = []
+    errors = 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                await call(i)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+
+# -----------------------------------------------------------------------------
+# 🧵 Background server
+# -----------------------------------------------------------------------------
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class ServerThread:
+    """
+    Runs an ASGI app with uvicorn on a daemon thread.
+
+    Usage:
+        with ServerThread(server.app, port) as url:
+            ...  # send requests to url
+    """
+
+    def __init__(self, app, port: int, host: str = "127.0.0.1"):
+        config = uvicorn.Config(app, host=host, port=port, log_level="warning", access_log=False)
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self.url = f"http://{host}:{port}/"
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        deadline = time.time() + 10
+        while not self._server.started:
+            if time.time() > deadline or not self._thread.is_alive():
+                raise RuntimeError(f"Benchmark server at {self.url} did not start")
+            time.sleep(0.01)
+        return self.url
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+# -----------------------------------------------------------------------------
+# 💾 Results
+# -----------------------------------------------------------------------------
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=VERSION_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def write_results(results: Dict[str, Any], path: str) -> Dict[str, Any]:
+    """Wrap `results` with run metadata and write them as JSON to `path`."""
+    document = {
+        "version": os.path.basename(VERSION_ROOT),
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2)
+    return document
@@ -0,0 +1,75 @@
+# =============================================================================
+# benchmarks/run.py
+# =============================================================================
+# 🎯 Purpose:
+# Entry point for the benchmark suite. Runs every benchmark (or a subset)
+# with stub agents and writes one JSON document with all results.
+#
+#   python -m benchmarks.run
+#   python -m benchmarks.run --only server --total 5000 --concurrency 64
+#   python -m benchmarks.run --only startup --startup-budget-ms 300
+#   python -m benchmarks.run --only registry
+#
+# The output is tagged with the version directory and git commit, so files
+# from different runs (or version_N trees) can be diffed to spot regressions.
+# =============================================================================
+
+import os
+import sys
+import json
+import asyncio
+import logging
+
+import click
+
+from benchmarks.harness import write_results
+from benchmarks.bench_server import bench_server
+from benchmarks.bench_orchestrator import bench_orchestrator
+from benchmarks.bench_task_manager import bench_task_manager
+from benchmarks.bench_startup import bench_startup
+from benchmarks.bench_registry import bench_registry
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), "results", "latest.json")
+SUITES = ["server", "orchestrator", "task_manager", "startup", "registry"]
+
+
+async def _run(only: tuple[str, ...], total: int, concurrency: int, startup_budget_ms: float) -> dict:
+    selected = only or SUITES
+    results = {}
+    if "server" in selected:
+        results["server"] = await bench_server(total, concurrency)
+    if "orchestrator" in selected:
+        results["orchestrator"] = await bench_orchestrator(max(1, total // 4), concurrency)
+    if "task_manager" in selected:
+        results["task_manager"] = await bench_task_manager(
+            task_counts=[100, 1_000, 10_000],
+            history_lengths=[1, 10, 100, 1_000],
+        )
+    if "startup" in selected:
+        results["startup"] = await asyncio.to_thread(bench_startup, budget_ms=startup_budget_ms)
+    if "registry" in selected:
+        results["registry"] = await asyncio.to_thread(bench_registry, agent_count=10_000)
+    return results
+
+
+@click.command()
+@click.option("--only", multiple=True, type=click.Choice(SUITES), help="Run only these suites (repeatable)")
+@click.option("--total", default=2000, help="Requests per HTTP benchmark")
+@click.option("--concurrency", default=32, help="Concurrent in-flight requests")
+@click.option("--output", default=DEFAULT_OUTPUT, help="Where to write the JSON results")
+@click.option("--startup-budget-ms", default=500.0, help="Max median import time per entry point")
+def main(only, total, concurrency, output, startup_budget_ms):
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(_run(only, total, concurrency, startup_budget_ms))
+    document = write_results(results, output)
+    print(json.dumps(document, indent=2))
+    print(f"\n📄 Results written to {output}")
+
+    over_budget = [row["module"] for row in results.get("startup", []) if not row["within_budget"]]
+    if over_budget:
+        print(f"❌ Startup budget ({startup_budget_ms} ms) exceeded by: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+# =============================================================================
+# benchmarks/stub_agents.py
+# =============================================================================
+# 🎯 Purpose:
+# Deterministic stand-ins for CityAgent, WeatherAgent and AsterAgent.
+# They expose the same `invoke()` / `ainvoke()` interface the task managers
+# use, but never call Gemini, so the server stack can be measured on its own.
+# An optional fixed `latency` simulates model time without adding noise.
+# =============================================================================
+
+import asyncio
+import uuid
+from typing import Any, Dict
+
+from models.agent import AgentCard, AgentCapabilities, AgentSkill
+from models.task import Message
+from utilities.a2a.agent_connect import AgentConnector
+
+
+class StubCityAgent:
+    SUPPORTED_CONTENT_TYPES = ["text", "text/plain", "application/json"]
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def invoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        return {
+            "data": [
+                {"city": "Paris", "country": "France", "population": "2M",
+                 "attractions": ["Eiffel Tower", "Louvre Museum"]}
+            ],
+            "desired_representation": "card"
+        }
+
+    async def ainvoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.invoke(query, session_id)
+
+
+class StubWeatherAgent:
+    SUPPORTED_CONTENT_TYPES = ["text", "text/plain", "application/json"]
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+
+    def invoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        return {
+            "data": [
+                {"city": "Seoul", "temp": "22°C", "condition": "Sunny", "tip": "Wear sunglasses!"}
+            ],
+            "desired_representation": "table"
+        }
+
+    async def ainvoke(self, query: str, session_id: str) -> Dict[str, Any]:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return self.invoke(query, session_id)
+
+
+class StubAsterAgent:
+    """
+    Routes by keyword instead of asking the LLM, then delegates through the
+    real AgentConnector, so one request exercises the full multi-hop path.
+    """
+    SUPPORTED_CONTENT_TYPES = ["text", "text/plain"]
+
+    def __init__(self, agent_urls: Dict[str, str], latency: float = 0.0):
+        self.latency = latency
+        self.connectors = {
+            agent_id: AgentConnector(agent_id, url) for agent_id, url in agent_urls.items()
+        }
+
+    async def ainvoke(self, query: str, session_id: str) -> str | Message:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        agent_name = "weather" if "weather" in query.lower() else "city"
+        task = await self.connectors[agent_name].send_task(query, session_id or uuid.uuid4().hex)
+        if task.history and len(task.history) > 1:
+            return task.history[-1]  # Passed through as-is, like AsterAgent's fast route
+        return ""
+
+
+def make_card(name: str, url: str, skill_id: str, tags: list[str]) -> AgentCard:
+    """Build a minimal AgentCard for a stub agent."""
+    return AgentCard(
+        name=name,
+        description=f"Benchmark stub for {name}",
+        url=url,
+        version="1.0.0",
+        capabilities=AgentCapabilities(),
+        skills=[AgentSkill(id=skill_id, name=skill_id, tags=tags)],
+    )
@@ -0,0 +1,281 @@
+# =============================================================================
+# client/client.py
+# =============================================================================
+# Purpose:
+# This file defines a reusable, asynchronous Python client for interacting
+# with an Agent2Agent (A2A) server.
+#
+# It supports:
+# - Sending tasks and receiving responses
+# - Getting task status or history
+# - Canceling a running task
+# - Sending several requests in one HTTP round trip (JSON-RPC batch)
+# - Retrying transient failures with jittered backoff (see client/retry.py)
+# - Uploading / downloading file content for FileParts, streamed in chunks
+# - (Streaming is not supported in this simplified version)
+# =============================================================================
+
+# -----------------------------------------------------------------------------
+# Imports
+# -----------------------------------------------------------------------------
+
+import os                                   # File paths for blob upload/download
+import json                                 # Used to encode/decode JSON data
+import hashlib                              # Verifying downloaded blobs against their digest
+import asyncio                              # Sleeping between retries
+import logging                              # Reporting retries
+from urllib.parse import urljoin, urlparse  # Blob endpoint URL; short target label for retry metrics
+from uuid import uuid4                      # Used to generate unique request IDs
+import httpx                                # Async HTTP client for making web requests
+from typing import Any, AsyncIterator       # Type hints for flexible input/output
+
+# Import supported request types
+from models.request import SendTaskRequest, GetTaskRequest, CancelTaskRequest
+
+# Base request format for JSON-RPC 2.0
+from models.json_rpc import JSONRPCRequest
+
+# Models for task results and agent identity
+from models.task import FileContent, FilePart, Task, TaskSendParams
+from models.agent import AgentCard
+
+# Trace context propagation (traceparent in params.metadata)
+from utilities.tracing import tracer
+
+# Which failures are retried, backoff, and the retry budget
+from client.retry import RetryPolicy, client_retries
+from utilities.budget import TokenBudget
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# Custom Error Classes
+# -----------------------------------------------------------------------------
+
+class A2AClientHTTPError(Exception):
+    """Raised when an HTTP request fails (e.g., bad server response); args[0] is the status code"""
+    retry_after: float | None = None  # Seconds from the response's Retry-After header, if any
+
+class A2AClientJSONError(Exception):
+    """Raised when the response is not valid JSON"""
+    pass
+
+
+# -----------------------------------------------------------------------------
+# A2AClient: Main interface for talking to an A2A agent
+# -----------------------------------------------------------------------------
+
+class A2AClient:
+    def __init__(self, agent_card: AgentCard = None, url: str = None, retry: RetryPolicy = None,
+                 blob_token: str = None):
+        """
+        Initializes the client using either an agent card or a direct URL.
+        One of the two must be provided.
+
+        `retry` decides which failures are retried (default: RetryPolicy();
+        pass client.retry.NO_RETRY to disable retries).
+        `blob_token` is sent with blob uploads, for servers that require one
+        (defaults to the A2A_BLOB_TOKEN environment variable).
+        """
+        if agent_card:
+            self.url = agent_card.url
+        elif url:
+            self.url = url
+        else:
+            raise ValueError("Must provide either agent_card or url")
+        self.retry = retry or RetryPolicy()
+        self.blob_token = blob_token or os.getenv("A2A_BLOB_TOKEN")
+        self._retry_budget = TokenBudget(self.retry.budget, self.retry.burst)
+        self._target = urlparse(self.url).netloc or self.url
+
+    # -------------------------------------------------------------------------
+    # send_task: Send a new task to the agent
+    # -------------------------------------------------------------------------
+    async def send_task(self, payload: dict[str, Any]) -> Task:
+        # Retries resend this exact request: the task ID lets the server spot the duplicate
+        request = SendTaskRequest(
+            id=uuid4().hex,
+            params=TaskSendParams(**payload)
+        )
+        response = await self._send_request(request)
+        return Task(**response["result"])
+
+    # -------------------------------------------------------------------------
+    # get_task: Retrieve the status or history of a previously sent task
+    # -------------------------------------------------------------------------
+    async def get_task(self, payload: dict[str, Any]) -> Task:
+        request = GetTaskRequest(params=payload)
+        response = await self._send_request(request)
+        return Task(**response["result"])
+
+    # -------------------------------------------------------------------------
+    # cancel_task: Ask the agent to stop a running task
+    # -------------------------------------------------------------------------
+    async def cancel_task(self, payload: dict[str, Any]) -> Task:
+        request = CancelTaskRequest(params=payload)
+        response = await self._send_request(request)
+        return Task(**response["result"])
+
+    # -------------------------------------------------------------------------
+    # send_batch: Send several JSON-RPC requests in a single POST
+    # -------------------------------------------------------------------------
+    async def send_batch(self, requests: list[JSONRPCRequest]) -> list[dict[str, Any]]:
+        """
+        Send a JSON-RPC 2.0 batch (e.g. many GetTaskRequests for status polling).
+
+        Returns:
+            The raw response dicts, in the same order as `requests`.
+            Each entry has either a "result" or an "error".
+        """
+        with tracer.span("A2AClient.send_batch", url=self.url, size=len(requests)):
+            responses = await self._post([tracer.inject(request.model_dump()) for request in requests])
+        if not isinstance(responses, list):
+            # A single (non-batch) reply means the server rejected the whole batch
+            raise A2AClientHTTPError(400, str(responses.get("error")))
+        by_id = {response.get("id"): response for response in responses}
+        return [by_id.get(request.id) for request in requests]
+
+    # -------------------------------------------------------------------------
+    # upload_blob / download_blob: File content outside of the JSON messages
+    # -------------------------------------------------------------------------
+    async def upload_blob(
+        self,
+        source: bytes | str | os.PathLike,
+        mime_type: str | None = None,
+        name: str | None = None,
+    ) -> FilePart:
+        """
+        Upload file content to the agent's blob store and return a FilePart
+        referencing it, ready to put into a message.
+
+        Args:
+            source: The content (bytes) or the path of a file to upload; files
+                are streamed in chunks, never read into memory whole
+            mime_type: e.g. "image/png"
+            name: File name to show the receiver (default: the path's base name)
+        """
+        if isinstance(source, bytes):
+            content = source
+        else:
+            name = name or os.path.basename(source)
+            content = _read_chunks(source)
+        headers = {"Authorization": f"Bearer {self.blob_token}"} if self.blob_token else None
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.post(urljoin(self.url, "/blobs"), content=content, headers=headers, timeout=300)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+        blob = response.json()
+        return FilePart(file=FileContent(name=name, mimeType=mime_type, uri=blob["uri"], size=blob["size"]))
+
+    async def download_blob(self, file: FilePart | str, path: str | os.PathLike | None = None) -> bytes | str:
+        """
+        Download the content a FilePart (or a blob URI) refers to.
+
+        Args:
+            file: The FilePart, or its file.uri
+            path: Stream the content into this file instead of returning it
+                (written to a temp file first; `path` only appears once the
+                content is complete and verified)
+
+        Returns:
+            The content, or `path` when given. Content from a blob store is
+            checked against the SHA-256 in its URI.
+        """
+        uri = file if isinstance(file, str) else file.file.uri
+        if uri is None:
+            raise ValueError("FilePart has no uri (inline content is in file.bytes)")
+        digest = uri.rstrip("/").rsplit("/", 1)[-1]
+        sha256, chunks = hashlib.sha256(), []
+        tmp_path = f"{os.fspath(path)}.{uuid4().hex}.part" if path is not None else None
+        try:
+            async with httpx.AsyncClient() as client:
+                async with client.stream("GET", uri, timeout=300) as response:
+                    try:
+                        response.raise_for_status()
+                    except httpx.HTTPStatusError as e:
+                        raise A2AClientHTTPError(e.response.status_code, str(e)) from e
+                    out = open(tmp_path, "wb") if tmp_path is not None else None
+                    try:
+                        async for chunk in response.aiter_bytes():
+                            sha256.update(chunk)
+                            if out is not None:
+                                await asyncio.to_thread(out.write, chunk)
+                            else:
+                                chunks.append(chunk)
+                    finally:
+                        if out is not None:
+                            out.close()
+            if "/blobs/" in uri and sha256.hexdigest() != digest:
+                raise A2AClientHTTPError(502, f"Blob {uri} failed its SHA-256 check")
+            if tmp_path is not None:
+                os.replace(tmp_path, path)
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)  # Failed or cancelled: leave no partial file behind
+        return os.fspath(path) if path is not None else b"".join(chunks)
+
+    # -------------------------------------------------------------------------
+    # _send_request: Internal helper to send a JSON-RPC request
+    # -------------------------------------------------------------------------
+    async def _send_request(self, request: JSONRPCRequest) -> dict[str, Any]:
+        with tracer.span("A2AClient._send_request", url=self.url, method=request.method):
+            body = tracer.inject(request.model_dump())  # Convert Pydantic model to JSON (+ trace context)
+            return await self._post(body)
+
+    async def _post(self, body: Any) -> Any:
+        """POST `body`, retrying transient failures as the retry policy allows."""
+        self._retry_budget.earn()
+        attempt = 1
+        while True:
+            try:
+                return await self._post_once(body)
+            except (A2AClientHTTPError, *self.retry.exceptions) as e:
+                status = e.args[0] if isinstance(e, A2AClientHTTPError) else None
+                if attempt >= self.retry.max_attempts or not self.retry.retryable(e, status):
+                    raise
+                if not self._retry_budget.spend():
+                    client_retries.labels(target=self._target, outcome="over_budget").inc()
+                    raise
+                delay = self.retry.backoff(attempt, e.retry_after if status is not None else None)
+                client_retries.labels(target=self._target, outcome="retried").inc()
+                logger.info(f"A2AClient: retrying {self.url} in {delay:.2f}s (attempt {attempt + 1}): {e!r}")
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _post_once(self, body: Any) -> Any:
+        async with httpx.AsyncClient() as client:
+            try:
+                response = await client.post(
+                    self.url,
+                    json=body,
+                    timeout=30
+                )
+                response.raise_for_status()     # Raise error if status code is 4xx/5xx
+                return response.json()          # Return parsed response as a dict
+
+            except httpx.HTTPStatusError as e:
+                error = A2AClientHTTPError(e.response.status_code, str(e))
+                error.retry_after = _retry_after(e.response)
+                raise error from e
+
+            except json.JSONDecodeError as e:
+                raise A2AClientJSONError(str(e)) from e
+
+
+async def _read_chunks(path: str | os.PathLike, chunk_size: int = 1024 * 1024) -> AsyncIterator[bytes]:
+    """Read a file in chunks off the event loop (httpx streams an async iterable body)."""
+    with open(path, "rb") as f:
+        while chunk := await asyncio.to_thread(f.read, chunk_size):
+            yield chunk
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (the delay form only), if present."""
+    value = response.headers.get("retry-after")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None  # HTTP-date form: fall back to the policy's backoff
@@ -0,0 +1,62 @@
+# =============================================================================
+# client/retry.py
+# =============================================================================
+# Purpose:
+# Retry policy for A2AClient, so a transient failure of a remote agent
+# (a 502 while it restarts, a reset connection) doesn't fail the whole
+# orchestration.
+#
+# It provides:
+# - RetryPolicy: which failures are retried (HTTP statuses, exception
+#   classes), how many attempts, and the backoff between them
+# - Retries are capped at a share of all requests by a TokenBudget
+#   (utilities/budget.py), so a dead agent doesn't get hit with every
+#   request several times over
+# - Metric: a2a_client_retries_total{target, outcome}
+#
+# Every A2A method is safe to retry: tasks/get and tasks/cancel are
+# idempotent, and a retried tasks/send carries the same task ID, which the
+# server uses to recognize the duplicate (see InMemoryTaskManager).
+# =============================================================================
+
+import random
+from dataclasses import dataclass
+from typing import Tuple, Type
+
+import httpx
+
+from utilities.metrics import Counter
+
+client_retries = Counter(
+    "a2a_client_retries_total", "A2A client requests retried, or not retried for lack of budget",
+    ["target", "outcome"],
+)
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 3                           # Including the first try (1 disables retries)
+    base_delay: float = 0.1                         # Backoff before the first retry, in seconds
+    max_delay: float = 2.0                          # Upper bound of any single backoff
+    statuses: Tuple[int, ...] = (429, 502, 503, 504)  # HTTP statuses worth retrying
+    exceptions: Tuple[Type[BaseException], ...] = (httpx.TransportError,)  # Connect errors, resets, timeouts
+    budget: float = 0.2                             # Retries allowed per request, on average
+    burst: float = 10.0                             # Retries available at once (and at start)
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """
+        Seconds to wait before retry number `attempt` (1-based): "full jitter",
+        uniform in [0, base_delay * 2^(attempt-1)], capped at max_delay. A
+        server-provided Retry-After wins (also capped).
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def retryable(self, error: BaseException, status: int | None = None) -> bool:
+        if status is not None:
+            return status in self.statuses
+        return isinstance(error, self.exceptions)
+
+
+NO_RETRY = RetryPolicy(max_attempts=1)
@@ -69,6 +69,13 @@ class AgentSkill(BaseModel):
     # Optional list of supported output modes (e.g., ["text", "image"])
     outputModes: List[str] | None = None
 
+    # Optional caching hint for callers: results of this skill for the same input
+    # may be reused for this many seconds (None = do not cache)
+    cacheTtl: float | None = None
+
+    # Where a cached result may be reused: "session" (same conversation) or "global"
+    cacheScope: str | None = None
+
 # -----------------------------------------------------------------------------
 # AgentCard
 # -----------------------------------------------------------------------------
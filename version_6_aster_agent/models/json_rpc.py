@@ -14,6 +14,8 @@
 # - JSONRPCResponse: The reply to a request (either result or error)
 # - JSONRPCError: The structure of an error response
 # - InternalError: A predefined standard error for unexpected failures
+# - InvalidRequestError: A predefined standard error for malformed requests
+# - TaskNotFoundError / TaskNotCancelableError: A2A-specific task errors
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -95,3 +97,51 @@ class InternalError(JSONRPCError):
 
     # Optional debug details (e.g., traceback or context info)
     data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# InvalidRequestError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# A predefined error for payloads that are not a valid request (or batch).
+# This follows the JSON-RPC standard error code for invalid requests (-32600).
+class InvalidRequestError(JSONRPCError):
+    # Fixed error code for invalid requests
+    code: int = -32600
+
+    # Default error message
+    message: str = "Invalid Request"
+
+    # Optional debug details
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# TaskNotFoundError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned when a client asks about a task ID the agent does not know.
+# Uses the A2A-specific error code -32001.
+class TaskNotFoundError(JSONRPCError):
+    # Fixed error code for unknown task IDs
+    code: int = -32001
+
+    # Default error message
+    message: str = "Task not found"
+
+    # Optional debug details
+    data: Any | None = None
+
+
+# -----------------------------------------------------------------------------
+# TaskNotCancelableError (subclass of JSONRPCError)
+# -----------------------------------------------------------------------------
+# Returned when a client tries to cancel a task that has already finished.
+# Uses the A2A-specific error code -32002.
+class TaskNotCancelableError(JSONRPCError):
+    # Fixed error code for tasks that can no longer be canceled
+    code: int = -32002
+
+    # Default error message
+    message: str = "Task cannot be canceled"
+
+    # Optional debug details
+    data: Any | None = None
@@ -14,11 +14,13 @@
 # Included Models:
 # - SendTaskRequest
 # - GetTaskRequest
+# - CancelTaskRequest
+# - SetTaskPushNotificationRequest / GetTaskPushNotificationRequest
 # - A2ARequest (discriminated union)
 # - SendTaskResponse
 # - GetTaskResponse
-#
-# Note: CancelTaskRequest will be added in a future version if cancellation support is implemented.
+# - CancelTaskResponse
+# - SetTaskPushNotificationResponse / GetTaskPushNotificationResponse
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -34,7 +36,8 @@ from models.json_rpc import JSONRPCRequest, JSONRPCResponse
 
 # Task-related parameter and return models
 from models.task import Task, TaskSendParams
-from models.task import TaskQueryParams
+from models.task import TaskQueryParams, TaskIdParams
+from models.task import TaskPushNotificationConfig
 
 
 # -----------------------------------------------------------------------------
@@ -55,6 +58,33 @@ class GetTaskRequest(JSONRPCRequest):
     params: TaskQueryParams                         # Task ID and optional history limit
 
 
+# -----------------------------------------------------------------------------
+# CancelTaskRequest: Used to stop a running task
+# -----------------------------------------------------------------------------
+
+class CancelTaskRequest(JSONRPCRequest):
+    method: Literal["tasks/cancel"] = "tasks/cancel"  # Exact method string required
+    params: TaskIdParams                              # ID of the task to cancel
+
+
+# -----------------------------------------------------------------------------
+# SetTaskPushNotificationRequest: Register a webhook for a task's updates
+# -----------------------------------------------------------------------------
+
+class SetTaskPushNotificationRequest(JSONRPCRequest):
+    method: Literal["tasks/pushNotification/set"] = "tasks/pushNotification/set"
+    params: TaskPushNotificationConfig              # Task ID and webhook settings
+
+
+# -----------------------------------------------------------------------------
+# GetTaskPushNotificationRequest: Read back a task's webhook settings
+# -----------------------------------------------------------------------------
+
+class GetTaskPushNotificationRequest(JSONRPCRequest):
+    method: Literal["tasks/pushNotification/get"] = "tasks/pushNotification/get"
+    params: TaskIdParams                            # Task ID
+
+
 # -----------------------------------------------------------------------------
 # A2ARequest: Discriminated union of supported request types
 # -----------------------------------------------------------------------------
@@ -65,7 +95,9 @@ A2ARequest = TypeAdapter(
         Union[
             SendTaskRequest,
             GetTaskRequest,
-            # CancelTaskRequest can be added here in future if implemented
+            CancelTaskRequest,
+            SetTaskPushNotificationRequest,
+            GetTaskPushNotificationRequest,
         ],
         Field(discriminator="method")
     ]
@@ -86,3 +118,23 @@ class SendTaskResponse(JSONRPCResponse):
 
 class GetTaskResponse(JSONRPCResponse):
     result: Task | None = None                      # The requested task, or None if not found
+
+
+# -----------------------------------------------------------------------------
+# CancelTaskResponse: Response model for a "tasks/cancel" request
+# -----------------------------------------------------------------------------
+
+class CancelTaskResponse(JSONRPCResponse):
+    result: Task | None = None                      # The task in its final (canceled) state
+
+
+# -----------------------------------------------------------------------------
+# SetTaskPushNotificationResponse / GetTaskPushNotificationResponse
+# -----------------------------------------------------------------------------
+
+class SetTaskPushNotificationResponse(JSONRPCResponse):
+    result: TaskPushNotificationConfig | None = None  # The stored webhook settings
+
+
+class GetTaskPushNotificationResponse(JSONRPCResponse):
+    result: TaskPushNotificationConfig | None = None  # The stored webhook settings, or None if not set
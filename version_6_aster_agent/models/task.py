@@ -7,32 +7,69 @@
 # These models represent:
 # - What a task looks like (`Task`)
 # - The state of the task (`TaskStatus`, `TaskState`)
-# - The messages exchanged during a task (`Message`, `TextPart`)
+# - The messages exchanged during a task (`Message`, `TextPart`, `FilePart`, `DataPart`)
 # - Parameters used when sending, querying, or canceling tasks
+# - Push notification (webhook) settings for a task
+# - A compact in-memory form of tasks (`StoredTask`, `StoredMessage`) that
+#   task managers keep, converted to the Pydantic models only for responses
 # =============================================================================
 
 # -----------------------------------------------------------------------------
 # Imports
 # -----------------------------------------------------------------------------
 
+import sys                                     # sys.intern() shares one copy of repeated role strings
+import json                                    # Unambiguous encoding of a message for hashing
+import hashlib                                 # Message digests (idempotency keys for tasks/send)
+import time                                    # Cheap float timestamps for stored tasks
 from enum import Enum                          # Used to create fixed-value constants (e.g. task states)
+from dataclasses import dataclass              # Slotted containers for stored history
 from uuid import uuid4                         # For generating unique identifiers
 from pydantic import BaseModel, Field          # Pydantic for structured data validation
-from typing import Any, Literal, List          # Type hints for flexibility and structure
+from pydantic import field_validator           # Checks webhook URLs when they are registered
+from pydantic import TypeAdapter               # Validates a whole stored history in one call
+from typing import Annotated, Any, Literal, List, Tuple, Union  # Type hints for flexibility and structure
 from datetime import datetime                  # To store timestamps
 
+import httpx                                   # Parses webhook URLs exactly as the push sender will
+
 
 # -----------------------------------------------------------------------------
-# Message Part: Currently only text is supported
+# Message Parts: text, files and structured data
 # -----------------------------------------------------------------------------
 
-# Represents one part of a message, currently only plain text is allowed
+# Plain text
 class TextPart(BaseModel):
     type: Literal["text"] = "text"  # Fixed value field to identify this as a "text" type
     text: str                       # The actual text content (e.g., "What time is it?")
 
-# Alias: For now, "Part" is the same as TextPart (used for easier refactoring in the future)
-Part = TextPart
+
+# A file, normally by reference: upload the content to the agent's blob store
+# (POST /blobs, see A2AClient.upload_blob) and send the returned "uri".
+# Inline base64 "bytes" are accepted for small files only.
+class FileContent(BaseModel):
+    name: str | None = None                # Original file name (e.g. "seoul.png")
+    mimeType: str | None = None            # e.g. "image/png"
+    uri: str | None = None                 # Where to download the content (e.g. ".../blobs/<sha256>")
+    size: int | None = None                # Content length in bytes
+    bytes: str | None = None               # Base64 content (small files only; prefer "uri")
+
+
+class FilePart(BaseModel):
+    type: Literal["file"] = "file"
+    file: FileContent
+
+
+# Structured data (e.g. a domain agent's {"data": [...], "desired_representation": ...}),
+# passed on as-is; representation/text.py turns it into text only when needed
+class DataPart(BaseModel):
+    type: Literal["data"] = "data"
+    data: dict[str, Any]
+    metadata: dict[str, Any] | None = None  # e.g. {"schema": "city"}: picks the text formatter
+
+
+# One part of a message; the "type" field decides which model validates it
+Part = Annotated[Union[TextPart, FilePart, DataPart], Field(discriminator="type")]
 
 # 예시: metadata에 UTG 정보 포함
 # payload["metadata"] = {
@@ -53,7 +90,11 @@ Part = TextPart
 # A message in the context of a task, either from the user or the agent
 class Message(BaseModel):
     role: Literal["user", "agent"]  # Who sent the message: "user" or "agent"
-    parts: List[Part]               # Messages can have multiple parts (e.g., multiple lines of text)
+    parts: List[Part]               # Messages can have multiple parts (e.g., text plus a file)
+
+    def text(self) -> str:
+        """The text parts joined by newlines (file and data parts are skipped)."""
+        return "\n".join(part.text for part in self.parts if part.type == "text")
 
 
 # -----------------------------------------------------------------------------
@@ -93,6 +134,31 @@ class TaskQueryParams(TaskIdParams):
     historyLength: int | None = None       # Limit the number of messages returned in the task's history
 
 
+# Where (and how) the agent should POST task status updates for a task
+class PushNotificationConfig(BaseModel):
+    url: str                               # Webhook URL provided by the client
+    token: str | None = None               # Optional token echoed back so the receiver can verify the sender
+
+    @field_validator("url")
+    @classmethod
+    def _check_url(cls, url: str) -> str:
+        # Rejected at registration: the delivery worker could never POST to it
+        try:
+            parsed = httpx.URL(url)
+        except Exception as e:
+            raise ValueError(f"Invalid webhook URL {url!r}: {e}") from e
+        if parsed.scheme not in ("http", "https") or not parsed.host:
+            raise ValueError(f"Webhook URL must be an absolute http(s) URL: {url!r}")
+        return url
+
+
+# Binds a push notification config to a specific task
+# (used by "tasks/pushNotification/set" and "tasks/pushNotification/get")
+class TaskPushNotificationConfig(BaseModel):
+    id: str                                        # The task ID
+    pushNotificationConfig: PushNotificationConfig # Webhook settings for this task
+
+
 # Parameters required to send a new task to an agent
 class TaskSendParams(BaseModel):
     id: str                                # Task ID (usually generated client-side)
@@ -104,6 +170,13 @@ class TaskSendParams(BaseModel):
     historyLength: int | None = None       # Optional history length to return
     metadata: dict[str, Any] | None = None # Optional extra info (e.g., user role, priority)
 
+    # Optional webhook to notify on every status change of this task
+    pushNotification: PushNotificationConfig | None = None
+
+    # If False, the server returns immediately with the task in "submitted" state
+    # and runs the agent in the background; poll "tasks/get" for progress.
+    blocking: bool = True
+
 
 # -----------------------------------------------------------------------------
 # TaskState: Enum for predefined task lifecycle states
@@ -117,4 +190,73 @@ class TaskState(str, Enum):
     COMPLETED = "completed"             # Task is done
     CANCELED = "canceled"               # Task was canceled by user or system
     FAILED = "failed"                   # Something went wrong
-    UNKNOWN = "unknown"                 # Fallback for undefined or unrecognized states
\ No newline at end of file
+    UNKNOWN = "unknown"                 # Fallback for undefined or unrecognized states
+
+
+# -----------------------------------------------------------------------------
+# StoredMessage / StoredTask: Compact in-memory representation
+# -----------------------------------------------------------------------------
+# Task managers keep these instead of Pydantic models: a slotted dataclass per
+# message with an interned role and a tuple of parts (a str per text part, a
+# plain dict per file / data part), and a float
+# timestamp instead of a datetime. They become `Task` / `Message` only when a
+# response is built, through one call of a shared TypeAdapter for the
+# requested messages (only the tail when historyLength is given). No Message
+# objects are kept between responses, so a task never holds both forms.
+
+@dataclass(slots=True)
+class StoredMessage:
+    role: str                   # Interned "user" / "agent"
+    parts: Tuple[str | dict, ...]  # Text of each TextPart, or the dumped FilePart / DataPart, in order
+
+    @classmethod
+    def from_message(cls, message: Message) -> "StoredMessage":
+        return cls(sys.intern(message.role), tuple(
+            part.text if part.type == "text" else part.model_dump(exclude_none=True) for part in message.parts
+        ))
+
+    def to_dict(self) -> dict:
+        return {"role": self.role, "parts": [
+            {"type": "text", "text": part} if isinstance(part, str) else part for part in self.parts
+        ]}
+
+    def digest(self) -> bytes:
+        """16-byte hash of the message content; equal messages have equal digests."""
+        content = json.dumps([self.role, self.parts], sort_keys=True, default=str)
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+
+
+# Built once; reused for every stored history → List[Message] conversion
+_HISTORY_ADAPTER = TypeAdapter(List[Message])
+
+
+@dataclass(slots=True)
+class StoredTask:
+    id: str
+    state: str                  # A TaskState value
+    timestamp: float            # time.time() of the last status change
+    history: List[StoredMessage]
+
+    @classmethod
+    def create(cls, task_id: str, message: Message) -> "StoredTask":
+        """A new task in SUBMITTED state, starting with the user's message."""
+        return cls(task_id, TaskState.SUBMITTED.value, time.time(), [StoredMessage.from_message(message)])
+
+    def set_state(self, state: "TaskState") -> None:
+        self.state = TaskState(state).value
+        self.timestamp = time.time()
+
+    def to_status(self) -> TaskStatus:
+        return TaskStatus(state=self.state, timestamp=datetime.fromtimestamp(self.timestamp))
+
+    def to_task(self, history_length: int | None = None) -> Task:
+        """
+        Build the API `Task`, optionally with only the last `history_length` messages.
+        The result is a snapshot: later changes to this StoredTask don't affect it.
+        """
+        if history_length is None:
+            stored = self.history
+        else:
+            stored = self.history[-history_length:] if history_length > 0 else []
+        history = _HISTORY_ADAPTER.validate_python([message.to_dict() for message in stored])
+        return Task.model_construct(id=self.id, status=self.to_status(), history=history)
@@ -0,0 +1,95 @@
+# =============================================================================
+# representation/text.py
+# =============================================================================
+# 🎯 Purpose:
+# Turns message parts into text, only when a text consumer asks for it.
+# Domain agents answer with a DataPart carrying their raw payload
+# ({"data": [...], "desired_representation": ...}); nothing is formatted
+# on their side.
+#
+# ✅ Includes:
+# - to_text(message): human-readable text (DataParts through the formatter
+#   named by metadata["schema"], e.g. the emoji city / weather blocks)
+# - to_llm_text(message): compact JSON for DataParts, so an orchestrating LLM
+#   reads the structured payload itself instead of prose about it
+#
+# AsterTaskManager calls to_text() for replies it passes through to the
+# user, so text clients get the formatted answer next to the DataPart.
+# =============================================================================
+
+import json
+from typing import Any, Callable, Dict
+
+from models.task import DataPart, FilePart, Message
+
+
+# -----------------------------------------------------------------------------
+# 🏙️ Domain formatters: payload dict → display text
+# -----------------------------------------------------------------------------
+def format_city_data(payload: Dict[str, Any]) -> str:
+    if not payload.get("data"):
+        return "No city information found."
+    result = []
+    for city in payload["data"]:
+        city_info = [
+            f"🏙️ {city['city']}, {city['country']}",
+            f"👥 Population: {city['population']}"
+        ]
+        if "attractions" in city:
+            city_info.append(f"🎯 Attractions: {', '.join(city['attractions'])}")
+        result.append("\n".join(city_info))
+    return "\n\n".join(result)
+
+
+def format_weather_data(payload: Dict[str, Any]) -> str:
+    if not payload.get("data"):
+        return "No weather information found."
+    result = []
+    for weather in payload["data"]:
+        info = [
+            f"🌆 {weather['city']}",
+            f"🌡️ Temp: {weather['temp']}",
+            f"🌤️ Condition: {weather['condition']}"
+        ]
+        if "tip" in weather:
+            info.append(f"💡 Tip: {weather['tip']}")
+        result.append("\n".join(info))
+    return "\n\n".join(result)
+
+
+_FORMATTERS: Dict[str, Callable[[Dict[str, Any]], str]] = {
+    "city": format_city_data,
+    "weather": format_weather_data,
+}
+
+
+def compact_json(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+# -----------------------------------------------------------------------------
+# 📝 Message → text
+# -----------------------------------------------------------------------------
+def to_text(message: Message | None) -> str:
+    """Display text of a message; DataParts without a known schema become compact JSON."""
+    if message is None:
+        return ""
+    return "\n\n".join(_part_text(part, for_llm=False) for part in message.parts)
+
+
+def to_llm_text(message: Message | None) -> str:
+    """Text for an LLM: text parts as-is, DataParts as compact JSON (no formatting)."""
+    if message is None:
+        return ""
+    return "\n".join(_part_text(part, for_llm=True) for part in message.parts)
+
+
+def _part_text(part, for_llm: bool) -> str:
+    if isinstance(part, DataPart):
+        schema = (part.metadata or {}).get("schema")
+        formatter = None if for_llm else _FORMATTERS.get(schema)
+        return formatter(part.data) if formatter else compact_json(part.data)
+    if isinstance(part, FilePart):
+        file = part.file
+        return f"[file {file.name or ''} ({file.mimeType or 'unknown type'}): {file.uri or 'inline'}]"
+    return part.text
@@ -0,0 +1,201 @@
+# =============================================================================
+# server/blob_store.py
+# =============================================================================
+# 🎯 Purpose:
+# Holds the content of file parts (images, datasets, large texts) outside of
+# the JSON-RPC messages, so a message only carries a small reference
+# (FilePart.file.uri) instead of inline base64.
+#
+# ✅ Includes:
+# - Content-addressed storage on local disk: a blob's name is the SHA-256 of
+#   its content, so the same file uploaded twice is stored once
+# - Streaming writes: chunks are hashed and written to a temp file as they
+#   arrive, then renamed into place (no full copy in memory, no half files)
+# - mmap reads: downloads are served in chunks straight from the page cache
+# - A store-wide quota (max_total_bytes): the least recently stored or
+#   downloaded blobs are evicted to make room; an upload that can't fit
+#   even in an empty store is rejected
+# =============================================================================
+
+import os
+import re
+import mmap
+import hashlib
+import logging
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AsyncIterable, Iterator
+from uuid import uuid4
+
+logger = logging.getLogger(__name__)
+
+_DIGEST = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobTooLargeError(Exception):
+    """Raised when an upload exceeds BlobStore.max_bytes (or the whole store's quota)"""
+    pass
+
+
+@dataclass(frozen=True, slots=True)
+class BlobInfo:
+    digest: str     # Hex SHA-256 of the content
+    size: int       # Content length in bytes
+
+
+# -----------------------------------------------------------------------------
+# 🗄️ BlobStore
+# -----------------------------------------------------------------------------
+class BlobStore:
+    """
+    📦 Content-addressed blob storage in one directory.
+
+    Attributes:
+        root (str): Directory holding the blobs (two-character subdirectories
+            by digest prefix, so no directory gets too large).
+        max_bytes (int): Largest accepted blob.
+        max_total_bytes (int): Quota for all blobs together (LRU eviction beyond it).
+        read_chunk_size (int): Bytes per chunk when streaming a blob out.
+    """
+
+    def __init__(
+        self,
+        root: str | None = None,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_total_bytes: int = 2 * 1024 * 1024 * 1024,
+        read_chunk_size: int = 1024 * 1024,
+    ):
+        self.root = root or os.path.join(tempfile.gettempdir(), "a2a_blobs")
+        self.max_bytes = min(max_bytes, max_total_bytes)
+        self.max_total_bytes = max_total_bytes
+        self.read_chunk_size = read_chunk_size
+        os.makedirs(os.path.join(self.root, "tmp"), exist_ok=True)
+        self._sizes: "OrderedDict[str, int]" = OrderedDict()  # digest -> size, least recently used first
+        self.total_bytes = 0
+        self._load()
+
+    def _load(self) -> None:
+        """Index blobs left by an earlier run (oldest first) and enforce the quota."""
+        found = []
+        for prefix in os.listdir(self.root):
+            directory = os.path.join(self.root, prefix)
+            if len(prefix) != 2 or not os.path.isdir(directory):
+                continue
+            for digest in os.listdir(directory):
+                if _DIGEST.match(digest):
+                    stat = os.stat(os.path.join(directory, digest))
+                    found.append((stat.st_mtime, digest, stat.st_size))
+        for _, digest, size in sorted(found):
+            self._sizes[digest] = size
+            self.total_bytes += size
+        self._evict(0)
+
+    def path(self, digest: str) -> str:
+        """File path of a blob; ValueError if `digest` is not a hex SHA-256."""
+        if not _DIGEST.match(digest):
+            raise ValueError(f"Invalid blob digest: {digest!r}")
+        return os.path.join(self.root, digest[:2], digest)
+
+    def size(self, digest: str) -> int | None:
+        """Content length of a stored blob, or None if it doesn't exist."""
+        self.path(digest)  # Validates the digest
+        return self._sizes.get(digest)
+
+    def touch(self, digest: str) -> None:
+        """Mark a blob as recently used (e.g. downloaded), so it is evicted last."""
+        if digest in self._sizes:
+            self._sizes.move_to_end(digest)
+
+    # -------------------------------------------------------------------------
+    # ⬆️ Writing
+    # -------------------------------------------------------------------------
+    async def put_stream(self, chunks: AsyncIterable[bytes], expected_size: int | None = None) -> BlobInfo:
+        """
+        Store the content of an async byte stream (e.g. request.stream()).
+
+        Args:
+            chunks: The content, in chunks of any size
+            expected_size: Content-Length, if known; rejected early when too large
+
+        Returns:
+            BlobInfo of the stored content
+
+        Raises:
+            BlobTooLargeError: The content is larger than max_bytes
+        """
+        if expected_size is not None and expected_size > self.max_bytes:
+            raise BlobTooLargeError(f"Blob of {expected_size} bytes exceeds the {self.max_bytes} byte limit")
+        tmp_path = os.path.join(self.root, "tmp", uuid4().hex)
+        sha256, size = hashlib.sha256(), 0
+        try:
+            with open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if size > self.max_bytes:
+                        raise BlobTooLargeError(f"Blob exceeds the {self.max_bytes} byte limit")
+                    sha256.update(chunk)
+                    f.write(chunk)  # Lands in the page cache; no per-chunk thread hop
+            return self._commit(tmp_path, sha256.hexdigest(), size)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def put_bytes(self, data: bytes) -> BlobInfo:
+        """Store `data` (for content that is already in memory)."""
+        if len(data) > self.max_bytes:
+            raise BlobTooLargeError(f"Blob of {len(data)} bytes exceeds the {self.max_bytes} byte limit")
+        tmp_path = os.path.join(self.root, "tmp", uuid4().hex)
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            return self._commit(tmp_path, hashlib.sha256(data).hexdigest(), len(data))
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _commit(self, tmp_path: str, digest: str, size: int) -> BlobInfo:
+        """Move a fully written temp file to its content address (atomic; no-op if already stored)."""
+        path = self.path(digest)
+        if digest in self._sizes:
+            self._sizes.move_to_end(digest)
+            return BlobInfo(digest, size)
+        self._evict(size)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+        self._sizes[digest] = size
+        self.total_bytes += size
+        logger.info(f"🗄️ Stored blob {digest[:12]}… ({size} bytes)")
+        return BlobInfo(digest, size)
+
+    def _evict(self, incoming: int) -> None:
+        """Remove least recently used blobs until `incoming` more bytes fit in the quota."""
+        while self._sizes and self.total_bytes + incoming > self.max_total_bytes:
+            digest, size = self._sizes.popitem(last=False)
+            self.total_bytes -= size
+            try:
+                os.remove(self.path(digest))  # Downloads already streaming keep their mmap
+            except FileNotFoundError:
+                pass
+            logger.info(f"🗄️ Evicted blob {digest[:12]}… ({size} bytes) to stay within the quota")
+
+    # -------------------------------------------------------------------------
+    # ⬇️ Reading
+    # -------------------------------------------------------------------------
+    def iter_chunks(self, digest: str) -> Iterator[bytes]:
+        """
+        Yield a blob's content in read_chunk_size chunks from an mmap of the
+        file. Blocking (page faults), so iterate it off the event loop -
+        StreamingResponse does that for sync iterators.
+
+        Raises:
+            FileNotFoundError: No blob with this digest
+        """
+        with open(self.path(digest), "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return  # mmap can't map an empty file
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                if hasattr(view, "madvise"):
+                    view.madvise(mmap.MADV_SEQUENTIAL)  # Read ahead aggressively
+                for offset in range(0, len(view), self.read_chunk_size):
+                    yield view[offset:offset + self.read_chunk_size]
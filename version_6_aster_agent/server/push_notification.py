@@ -0,0 +1,238 @@
+# =============================================================================
+# server/push_notification.py
+# =============================================================================
+# 🎯 Purpose:
+# Delivers task status updates to client webhooks ("push notifications"),
+# so callers don't have to poll "tasks/get".
+#
+# ✅ Includes:
+# - An async delivery queue drained in batches by background workers
+# - One pooled httpx client shared by all deliveries (keep-alive connections)
+# - Retries with exponential backoff for failed deliveries
+# - An on-disk spool: every pending delivery is a JSON file, so undelivered
+#   notifications are picked up again after a restart
+# - Deliveries that can never succeed (e.g. a malformed URL in an old spool
+#   file) are moved to spool_dir/dead instead of being retried
+# =============================================================================
+
+import os
+import asyncio
+import logging
+import tempfile
+from typing import Any, Dict, List
+from uuid import uuid4
+
+import httpx
+from pydantic import BaseModel, Field
+
+from models.task import PushNotificationConfig
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# 📦 PushDelivery: One notification waiting to be POSTed
+# -----------------------------------------------------------------------------
+class PushDelivery(BaseModel):
+    id: str = Field(default_factory=lambda: uuid4().hex)  # Spool file name
+    url: str                                              # Webhook URL
+    token: str | None = None                              # Sent back in the X-A2A-Notification-Token header
+    payload: Dict[str, Any]                               # JSON body of the POST
+    attempt: int = 0                                      # Number of failed attempts so far
+
+
+# -----------------------------------------------------------------------------
+# 📣 PushNotificationSender
+# -----------------------------------------------------------------------------
+class PushNotificationSender:
+    """
+    📣 Queues webhook notifications and delivers them in the background.
+
+    Attributes:
+        spool_dir (str): Directory holding one JSON file per pending delivery.
+        batch_size (int): Max deliveries a worker sends concurrently per batch.
+        flush_interval (float): Seconds a worker waits to fill up a batch.
+        max_attempts (int): Attempts before a delivery is dropped.
+        backoff_base (float): First retry delay in seconds (doubled per attempt).
+        backoff_max (float): Upper bound for the retry delay.
+    """
+
+    TOKEN_HEADER = "X-A2A-Notification-Token"
+
+    def __init__(
+        self,
+        spool_dir: str | None = None,
+        batch_size: int = 32,
+        flush_interval: float = 0.05,
+        workers: int = 2,
+        max_attempts: int = 5,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        max_connections: int = 50,
+    ):
+        self.spool_dir = spool_dir or os.path.join(tempfile.gettempdir(), "a2a_push_spool")
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.max_connections = max_connections
+
+        self._queue: asyncio.Queue | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._worker_tasks: List[asyncio.Task] = []
+        self._retry_tasks: set[asyncio.Task] = set()
+
+    # -------------------------------------------------------------------------
+    # ▶️ Lifecycle
+    # -------------------------------------------------------------------------
+    async def start(self) -> None:
+        """Open the HTTP pool, reload spooled deliveries and start the workers (idempotent)."""
+        if self._queue is not None:
+            return
+        os.makedirs(self.spool_dir, exist_ok=True)
+        self._queue = asyncio.Queue()
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+        for delivery in await asyncio.to_thread(self._load_spool):
+            self._queue.put_nowait(delivery)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        logger.info(f"PushNotificationSender started (spool: {self.spool_dir})")
+
+    async def stop(self) -> None:
+        """Stop the workers and close the HTTP pool. Pending deliveries stay in the spool."""
+        if self._queue is None:
+            return
+        for task in [*self._worker_tasks, *self._retry_tasks]:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, *self._retry_tasks, return_exceptions=True)
+        await self._client.aclose()
+        self._worker_tasks = []
+        self._retry_tasks.clear()
+        self._queue = None
+        self._client = None
+
+    # -------------------------------------------------------------------------
+    # 📥 enqueue: Spool a notification and hand it to the workers
+    # -------------------------------------------------------------------------
+    async def enqueue(self, config: PushNotificationConfig, payload: Dict[str, Any]) -> None:
+        """
+        Schedule a POST of `payload` to the webhook in `config`.
+
+        The delivery is written to the spool before it is queued, so it
+        survives a restart even if it has not been sent yet.
+        """
+        await self.start()
+        delivery = PushDelivery(url=config.url, token=config.token, payload=payload)
+        await asyncio.to_thread(self._write_spool, delivery)
+        self._queue.put_nowait(delivery)
+
+    # -------------------------------------------------------------------------
+    # 🔁 Workers: drain the queue in batches and post concurrently
+    # -------------------------------------------------------------------------
+    async def _worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            # One failing delivery must not cancel the rest of the batch or end the worker
+            results = await asyncio.gather(*(self._deliver(d) for d in batch), return_exceptions=True)
+            for delivery, result in zip(batch, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Push notification {delivery.id} to {delivery.url} crashed: {result!r}")
+
+    async def _deliver(self, delivery: PushDelivery) -> None:
+        headers = {self.TOKEN_HEADER: delivery.token} if delivery.token else None
+        try:
+            response = await self._client.post(delivery.url, json=delivery.payload, headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPError as e:
+            await self._retry(delivery, e)
+            return
+        except Exception as e:
+            # Not a network or HTTP failure (e.g. httpx.InvalidURL, an IDNA error): retrying can't help
+            logger.error(f"Push notification to {delivery.url!r} can't be delivered ({e!r}); moved to dead letters")
+            await asyncio.to_thread(self._dead_letter, delivery)
+            return
+        await asyncio.to_thread(self._remove_spool, delivery)
+
+    async def _retry(self, delivery: PushDelivery, error: Exception) -> None:
+        delivery.attempt += 1
+        if delivery.attempt >= self.max_attempts:
+            logger.error(
+                f"Dropping push notification to {delivery.url} after {delivery.attempt} attempts: {error}"
+            )
+            await asyncio.to_thread(self._remove_spool, delivery)
+            return
+        delay = min(self.backoff_base * (2 ** (delivery.attempt - 1)), self.backoff_max)
+        logger.warning(
+            f"Push notification to {delivery.url} failed ({error}); retry {delivery.attempt} in {delay:.1f}s"
+        )
+        await asyncio.to_thread(self._write_spool, delivery)
+        retry = asyncio.create_task(self._requeue_later(delivery, delay))
+        self._retry_tasks.add(retry)
+        retry.add_done_callback(self._retry_tasks.discard)
+
+    async def _requeue_later(self, delivery: PushDelivery, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._queue.put_nowait(delivery)
+
+    # -------------------------------------------------------------------------
+    # 💾 Spool helpers (run in a worker thread)
+    # -------------------------------------------------------------------------
+    def _spool_path(self, delivery: PushDelivery) -> str:
+        return os.path.join(self.spool_dir, f"{delivery.id}.json")
+
+    def _write_spool(self, delivery: PushDelivery) -> None:
+        tmp_path = self._spool_path(delivery) + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(delivery.model_dump_json())
+        os.replace(tmp_path, self._spool_path(delivery))  # Atomic, so a crash never leaves half a file
+
+    def _remove_spool(self, delivery: PushDelivery) -> None:
+        try:
+            os.remove(self._spool_path(delivery))
+        except FileNotFoundError:
+            pass
+
+    def _dead_letter(self, delivery: PushDelivery) -> None:
+        """Move a delivery's spool file to spool_dir/dead, out of the resume path."""
+        dead_dir = os.path.join(self.spool_dir, "dead")
+        os.makedirs(dead_dir, exist_ok=True)
+        try:
+            os.replace(self._spool_path(delivery), os.path.join(dead_dir, f"{delivery.id}.json"))
+        except FileNotFoundError:
+            pass
+
+    def _load_spool(self) -> List[PushDelivery]:
+        deliveries = []
+        for name in sorted(os.listdir(self.spool_dir)):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.spool_dir, name)
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    deliveries.append(PushDelivery.model_validate_json(f.read()))
+            except Exception as e:
+                logger.warning(f"Skipping unreadable spool file {path}: {e}")
+        if deliveries:
+            logger.info(f"Resuming {len(deliveries)} spooled push notifications")
+        return deliveries
@@ -7,8 +7,16 @@
 # - Domain Agent (City)
 # - Domain Agent (Weather)
 # It supports:
-# - Receiving task requests via POST ("/")
+# - Receiving task requests via POST ("/"), single or as a JSON-RPC batch array
+# - Polling task progress via "tasks/get" (for non-blocking "tasks/send")
+# - Stopping running tasks via "tasks/cancel"
+# - Push notifications to client webhooks ("tasks/pushNotification/set")
 # - Letting clients discover agents via GET ("/.well-known/agent.json")
+# - Prometheus metrics via GET ("/metrics")
+# - Out-of-band file content for FileParts: streaming upload via POST
+#   ("/blobs") and download via GET ("/blobs/{digest}"), see server/blob_store.py
+# - Opt-in sampling profiler via GET ("/admin/profile") and opt-in event-loop
+#   lag monitor that logs blocking calls (A2A_LOOP_LAG_THRESHOLD_MS)
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -18,37 +26,52 @@
 # 🌐 Starlette is a lightweight web framework for building ASGI applications
 from starlette.applications import Starlette            
 from starlette.responses import JSONResponse            
+from starlette.responses import PlainTextResponse
+from starlette.responses import StreamingResponse
 from starlette.requests import Request                  
 
 # 📦 Importing our custom models and logic
 from models.agent import AgentCard, AgentCapabilities, AgentSkill
-from models.request import A2ARequest, SendTaskRequest  
-from models.json_rpc import JSONRPCResponse, InternalError  
+from models.request import A2ARequest, SendTaskRequest, GetTaskRequest, CancelTaskRequest
+from models.request import SetTaskPushNotificationRequest, GetTaskPushNotificationRequest
+from models.json_rpc import JSONRPCResponse, InternalError, InvalidRequestError
 from server import task_manager              
-
-# 🤖 Agent imports
-from agents.aster_agent.agent import AsterAgent
-from agents.aster_agent.task_manager import AsterTaskManager
-from agents.domain_agent_city.agent import CityAgent
-from agents.domain_agent_city.task_manager import CityTaskManager
-from agents.domain_agent_weather.agent import WeatherAgent
-from agents.domain_agent_weather.task_manager import WeatherTaskManager
+from server.push_notification import PushNotificationSender
+from server.blob_store import BlobStore, BlobTooLargeError
+from utilities.tracing import tracer
+from utilities import metrics
+from utilities.profiling import SamplingProfiler, EventLoopLagMonitor
 
 # 🛠️ General utilities
+import os
 import json                                              
+import asyncio
 import logging                                           
+import time
+import tempfile
+import contextlib
 from datetime import datetime
-from typing import Dict, Tuple, Optional
-from fastapi.encoders import jsonable_encoder
+from typing import TYPE_CHECKING, Callable, Dict, Tuple, Optional
+
+# 🤖 Agent classes are imported lazily (see AGENT_FACTORIES); these are for type hints only
+if TYPE_CHECKING:
+    from agents.aster_agent.task_manager import AsterTaskManager
+    from agents.domain_agent_city.task_manager import CityTaskManager
+    from agents.domain_agent_weather.task_manager import WeatherTaskManager
 
 logger = logging.getLogger(__name__)
 
 # -----------------------------------------------------------------------------
 # 🔧 Agent Registration Functions
 # -----------------------------------------------------------------------------
+# Each function imports its agent's modules itself, so serving one agent never
+# loads the others (or their SDKs).
 
-def register_aster_agent(host: str, port: int) -> Tuple[AgentCard, AsterTaskManager]:
+def register_aster_agent(host: str, port: int) -> Tuple[AgentCard, "AsterTaskManager"]:
     """Register and configure the Aster Agent (Orchestrator)"""
+    from agents.aster_agent.agent import AsterAgent
+    from agents.aster_agent.task_manager import AsterTaskManager
+
     capabilities = AgentCapabilities(
         streaming=True,
         structured_output=True
@@ -77,8 +100,11 @@ def register_aster_agent(host: str, port: int) -> Tuple[AgentCard, AsterTaskMana
     task_manager = AsterTaskManager(agent=aster_agent)
     return agent_card, task_manager
 
-def register_city_agent(host: str, port: int) -> Tuple[AgentCard, CityTaskManager]:
+def register_city_agent(host: str, port: int) -> Tuple[AgentCard, "CityTaskManager"]:
     """Register and configure the City Information Agent"""
+    from agents.domain_agent_city.agent import CityAgent
+    from agents.domain_agent_city.task_manager import CityTaskManager
+
     capabilities = AgentCapabilities(
         streaming=True,
         structured_output=True
@@ -91,7 +117,9 @@ def register_city_agent(host: str, port: int) -> Tuple[AgentCard, CityTaskManage
         examples=[
             "Tell me about Paris",
             "What are the attractions in Tokyo?"
-        ]
+        ],
+        cacheTtl=3600,       # City facts rarely change: callers may reuse answers for an hour
+        cacheScope="global",
     )
     agent_card = AgentCard(
         name="CityAgent",
@@ -107,8 +135,11 @@ def register_city_agent(host: str, port: int) -> Tuple[AgentCard, CityTaskManage
     task_manager = CityTaskManager(agent=city_agent)
     return agent_card, task_manager
 
-def register_weather_agent(host: str, port: int) -> Tuple[AgentCard, WeatherTaskManager]:
+def register_weather_agent(host: str, port: int) -> Tuple[AgentCard, "WeatherTaskManager"]:
     """Register and configure the Weather Information Agent"""
+    from agents.domain_agent_weather.agent import WeatherAgent
+    from agents.domain_agent_weather.task_manager import WeatherTaskManager
+
     capabilities = AgentCapabilities(
         streaming=True,
         structured_output=True
@@ -121,7 +152,9 @@ def register_weather_agent(host: str, port: int) -> Tuple[AgentCard, WeatherTask
         examples=[
             "What's the weather in Seoul?",
             "Give me the weather forecast for London"
-        ]
+        ],
+        cacheTtl=300,        # Weather changes: reuse answers within one conversation for 5 minutes
+        cacheScope="session",
     )
     agent_card = AgentCard(
         name="WeatherAgent",
@@ -137,27 +170,171 @@ def register_weather_agent(host: str, port: int) -> Tuple[AgentCard, WeatherTask
     task_manager = WeatherTaskManager(agent=weather_agent)
     return agent_card, task_manager
 
+# -----------------------------------------------------------------------------
+# 🗂️ Lazy Agent Registry
+# -----------------------------------------------------------------------------
+# agent_id -> function returning (AgentCard, task manager).
+# Each function imports its agent's modules itself, so nothing agent-specific
+# is imported until an agent is actually registered.
+AGENT_FACTORIES: Dict[str, Callable[[str, int], Tuple[AgentCard, task_manager.TaskManager]]] = {
+    "aster": register_aster_agent,
+    "city": register_city_agent,
+    "weather": register_weather_agent,
+}
+
+
+def resolve_agent_factory(agent_id: str) -> Callable[[str, int], Tuple[AgentCard, task_manager.TaskManager]]:
+    """Return the registration function for `agent_id`"""
+    if agent_id not in AGENT_FACTORIES:
+        raise ValueError(f"Unknown agent: {agent_id} (known: {', '.join(AGENT_FACTORIES)})")
+    return AGENT_FACTORIES[agent_id]
+
 # -----------------------------------------------------------------------------
 # 🚀 A2AServer Class: The Core Server Logic
 # -----------------------------------------------------------------------------
 class A2AServer:
-    def __init__(self, host: str = "0.0.0.0", port: int = 5000):
-        """Initialize the A2A server with multiple agent support"""
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 5000,
+        max_batch_size: int = 50,
+        admin_token: Optional[str] = None,
+        loop_lag_threshold_ms: Optional[float] = None,
+        warm_up: bool = True,
+        blob_dir: Optional[str] = None,
+        max_blob_bytes: int = 256 * 1024 * 1024,
+        max_blob_store_bytes: int = 2 * 1024 * 1024 * 1024,
+        blob_token: Optional[str] = None,
+    ):
+        """
+        Initialize the A2A server with multiple agent support
+
+        Args:
+            max_batch_size: Max requests accepted in one JSON-RPC batch
+            admin_token: Enables the /admin/profile endpoint, guarded by this bearer
+                token (defaults to the A2A_ADMIN_TOKEN environment variable)
+            loop_lag_threshold_ms: Enables the event-loop lag monitor: log the blocking
+                call when the loop stalls longer than this (defaults to the
+                A2A_LOOP_LAG_THRESHOLD_MS environment variable; unset or 0 = off)
+            warm_up: Warm up each agent's Runner pool before serving requests
+                (agents can opt out individually via RunnerPoolConfig.warm_up)
+            blob_dir: Where uploaded file content is stored (default: a per-port temp directory)
+            max_blob_bytes: Largest accepted upload
+            max_blob_store_bytes: Quota for all blobs; least recently used ones are evicted
+            blob_token: Bearer token required for uploads (defaults to the
+                A2A_BLOB_TOKEN environment variable; unset = open uploads)
+        """
         self.host = host
         self.port = port
+        self.max_batch_size = max_batch_size
+        self.admin_token = admin_token or os.getenv("A2A_ADMIN_TOKEN")
         self.agents: Dict[str, Tuple[AgentCard, task_manager]] = {}
-        self.app = Starlette()
+
+        # 📣 One webhook sender shared by every registered agent (spool is per port)
+        self.push_sender = PushNotificationSender(
+            spool_dir=os.path.join(tempfile.gettempdir(), f"a2a_push_spool_{port}")
+        )
+
+        # 🗄️ File content referenced by FileParts (uploaded via POST /blobs)
+        self.blob_store = BlobStore(
+            blob_dir or os.path.join(tempfile.gettempdir(), f"a2a_blobs_{port}"),
+            max_bytes=max_blob_bytes,
+            max_total_bytes=max_blob_store_bytes,
+        )
+        self.blob_token = blob_token or os.getenv("A2A_BLOB_TOKEN")
+
+        # 🐢 Watches the event loop for blocking calls while the app runs
+        if loop_lag_threshold_ms is None:
+            loop_lag_threshold_ms = float(os.getenv("A2A_LOOP_LAG_THRESHOLD_MS", "0"))
+        self.lag_monitor = (
+            EventLoopLagMonitor(threshold=loop_lag_threshold_ms / 1000) if loop_lag_threshold_ms > 0 else None
+        )
+        self._profiling = False  # Only one profile at a time
+        self.warm_up = warm_up
+
+        self.app = Starlette(lifespan=self._lifespan)
         
         # Register routes
         self.app.add_route("/", self._handle_request, methods=["POST"])
         self.app.add_route("/.well-known/agent.json", self._get_agent_cards, methods=["GET"])
         self.app.add_route("/agents/{agent_id}", self._handle_agent_request, methods=["POST"])
+        self.app.add_route("/metrics", self._get_metrics, methods=["GET"])
+        self.app.add_route("/blobs", self._upload_blob, methods=["POST"])
+        self.app.add_route("/blobs/{digest}", self._download_blob, methods=["GET"])
+        if self.admin_token:
+            self.app.add_route("/admin/profile", self._profile, methods=["GET"])
+
+    @contextlib.asynccontextmanager
+    async def _lifespan(self, app):
+        """Start background services with the app and stop them on shutdown"""
+        await self.push_sender.start()  # Also resumes deliveries spooled before a restart
+        if self.warm_up:
+            await self._warm_up_agents()
+        if self.lag_monitor is not None:
+            await self.lag_monitor.start()
+        health_monitors = self._health_monitors()
+        for monitor in health_monitors:
+            await monitor.start()
+        try:
+            yield
+        finally:
+            for monitor in health_monitors:
+                await monitor.stop()
+            if self.lag_monitor is not None:
+                await self.lag_monitor.stop()
+            await self.push_sender.stop()
+
+    def _health_monitors(self) -> list:
+        """🩺 Health probes of the remote agents that orchestrators delegate to"""
+        monitors = []
+        for _, agent_task_manager in self.agents.values():
+            monitor = getattr(getattr(agent_task_manager, "agent", None), "health_monitor", None)
+            if monitor is not None:
+                monitors.append(monitor)
+        return monitors
+
+    async def _warm_up_agents(self):
+        """
+        🔥 Build each agent's Runner pool, create model clients and run the
+        configured synthetic request, so real traffic doesn't pay for it.
+        Agents without a Runner pool (or with warm-up disabled) are skipped.
+        """
+        pending = {}
+        for agent_id, (_, agent_task_manager) in self.agents.items():
+            agent = getattr(agent_task_manager, "agent", None)
+            pool = getattr(agent, "runner_pool", None)
+            if pool is not None and pool.config.warm_up:
+                pending[agent_id] = agent.warm_up()
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*pending.values(), return_exceptions=True)
+        for agent_id, result in zip(pending, results):
+            if isinstance(result, Exception):
+                # Not fatal: the agent is built again on its first request
+                logger.warning(f"⚠️ Warm-up failed for {agent_id}: {result}")
+        if pending:
+            logger.info(f"🔥 Warmed up {len(pending)} agent(s) in {time.perf_counter() - started:.2f}s")
 
     def register_agent(self, agent_id: str, agent_card: AgentCard, agent_task_manager: task_manager):
         """Register an agent with the server"""
+        agent_task_manager.push_sender = self.push_sender
+        agent_task_manager.agent_id = agent_id
+        metrics.tasks_stored.labels(agent_id=agent_id).set_function(lambda: len(agent_task_manager.tasks))
+        agent_card.capabilities.pushNotifications = True
         self.agents[agent_id] = (agent_card, agent_task_manager)
         logger.info(f"Registered agent: {agent_id} ({agent_card.name})")
 
+    def register_agent_by_id(self, agent_id: str, host: Optional[str] = None, port: Optional[int] = None):
+        """
+        Register a known agent from AGENT_FACTORIES, importing only its modules
+
+        Args:
+            agent_id: Key in AGENT_FACTORIES (e.g. "city")
+            host, port: Address written into the agent's card (defaults to this server's)
+        """
+        agent_card, agent_task_manager = resolve_agent_factory(agent_id)(host or self.host, port or self.port)
+        self.register_agent(agent_id, agent_card, agent_task_manager)
+
     async def _handle_agent_request(self, request: Request):
         """Handle requests for specific agents"""
         agent_id = request.path_params["agent_id"]
@@ -167,11 +344,8 @@ class A2AServer:
         _, task_manager = self.agents[agent_id]
         try:
             body = await request.json()
-            json_rpc = A2ARequest.validate_python(body)
-            if isinstance(json_rpc, SendTaskRequest):
-                result = await task_manager.on_send_task(json_rpc)
-                return self._create_response(result)
-            raise ValueError(f"Unsupported method for agent {agent_id}")
+            with tracer.span("A2AServer._handle_request", traceparent=tracer.extract(body), agent_id=agent_id):
+                return await self._handle_body(task_manager, body)
         except Exception as e:
             logger.error(f"Error handling request for agent {agent_id}: {e}")
             return JSONResponse(
@@ -192,11 +366,8 @@ class A2AServer:
                 raise ValueError("No suitable agent registered")
             body = await request.json()
             logger.info(f"🔍 Incoming JSON: {json.dumps(body, indent=2)}")
-            json_rpc = A2ARequest.validate_python(body)
-            if isinstance(json_rpc, SendTaskRequest):
-                result = await task_manager.on_send_task(json_rpc)
-                return self._create_response(result)
-            raise ValueError("Unsupported A2A method")
+            with tracer.span("A2AServer._handle_request", traceparent=tracer.extract(body)):
+                return await self._handle_body(task_manager, body)
         except Exception as e:
             logger.error(f"Exception: {e}")
             return JSONResponse(
@@ -204,6 +375,78 @@ class A2AServer:
                 status_code=400
             )
 
+    async def _handle_body(self, task_manager, body) -> JSONResponse:
+        """Handle a decoded POST body: a single JSON-RPC request or a batch array"""
+        if isinstance(body, list):
+            return await self._handle_batch(task_manager, body)
+        with tracer.span("A2ARequest.validate_python"):
+            json_rpc = A2ARequest.validate_python(body)
+        result = await self._dispatch(task_manager, json_rpc)
+        return self._create_response(result)
+
+    async def _handle_batch(self, task_manager, batch: list) -> JSONResponse:
+        """
+        Handle a JSON-RPC 2.0 batch: run all members concurrently and return
+        their responses in the same order as the requests.
+        A failing member only produces an error entry; the others still succeed.
+        """
+        if not batch or len(batch) > self.max_batch_size:
+            error = InvalidRequestError(
+                message=f"Batch must contain between 1 and {self.max_batch_size} requests"
+            )
+            return JSONResponse(
+                JSONRPCResponse(id=None, error=error).model_dump(),
+                status_code=400
+            )
+        results = await asyncio.gather(
+            *(self._dispatch_batch_member(task_manager, member) for member in batch)
+        )
+        return JSONResponse(content=results)
+
+    async def _dispatch_batch_member(self, task_manager, member) -> dict:
+        """Validate and dispatch one batch member, turning failures into error responses"""
+        member_id = member.get("id") if isinstance(member, dict) else None
+        try:
+            with tracer.span("A2ARequest.validate_python", batch_member=str(member_id)):
+                json_rpc = A2ARequest.validate_python(member)
+            result = await self._dispatch(task_manager, json_rpc)
+        except Exception as e:
+            logger.error(f"Error in batch request {member_id}: {e}")
+            result = JSONRPCResponse(id=member_id, error=InternalError(message=str(e)))
+        response = result.model_dump(mode="json", exclude_none=True)
+        response.setdefault("id", None)     # JSON-RPC: error replies keep "id" (null if unknown)
+        return response
+
+    async def _dispatch(self, task_manager, json_rpc) -> JSONRPCResponse:
+        """Route a validated JSON-RPC request, recording rate, latency and outcome metrics"""
+        agent_id, method = task_manager.agent_id, json_rpc.method
+        in_flight = metrics.requests_in_flight.labels(agent_id=agent_id)
+        in_flight.inc()
+        started = time.perf_counter()
+        outcome = "exception"
+        try:
+            result = await self._route(task_manager, json_rpc)
+            outcome = "error" if result.error is not None else "ok"
+            return result
+        finally:
+            in_flight.dec()
+            metrics.request_duration.labels(agent_id=agent_id, method=method).observe(time.perf_counter() - started)
+            metrics.requests_total.labels(agent_id=agent_id, method=method, outcome=outcome).inc()
+
+    async def _route(self, task_manager, json_rpc) -> JSONRPCResponse:
+        """Call the task manager method matching the request type"""
+        if isinstance(json_rpc, SendTaskRequest):
+            return await task_manager.on_send_task(json_rpc)
+        if isinstance(json_rpc, GetTaskRequest):
+            return await task_manager.on_get_task(json_rpc)
+        if isinstance(json_rpc, CancelTaskRequest):
+            return await task_manager.on_cancel_task(json_rpc)
+        if isinstance(json_rpc, SetTaskPushNotificationRequest):
+            return await task_manager.on_set_task_push_notification(json_rpc)
+        if isinstance(json_rpc, GetTaskPushNotificationRequest):
+            return await task_manager.on_get_task_push_notification(json_rpc)
+        raise ValueError("Unsupported A2A method")
+
     def _get_agent_cards(self, request: Request) -> JSONResponse:
         """Return metadata for all registered agents"""
         return JSONResponse({
@@ -211,10 +454,89 @@ class A2AServer:
             for agent_id, (card, _) in self.agents.items()
         })
 
+    def _get_metrics(self, request: Request) -> PlainTextResponse:
+        """Return all metrics in the Prometheus text format"""
+        return PlainTextResponse(metrics.REGISTRY.render(), media_type=metrics.CONTENT_TYPE)
+
+    async def _upload_blob(self, request: Request) -> JSONResponse:
+        """
+        Store the raw request body as a blob, streaming it to disk.
+
+        Returns:
+            201 with {"digest", "size", "uri"}; put "uri" (and "size") in a
+            FilePart so the receiver can download the content.
+        """
+        if self.blob_token and request.headers.get("authorization") != f"Bearer {self.blob_token}":
+            return JSONResponse({"error": "Unauthorized"}, status_code=401)
+        length = request.headers.get("content-length")
+        try:
+            info = await self.blob_store.put_stream(request.stream(), int(length) if length else None)
+        except BlobTooLargeError as e:
+            return JSONResponse({"error": str(e)}, status_code=413)
+        metrics.blob_bytes.labels(direction="upload").inc(info.size)
+        uri = f"{str(request.base_url).rstrip('/')}/blobs/{info.digest}"
+        return JSONResponse({"digest": info.digest, "size": info.size, "uri": uri}, status_code=201)
+
+    async def _download_blob(self, request: Request):
+        """Stream a stored blob (read through mmap, off the event loop)."""
+        digest = request.path_params["digest"]
+        try:
+            size = self.blob_store.size(digest)
+        except ValueError as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+        if size is None:
+            return JSONResponse({"error": f"Blob {digest} not found"}, status_code=404)
+        self.blob_store.touch(digest)
+        metrics.blob_bytes.labels(direction="download").inc(size)
+        return StreamingResponse(
+            self.blob_store.iter_chunks(digest),
+            media_type="application/octet-stream",
+            headers={
+                "Content-Length": str(size),
+                "ETag": f'"{digest}"',
+                "Cache-Control": "public, max-age=31536000, immutable",  # Content never changes
+            },
+        )
+
+    async def _profile(self, request: Request):
+        """
+        Sample every thread's stack for a while and return the profile.
+
+        Query parameters:
+            seconds: How long to sample (default 10, max 60)
+            interval_ms: Time between samples (default 5)
+            format: "collapsed" (default, for flamegraph.pl / speedscope) or "speedscope"
+        """
+        if request.headers.get("authorization") != f"Bearer {self.admin_token}":
+            return JSONResponse({"error": "Unauthorized"}, status_code=401)
+        try:
+            seconds = min(float(request.query_params.get("seconds", 10)), 60.0)
+            interval = max(float(request.query_params.get("interval_ms", 5)), 1.0) / 1000
+        except ValueError:
+            return JSONResponse({"error": "seconds and interval_ms must be numbers"}, status_code=400)
+        output = request.query_params.get("format", "collapsed")
+        if output not in ("collapsed", "speedscope"):
+            return JSONResponse({"error": f"Unknown format: {output}"}, status_code=400)
+        if self._profiling:
+            return JSONResponse({"error": "A profile is already running"}, status_code=409)
+
+        self._profiling = True
+        try:
+            # Sample from a worker thread so the event loop keeps serving (and shows up in the profile)
+            profiler = await asyncio.to_thread(SamplingProfiler(interval).run, seconds)
+        finally:
+            self._profiling = False
+        logger.info(f"🔬 Profiled {sum(profiler.samples.values())} stack samples over {profiler.duration:.1f}s")
+        if output == "speedscope":
+            return JSONResponse(profiler.speedscope(name=f"a2a-server:{self.port}"))
+        return PlainTextResponse(profiler.collapsed())
+
     def _create_response(self, result):
         """Create JSON response from result"""
         if isinstance(result, JSONRPCResponse):
-            return JSONResponse(content=jsonable_encoder(result.model_dump(exclude_none=True)))
+            with tracer.span("A2AServer._create_response"):
+                # mode="json" encodes datetimes etc. in pydantic-core, far cheaper than jsonable_encoder
+                return JSONResponse(content=result.model_dump(mode="json", exclude_none=True))
         raise ValueError("Invalid response type")
 
     def start(self):
@@ -224,6 +546,8 @@ class A2AServer:
         
         logger.info(f"🚀 Starting A2A server on {self.host}:{self.port}")
         logger.info(f"📋 Registered agents: {', '.join(self.agents.keys())}")
+        if tracer.service_name is None:
+            tracer.service_name = "+".join(self.agents.keys())
         
         import uvicorn
         uvicorn.run(self.app, host=self.host, port=self.port)
@@ -241,14 +565,10 @@ if __name__ == "__main__":
     # Create server instance
     server = A2AServer(host="localhost", port=10020)
     
-    # Register all agents
-    aster_card, aster_manager = register_aster_agent("localhost", 10021)
-    city_card, city_manager = register_city_agent("localhost", 10022)
-    weather_card, weather_manager = register_weather_agent("localhost", 10023)
-    
-    server.register_agent("aster", aster_card, aster_manager)
-    server.register_agent("city", city_card, city_manager)
-    server.register_agent("weather", weather_card, weather_manager)
+    # Register all agents (each one's modules are imported here, on registration)
+    server.register_agent_by_id("aster", "localhost", 10021)
+    server.register_agent_by_id("city", "localhost", 10022)
+    server.register_agent_by_id("weather", "localhost", 10023)
     
     # Start serving
     server.start()
@@ -7,10 +7,16 @@
 # ✅ Includes:
 # - A base abstract class `TaskManager` that outlines required methods
 # - A simple `InMemoryTaskManager` that keeps tasks temporarily in memory
+#   (as compact `StoredTask`s, converted to `Task` only for responses)
+# - Blocking and non-blocking (background) execution of `tasks/send`
+# - Per-task webhook registration for push notifications
+# - Cancellation of running tasks (`tasks/cancel`)
+# - Idempotent `tasks/send`: a send is keyed on (task ID, message hash); a
+#   retried send attaches to the run still in flight, or gets the stored
+#   result of the finished run, without appending to history or running
+#   the agent (and its LLM calls) again
 #
 # ❌ Does not include:
-# - Cancel task functionality
-# - Push notifications or real-time updates
 # - Persistent storage (like a database)
 # =============================================================================
 
@@ -20,8 +26,12 @@
 # -----------------------------------------------------------------------------
 
 from abc import ABC, abstractmethod        # Lets us define abstract base classes (like an interface)
-from typing import Dict                    # Dict is a dictionary type for storing key-value pairs
+from typing import Dict, Tuple             # Dict is a dictionary type for storing key-value pairs
+from collections import OrderedDict        # Per-task send records, oldest evicted first
+from dataclasses import dataclass          # Slotted record of one send's outcome
+import time                                # Used to measure how long we wait for the lock
 import asyncio                             # Used here for locks to safely handle concurrency (async operations)
+import logging                             # Used to report failures of background jobs
 
 
 # -----------------------------------------------------------------------------
@@ -30,14 +40,56 @@ import asyncio                             # Used here for locks to safely handl
 
 from models.request import (
     SendTaskRequest, SendTaskResponse,    # For sending tasks to the agent
-    GetTaskRequest, GetTaskResponse       # For querying task info from the agent
+    GetTaskRequest, GetTaskResponse,      # For querying task info from the agent
+    CancelTaskRequest, CancelTaskResponse,  # For stopping a running task
+    SetTaskPushNotificationRequest, SetTaskPushNotificationResponse,  # For registering webhooks
+    GetTaskPushNotificationRequest, GetTaskPushNotificationResponse   # For reading webhook settings
 )
 
 from models.task import (
-    Task, TaskSendParams, TaskQueryParams,  # Task and input models
-    TaskStatus, TaskState, Message          # Task metadata and history objects
+    TaskSendParams, TaskQueryParams,        # Input models
+    TaskState, Message,                     # Task states and history messages
+    StoredTask, StoredMessage,              # Compact in-memory task representation
+    PushNotificationConfig, TaskPushNotificationConfig  # Webhook settings
 )
 
+from models.json_rpc import TaskNotFoundError, TaskNotCancelableError  # A2A task errors
+from server.push_notification import PushNotificationSender  # Background webhook delivery
+from utilities.tracing import tracer                         # Spans for lock wait and task bookkeeping
+from utilities.metrics import task_state_transitions, duplicate_sends  # Prometheus counters
+
+logger = logging.getLogger(__name__)
+
+# States after which a task never changes again
+TERMINAL_STATES = (TaskState.COMPLETED, TaskState.FAILED, TaskState.CANCELED)
+
+# Sends remembered per task for deduplication (a multi-turn task keeps its latest ones)
+MAX_SEND_RECORDS = 16
+
+
+@dataclass(slots=True)
+class SendRecord:
+    """
+    The run started by one `tasks/send` (one task ID + message hash).
+    While it runs, `job` is set; once it ends, the outcome is kept as the
+    history length, state and time at that moment, so a replay can rebuild
+    the response without storing a copy of it.
+    """
+    job: asyncio.Task | None = None
+    history_length: int = 0
+    state: str | None = None        # None while the run hasn't finished
+    timestamp: float = 0.0
+
+    def finish(self, task: StoredTask) -> None:
+        self.job = None
+        self.history_length = len(task.history)
+        self.state = task.state
+        self.timestamp = task.timestamp
+
+    def replay(self, task: StoredTask) -> StoredTask:
+        """The task as it was when this send's run finished."""
+        return StoredTask(task.id, self.state, self.timestamp, task.history[:self.history_length])
+
 
 # -----------------------------------------------------------------------------
 # 🧩 TaskManager (Abstract Base Class)
@@ -47,9 +99,10 @@ class TaskManager(ABC):
     """
     🔧 This is a base interface class.
 
-    All Task Managers must implement these two async methods:
+    All Task Managers must implement these async methods:
     - on_send_task(): to receive and process new tasks
     - on_get_task(): to fetch the current status or conversation history of a task
+    - on_cancel_task(): to stop a task that is still running
 
     This makes sure all implementations follow a consistent structure.
     """
@@ -64,6 +117,11 @@ class TaskManager(ABC):
         """📤 This method will return task details by task ID."""
         pass
 
+    @abstractmethod
+    async def on_cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
+        """🛑 This method will stop a running task by task ID."""
+        pass
+
 
 # -----------------------------------------------------------------------------
 # 🧠 InMemoryTaskManager
@@ -82,13 +140,18 @@ class InMemoryTaskManager(TaskManager):
     """
 
     def __init__(self):
-        self.tasks: Dict[str, Task] = {}   # 🗃️ Dictionary where key = task ID, value = Task object
+        self.tasks: Dict[str, StoredTask] = {}  # 🗃️ Dictionary where key = task ID, value = StoredTask
         self.lock = asyncio.Lock()         # 🔐 Async lock to ensure two requests don't modify data at the same time
+        self.running_tasks: Dict[str, asyncio.Task] = {}  # ⏳ Running agent jobs, keyed by task ID (used for cancel)
+        self.push_configs: Dict[str, PushNotificationConfig] = {}  # 📣 Webhook settings, keyed by task ID
+        self.sends: Dict[str, "OrderedDict[bytes, SendRecord]"] = {}  # 🔁 task ID → message digest → SendRecord
+        self.push_sender: PushNotificationSender | None = None     # 📣 Set by A2AServer.register_agent()
+        self.agent_id: str = type(self).__name__                   # 🏷️ Metrics label; set by A2AServer.register_agent()
 
     # -------------------------------------------------------------------------
     # 💾 upsert_task: Create or update a task in memory
     # -------------------------------------------------------------------------
-    async def upsert_task(self, params: TaskSendParams) -> Task:
+    async def upsert_task(self, params: TaskSendParams) -> StoredTask:
         """
         Create a new task if it doesn’t exist, or update the history if it does.
 
@@ -96,37 +159,237 @@ class InMemoryTaskManager(TaskManager):
             params: TaskSendParams – includes task ID, session ID, and message
 
         Returns:
-            Task – the newly created or updated task
+            StoredTask – the newly created or updated task
+        """
+        task, _, _ = await self._upsert(params)
+        return task
+
+    async def _upsert(self, params: TaskSendParams) -> Tuple[StoredTask, SendRecord, bool]:
+        """`upsert_task()`, also returning the send's record and whether it is a duplicate."""
+        with tracer.span("InMemoryTaskManager.upsert_task", task_id=params.id) as span:
+            wait_start = time.perf_counter()
+            async with self.lock:
+                if span is not None:
+                    span.set_attribute("lock_wait_ms", round((time.perf_counter() - wait_start) * 1000, 3))
+                return self._upsert_locked(params)
+
+    def _upsert_locked(self, params: TaskSendParams) -> Tuple[StoredTask, SendRecord, bool]:
+        """Body of `_upsert()`; the caller must hold `self.lock`."""
+        task = self.tasks.get(params.id)  # Try to find an existing task with this ID
+        message = StoredMessage.from_message(params.message)
+        key = message.digest()
+        records = self.sends.setdefault(params.id, OrderedDict())
+        record = records.get(key)
+
+        if params.pushNotification is not None:
+            self.push_configs[params.id] = params.pushNotification
+
+        if task is not None and record is not None:
+            if record.state == TaskState.FAILED.value:
+                # Retrying a failed run: run it again, but the message is already in the history
+                records[key] = record = SendRecord()
+                return task, record, False
+            if record.state is None or task.state != TaskState.INPUT_REQUIRED.value:
+                return task, record, True
+            # Repeating a finished answer while the agent waits for input ("yes") is a new turn
+
+        if task is None:
+            # If task doesn't exist, create it with a "submitted" status
+            task = StoredTask.create(params.id, params.message)
+            self.tasks[params.id] = task
+            task_state_transitions.labels(agent_id=self.agent_id, state=TaskState.SUBMITTED.value).inc()
+        else:
+            # If task exists, add the new message to its history
+            task.history.append(message)
+
+        records[key] = record = SendRecord()
+        records.move_to_end(key)
+        if len(records) > MAX_SEND_RECORDS:
+            records.popitem(last=False)
+        return task, record, False
+
+    # -------------------------------------------------------------------------
+    # 🔄 update_status: Move a task to a new state (and optionally add a reply)
+    # -------------------------------------------------------------------------
+    async def update_status(self, task: StoredTask, state: TaskState, message: Message | None = None) -> None:
+        """
+        Set the task's status under the lock, appending `message` to history if given.
+
+        Args:
+            task: The StoredTask to update
+            state: The new TaskState
+            message: Optional agent message to append to the history
         """
         async with self.lock:
-            task = self.tasks.get(params.id)  # Try to find an existing task with this ID
+            task.set_state(state)
+            if message is not None:
+                task.history.append(StoredMessage.from_message(message))
+        task_state_transitions.labels(agent_id=self.agent_id, state=state.value).inc()
+        await self.send_push_notification(task)
 
-            if task is None:
-                # If task doesn't exist, create it with a "submitted" status
-                task = Task(
-                    id=params.id,
-                    status=TaskStatus(state=TaskState.SUBMITTED),
-                    history=[params.message]
-                )
-                self.tasks[params.id] = task
-            else:
-                # If task exists, add the new message to its history
-                task.history.append(params.message)
+    # -------------------------------------------------------------------------
+    # 📣 send_push_notification: Tell the task's webhook (if any) about its status
+    # -------------------------------------------------------------------------
+    async def send_push_notification(self, task: StoredTask) -> None:
+        """
+        Queue a status update for the task's registered webhook.
+        Does nothing when no webhook is registered or no sender is attached.
+        """
+        config = self.push_configs.get(task.id)
+        if config is None or self.push_sender is None:
+            return
+        final = task.state in TERMINAL_STATES
+        payload = {
+            "id": task.id,
+            "status": task.to_status().model_dump(mode="json"),
+            "final": final,
+        }
+        if final:
+            payload["task"] = task.to_task().model_dump(mode="json")
+        await self.push_sender.enqueue(config, payload)
 
-            return task
+    # -------------------------------------------------------------------------
+    # 🔔 on_set_task_push_notification / on_get_task_push_notification
+    # -------------------------------------------------------------------------
+    async def on_set_task_push_notification(
+        self, request: SetTaskPushNotificationRequest
+    ) -> SetTaskPushNotificationResponse:
+        """Register (or replace) the webhook for an existing task."""
+        params: TaskPushNotificationConfig = request.params
+        async with self.lock:
+            if params.id not in self.tasks:
+                return SetTaskPushNotificationResponse(id=request.id, error=TaskNotFoundError())
+            self.push_configs[params.id] = params.pushNotificationConfig
+        return SetTaskPushNotificationResponse(id=request.id, result=params)
+
+    async def on_get_task_push_notification(
+        self, request: GetTaskPushNotificationRequest
+    ) -> GetTaskPushNotificationResponse:
+        """Return the webhook registered for a task."""
+        async with self.lock:
+            if request.params.id not in self.tasks:
+                return GetTaskPushNotificationResponse(id=request.id, error=TaskNotFoundError())
+            config = self.push_configs.get(request.params.id)
+        if config is None:
+            return GetTaskPushNotificationResponse(id=request.id, result=None)
+        return GetTaskPushNotificationResponse(
+            id=request.id,
+            result=TaskPushNotificationConfig(id=request.params.id, pushNotificationConfig=config),
+        )
 
     # -------------------------------------------------------------------------
-    # 🚫 on_send_task: Must be implemented by any subclass
+    # 📨 on_send_task: Store the task, then run it as a tracked job
     # -------------------------------------------------------------------------
     async def on_send_task(self, request: SendTaskRequest) -> SendTaskResponse:
         """
-        This method is intentionally not implemented here.
-        Subclasses like `AgentTaskManager` should override it.
+        Handle `tasks/send`.
+
+        The agent always runs as a tracked asyncio job so that `tasks/cancel`
+        can stop it.
+
+        - Blocking mode (default): waits for the job and returns the finished task.
+        - Non-blocking mode (`params.blocking = False`): returns right away with
+          the task in SUBMITTED state. Clients then poll `tasks/get` to follow
+          WORKING → COMPLETED.
+        - Duplicate send (same task ID and message hash as an earlier send): the
+          agent is not run again. A blocking duplicate waits for the run in
+          flight, and a finished run's result is replayed as it was when that
+          run ended. A FAILED run is run again.
+
+        Args:
+            request: The incoming SendTaskRequest
+
+        Returns:
+            SendTaskResponse – the finished task, or a snapshot of the submitted task
+        """
+        task, record, duplicate = await self._upsert(request.params)
+
+        if duplicate:
+            duplicate_sends.labels(agent_id=self.agent_id).inc()
+            if request.params.blocking and record.job is not None:
+                await asyncio.wait({record.job})  # Attach to the run in flight
+            if record.state is None:
+                return SendTaskResponse(id=request.id, result=task.to_task())  # Still running (non-blocking)
+            return SendTaskResponse(id=request.id, result=record.replay(task).to_task())
+
+        job = asyncio.create_task(self._run_job(request, task))
+        record.job = job
+        self.running_tasks[task.id] = job
+        # Runs before any waiter resumes, so attached duplicates see the finished record
+        job.add_done_callback(lambda finished: self._job_done(task, record, finished))
+
+        if request.params.blocking:
+            await asyncio.wait({job})  # Don't propagate the job's cancellation to this request
+
+        # to_task() builds a snapshot, so the background job can keep mutating the stored task
+        return SendTaskResponse(id=request.id, result=task.to_task())
+
+    async def _run_job(self, request: SendTaskRequest, task: StoredTask) -> None:
+        """Run `process_task()`, marking the task CANCELED or FAILED if it doesn't finish."""
+        try:
+            await self.process_task(request, task)
+        except asyncio.CancelledError:
+            await self.update_status(task, TaskState.CANCELED)
+            raise
+        except Exception as e:
+            logger.error(f"Task {task.id} failed: {e}")
+            await self.update_status(task, TaskState.FAILED)
+
+    def _job_done(self, task: StoredTask, record: SendRecord, job: asyncio.Task) -> None:
+        """Keep the outcome for duplicate sends, then forget the job."""
+        record.finish(task)
+        self._forget_job(task.id, job)
+
+    def _forget_job(self, task_id: str, job: asyncio.Task) -> None:
+        """Drop a finished job (unless a newer send already replaced it)."""
+        if self.running_tasks.get(task_id) is job:
+            del self.running_tasks[task_id]
+
+    # -------------------------------------------------------------------------
+    # 🛑 on_cancel_task: Stop a running task
+    # -------------------------------------------------------------------------
+    async def on_cancel_task(self, request: CancelTaskRequest) -> CancelTaskResponse:
+        """
+        Cancel a task that has not finished yet.
+
+        Cancelling the job interrupts the agent wherever it is awaiting (LLM call,
+        delegated sub-task, tool). Connectors forward the cancellation to any
+        remote sub-tasks before the job ends.
+
+        Returns:
+            CancelTaskResponse – the task in CANCELED state, or an error if it is
+            unknown or already finished
+        """
+        async with self.lock:
+            task = self.tasks.get(request.params.id)
+            if task is None:
+                return CancelTaskResponse(id=request.id, error=TaskNotFoundError())
+            if task.state in TERMINAL_STATES:
+                return CancelTaskResponse(id=request.id, error=TaskNotCancelableError())
+
+        job = self.running_tasks.get(task.id)
+        if job is not None and not job.done():
+            job.cancel()
+            await asyncio.wait({job})  # Let the job unwind and mark itself CANCELED
+        if task.state != TaskState.CANCELED:
+            await self.update_status(task, TaskState.CANCELED)
+        return CancelTaskResponse(id=request.id, result=task.to_task())
+
+    # -------------------------------------------------------------------------
+    # 🚫 process_task: Must be implemented by any subclass
+    # -------------------------------------------------------------------------
+    async def process_task(self, request: SendTaskRequest, task: StoredTask) -> None:
+        """
+        Run the agent for a stored task and record the outcome.
+
+        Subclasses like `CityTaskManager` override this. Implementations should
+        move the task to WORKING, call the agent, then use `update_status()` to
+        mark it COMPLETED (or FAILED) with the agent's reply.
 
         Raises:
             NotImplementedError: if someone tries to use it directly
         """
-        raise NotImplementedError("on_send_task() must be implemented in subclass")
+        raise NotImplementedError("process_task() must be implemented in subclass")
 
     # -------------------------------------------------------------------------
     # 📥 on_get_task: Fetch a task by its ID
@@ -147,13 +410,7 @@ class InMemoryTaskManager(TaskManager):
 
             if not task:
                 # If task not found, return a structured error
-                return GetTaskResponse(id=request.id, error={"message": "Task not found"})
-
-            # Optional: Trim the history to only show the last N messages
-            task_copy = task.model_copy()  # Make a copy so we don't affect the original
-            if query.historyLength is not None:
-                task_copy.history = task_copy.history[-query.historyLength:]  # Get last N messages
-            else:
-                task_copy.history = task_copy.history
+                return GetTaskResponse(id=request.id, error=TaskNotFoundError())
 
-            return GetTaskResponse(id=request.id, result=task_copy)
\ No newline at end of file
+            # Build the response Task, optionally with only the last N messages
+            return GetTaskResponse(id=request.id, result=task.to_task(query.historyLength))
@@ -0,0 +1,9 @@
+# Poll several tasks in one HTTP round trip (JSON-RPC 2.0 batch).
+# Responses come back in the same order as the requests.
+curl -X POST http://localhost:10020/ \
+  -H "Content-Type: application/json" \
+  -d '[
+    {"jsonrpc": "2.0", "id": "a", "method": "tasks/get", "params": {"id": "task-001"}},
+    {"jsonrpc": "2.0", "id": "b", "method": "tasks/get", "params": {"id": "task-002"}},
+    {"jsonrpc": "2.0", "id": "c", "method": "tasks/get", "params": {"id": "task-003"}}
+  ]'
@@ -0,0 +1,12 @@
+# Cancel a running task (e.g. one started with blocking=false, see poll_weather.sh).
+# Delegated sub-tasks on domain agents are canceled as well.
+curl -X POST http://localhost:10020/ \
+  -H "Content-Type: application/json" \
+  -d '{
+    "jsonrpc": "2.0",
+    "id": "3",
+    "method": "tasks/cancel",
+    "params": {
+      "id": "task-002"
+    }
+  }'
@@ -0,0 +1,31 @@
+# 1) Non-blocking send: returns immediately with the task in "submitted" state
+curl -X POST http://localhost:10020/ \
+  -H "Content-Type: application/json" \
+  -d '{
+    "jsonrpc": "2.0",
+    "id": "1",
+    "method": "tasks/send",
+    "params": {
+      "id": "task-002",
+      "sessionId": "session-002",
+      "blocking": false,
+      "message": {
+        "role": "user",
+        "parts": [
+          {"type": "text", "text": "서울 날씨 알려줘"}
+        ]
+      }
+    }
+  }'
+
+# 2) Poll progress ("working" → "completed")
+curl -X POST http://localhost:10020/ \
+  -H "Content-Type: application/json" \
+  -d '{
+    "jsonrpc": "2.0",
+    "id": "2",
+    "method": "tasks/get",
+    "params": {
+      "id": "task-002"
+    }
+  }'
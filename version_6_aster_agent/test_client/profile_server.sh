@@ -0,0 +1,6 @@
+# Profile a running server for 10 seconds (start it with A2A_ADMIN_TOKEN=s3cret).
+# Open the result at https://www.speedscope.app, or use format=collapsed
+# and feed the output to flamegraph.pl.
+curl -s "http://localhost:10020/admin/profile?seconds=10&format=speedscope" \
+  -H "Authorization: Bearer s3cret" \
+  -o profile.speedscope.json
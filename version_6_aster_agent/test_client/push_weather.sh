@@ -0,0 +1,24 @@
+# Send a non-blocking task whose status updates are pushed to the local
+# webhook receiver (python -m test_client.webhook_receiver --port 10099)
+curl -X POST http://localhost:10020/ \
+  -H "Content-Type: application/json" \
+  -d '{
+    "jsonrpc": "2.0",
+    "id": "1",
+    "method": "tasks/send",
+    "params": {
+      "id": "task-003",
+      "sessionId": "session-003",
+      "blocking": false,
+      "pushNotification": {
+        "url": "http://localhost:10099/",
+        "token": "secret-token"
+      },
+      "message": {
+        "role": "user",
+        "parts": [
+          {"type": "text", "text": "서울 날씨 알려줘"}
+        ]
+      }
+    }
+  }'
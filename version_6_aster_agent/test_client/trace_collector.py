@@ -0,0 +1,52 @@
+# =============================================================================
+# test_client/trace_collector.py
+# =============================================================================
+# 🎯 Purpose:
+# A minimal local stand-in for an OTLP/HTTP trace collector. It accepts the
+# OTLP JSON that agents export (A2A_TRACE_OTLP_ENDPOINT), prints one line per
+# span and appends the spans to a JSON-lines file for later analysis.
+#
+#   python -m test_client.trace_collector --port 4318 --output /tmp/a2a_traces.jsonl
+#   A2A_TRACE_OTLP_ENDPOINT=http://localhost:4318/v1/traces python -m agents.aster_agent
+# =============================================================================
+
+import json
+import click
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+
+def build_app(output: str) -> Starlette:
+    async def collect(request: Request) -> JSONResponse:
+        body = await request.json()
+        with open(output, "a", encoding="utf-8") as f:
+            for resource_spans in body.get("resourceSpans", []):
+                service = next(
+                    (a["value"].get("stringValue") for a in resource_spans["resource"]["attributes"]
+                     if a["key"] == "service.name"),
+                    "unknown",
+                )
+                for scope_spans in resource_spans.get("scopeSpans", []):
+                    for span in scope_spans.get("spans", []):
+                        duration_ms = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+                        print(f"🧵 {span['traceId'][:8]} {service:<20} {span['name']:<40} {duration_ms:9.2f} ms")
+                        f.write(json.dumps({"service": service, **span}) + "\n")
+        return JSONResponse({})
+
+    app = Starlette()
+    app.add_route("/v1/traces", collect, methods=["POST"])
+    return app
+
+
+@click.command()
+@click.option("--host", default="localhost", help="Host to bind the collector to")
+@click.option("--port", default=4318, help="Port number for the collector")
+@click.option("--output", default="a2a_traces.jsonl", help="File to append received spans to")
+def main(host: str, port: int, output: str):
+    import uvicorn
+    uvicorn.run(build_app(output), host=host, port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
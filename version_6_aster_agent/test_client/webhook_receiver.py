@@ -0,0 +1,54 @@
+# =============================================================================
+# test_client/webhook_receiver.py
+# =============================================================================
+# 🎯 Purpose:
+# A tiny local stand-in for a client's webhook. It prints every push
+# notification it receives, so the delivery pipeline can be tried without a
+# real client.
+#
+#   python -m test_client.webhook_receiver --port 10099
+#   sh test_client/push_weather.sh
+#
+# Use --fail N to answer the first N notifications with HTTP 503 and watch
+# the server retry them with backoff.
+# =============================================================================
+
+import json
+import click
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+TOKEN_HEADER = "X-A2A-Notification-Token"
+
+
+def build_app(fail: int = 0) -> Starlette:
+    state = {"remaining_failures": fail, "received": 0}
+
+    async def receive(request: Request) -> JSONResponse:
+        if state["remaining_failures"] > 0:
+            state["remaining_failures"] -= 1
+            print("⚠️  Simulating failure (503)")
+            return JSONResponse({"ok": False}, status_code=503)
+        state["received"] += 1
+        body = await request.json()
+        print(f"\n📬 Notification #{state['received']} (token={request.headers.get(TOKEN_HEADER)})")
+        print(json.dumps(body, indent=2, ensure_ascii=False))
+        return JSONResponse({"ok": True})
+
+    app = Starlette()
+    app.add_route("/", receive, methods=["POST"])
+    return app
+
+
+@click.command()
+@click.option("--host", default="localhost", help="Host to bind the receiver to")
+@click.option("--port", default=10099, help="Port number for the receiver")
+@click.option("--fail", default=0, help="Answer the first N notifications with HTTP 503")
+def main(host: str, port: int, fail: int):
+    import uvicorn
+    uvicorn.run(build_app(fail), host=host, port=port)
+
+
+if __name__ == "__main__":
+    main()
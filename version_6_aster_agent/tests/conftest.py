@@ -0,0 +1,12 @@
+# =============================================================================
+# tests/conftest.py
+# =============================================================================
+# Run from version_6_aster_agent/:  python -m pytest -q tests
+# Modules import each other from this directory (models, server, ...), as
+# the agents' entry points do.
+# =============================================================================
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,114 @@
+# =============================================================================
+# tests/test_batch.py
+# =============================================================================
+# JSON-RPC 2.0 batches on A2AServer: members run concurrently, responses
+# come back in request order, and one bad member doesn't fail the others.
+# =============================================================================
+
+import time
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.stub_agents import make_card
+from client import client as client_module
+from client.client import A2AClient, A2AClientHTTPError
+from models.request import GetTaskRequest, SendTaskRequest
+from models.task import Message, TaskQueryParams, TaskSendParams, TaskState, TextPart
+from server.server import A2AServer
+from server.task_manager import InMemoryTaskManager
+
+
+class EchoTaskManager(InMemoryTaskManager):
+    """Echoes the message after `delay` seconds."""
+
+    def __init__(self, delay: float = 0.0):
+        super().__init__()
+        self.delay = delay
+
+    async def process_task(self, request, task):
+        await asyncio.sleep(self.delay)
+        text = request.params.message.text()
+        await self.update_status(task, TaskState.COMPLETED, Message(role="agent", parts=[TextPart(text=f"echo: {text}")]))
+
+
+@pytest.fixture
+def server(tmp_path):
+    server = A2AServer(port=0, max_batch_size=5, loop_lag_threshold_ms=0, warm_up=False, blob_dir=str(tmp_path))
+    server.register_agent("echo", make_card("EchoAgent", "http://echo.test/", "echo", ["echo"]), EchoTaskManager(delay=0.1))
+    return server
+
+
+def _send(task_id: str, text: str) -> dict:
+    return SendTaskRequest(id=task_id, params=TaskSendParams(
+        id=task_id, message=Message(role="user", parts=[TextPart(text=text)]),
+    )).model_dump(mode="json")
+
+
+def _post(server: A2AServer, body, path: str = "/") -> httpx.Response:
+    async def post():
+        transport = httpx.ASGITransport(app=server.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://server.test") as client:
+            return await client.post(path, json=body)
+    return asyncio.run(post())
+
+
+def test_batch_members_run_concurrently_and_keep_order(server):
+    batch = [_send(f"t{i}", f"message {i}") for i in range(4)]
+    started = time.perf_counter()
+    response = _post(server, batch)
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [member["id"] for member in body] == ["t0", "t1", "t2", "t3"]
+    assert [member["result"]["history"][-1]["parts"][0]["text"] for member in body] == [
+        f"echo: message {i}" for i in range(4)
+    ]
+    assert elapsed < 0.35  # 4 × 0.1 s if they ran one after another
+
+
+def test_invalid_member_only_fails_itself(server):
+    batch = [_send("ok", "hello"), {"jsonrpc": "2.0", "id": "bad", "method": "tasks/unknown", "params": {}}, "garbage"]
+    body = _post(server, batch).json()
+    assert body[0]["id"] == "ok" and "result" in body[0]
+    assert body[1]["id"] == "bad" and "error" in body[1]
+    assert body[2]["id"] is None and "error" in body[2]
+
+
+def test_batch_size_is_limited(server):
+    assert _post(server, []).status_code == 400
+    too_many = [_send(f"t{i}", "x") for i in range(6)]
+    response = _post(server, too_many, path="/agents/echo")
+    assert response.status_code == 400
+    assert "between 1 and 5" in response.json()["error"]["message"]
+
+
+def test_single_requests_still_work(server):
+    body = _post(server, _send("single", "hi")).json()
+    assert body["id"] == "single"
+    assert body["result"]["status"]["state"] == TaskState.COMPLETED
+
+
+def test_client_send_batch_matches_responses_to_requests(server, monkeypatch):
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        client_module.httpx, "AsyncClient",
+        lambda *args, **kwargs: real_client(*args, transport=httpx.ASGITransport(app=server.app), **kwargs),
+    )
+    client = A2AClient(url="http://server.test/")
+
+    async def scenario():
+        await client.send_batch([SendTaskRequest.model_validate(_send("a", "one"))])
+        return await client.send_batch([
+            GetTaskRequest(id="get-a", params=TaskQueryParams(id="a")),
+            GetTaskRequest(id="get-missing", params=TaskQueryParams(id="missing")),
+        ])
+
+    found, missing = asyncio.run(scenario())
+    assert found["result"]["id"] == "a"
+    assert "error" in missing
+
+    with pytest.raises(A2AClientHTTPError):
+        asyncio.run(client.send_batch([]))
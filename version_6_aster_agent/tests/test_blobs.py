@@ -0,0 +1,163 @@
+# =============================================================================
+# tests/test_blobs.py
+# =============================================================================
+# File content outside of JSON-RPC: BlobStore (content addressing, size
+# limits, LRU quota) and the /blobs endpoints round-tripped through A2AClient.
+# =============================================================================
+
+import os
+import asyncio
+import hashlib
+
+import httpx
+import pytest
+
+from client import client as client_module
+from client.client import A2AClient, A2AClientHTTPError
+from server.blob_store import BlobStore, BlobTooLargeError
+from server.server import A2AServer
+
+
+_AsyncClient = httpx.AsyncClient  # Before any test patches it
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+# -----------------------------------------------------------------------------
+# BlobStore
+# -----------------------------------------------------------------------------
+def test_stream_is_stored_under_its_sha256(tmp_path):
+    store = BlobStore(str(tmp_path), read_chunk_size=4)
+    info = asyncio.run(store.put_stream(_chunks(b"hello ", b"world")))
+    assert info.digest == _digest(b"hello world")
+    assert info.size == 11
+    assert store.size(info.digest) == 11
+    assert list(store.iter_chunks(info.digest)) == [b"hell", b"o wo", b"rld"]
+    assert os.listdir(os.path.join(str(tmp_path), "tmp")) == []
+
+
+def test_same_content_is_stored_once(tmp_path):
+    store = BlobStore(str(tmp_path))
+    first = store.put_bytes(b"same")
+    second = asyncio.run(store.put_stream(_chunks(b"sa", b"me")))
+    assert first == second
+    assert store.total_bytes == 4
+
+
+def test_empty_blob(tmp_path):
+    store = BlobStore(str(tmp_path))
+    info = store.put_bytes(b"")
+    assert list(store.iter_chunks(info.digest)) == []
+
+
+def test_too_large_uploads_are_rejected_and_leave_nothing(tmp_path):
+    store = BlobStore(str(tmp_path), max_bytes=8)
+    with pytest.raises(BlobTooLargeError):
+        asyncio.run(store.put_stream(_chunks(b"12345", b"67890")))
+    with pytest.raises(BlobTooLargeError):
+        asyncio.run(store.put_stream(_chunks(b"1"), expected_size=9))
+    with pytest.raises(BlobTooLargeError):
+        store.put_bytes(b"123456789")
+    assert store.total_bytes == 0
+    assert os.listdir(os.path.join(str(tmp_path), "tmp")) == []
+
+
+def test_quota_evicts_least_recently_used(tmp_path):
+    store = BlobStore(str(tmp_path), max_total_bytes=10)
+    a, b = store.put_bytes(b"aaaa"), store.put_bytes(b"bbbb")
+    store.touch(a.digest)  # Downloaded: now b is the oldest
+    c = store.put_bytes(b"cccc")
+    assert store.size(b.digest) is None
+    assert not os.path.exists(store.path(b.digest))
+    assert store.size(a.digest) == store.size(c.digest) == 4
+    assert store.total_bytes == 8
+
+
+def test_existing_blobs_are_indexed_on_start(tmp_path):
+    info = BlobStore(str(tmp_path)).put_bytes(b"persisted")
+    reopened = BlobStore(str(tmp_path))
+    assert reopened.size(info.digest) == 9
+    assert reopened.total_bytes == 9
+
+
+def test_invalid_digest(tmp_path):
+    store = BlobStore(str(tmp_path))
+    with pytest.raises(ValueError):
+        store.size("../etc/passwd")
+
+
+# -----------------------------------------------------------------------------
+# /blobs endpoints + A2AClient
+# -----------------------------------------------------------------------------
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    def make(server_token=None, client_token=None, **server_options):
+        server = A2AServer(port=0, loop_lag_threshold_ms=0, warm_up=False, blob_dir=str(tmp_path / "blobs"),
+                           blob_token=server_token, **server_options)
+        monkeypatch.setattr(
+            client_module.httpx, "AsyncClient",
+            lambda *args, **kwargs: _AsyncClient(*args, transport=httpx.ASGITransport(app=server.app), **kwargs),
+        )
+        monkeypatch.delenv("A2A_BLOB_TOKEN", raising=False)
+        return server, A2AClient(url="http://server.test/", blob_token=client_token)
+    return make
+
+
+def test_upload_and_download_round_trip(make_client, tmp_path):
+    server, client = make_client()
+    source = tmp_path / "data.bin"
+    source.write_bytes(os.urandom(300_000))
+
+    async def scenario():
+        part = await client.upload_blob(str(source), mime_type="application/octet-stream")
+        content = await client.download_blob(part)
+        saved = await client.download_blob(part, tmp_path / "copy.bin")
+        return part, content, saved
+
+    part, content, saved = asyncio.run(scenario())
+    assert part.file.name == "data.bin"
+    assert part.file.size == 300_000
+    assert part.file.uri == f"http://server.test/blobs/{_digest(source.read_bytes())}"
+    assert content == source.read_bytes()
+    assert open(saved, "rb").read() == source.read_bytes()
+
+
+def test_upload_requires_the_token(make_client):
+    _, client = make_client(server_token="secret", client_token="wrong")
+    with pytest.raises(A2AClientHTTPError) as info:
+        asyncio.run(client.upload_blob(b"data"))
+    assert info.value.args[0] == 401
+
+    _, client = make_client(server_token="secret", client_token="secret")
+    assert asyncio.run(client.upload_blob(b"data")).file.size == 4
+
+
+def test_upload_over_the_limit_is_413(make_client):
+    _, client = make_client(max_blob_bytes=4)
+    with pytest.raises(A2AClientHTTPError) as info:
+        asyncio.run(client.upload_blob(b"too large"))
+    assert info.value.args[0] == 413
+
+
+def test_missing_and_corrupt_downloads(make_client, tmp_path):
+    server, client = make_client()
+    missing = f"http://server.test/blobs/{_digest(b'nothing')}"
+    with pytest.raises(A2AClientHTTPError) as info:
+        asyncio.run(client.download_blob(missing))
+    assert info.value.args[0] == 404
+
+    stored = server.blob_store.put_bytes(b"original")
+    with open(server.blob_store.path(stored.digest), "wb") as f:
+        f.write(b"tampered")
+    target = tmp_path / "out.bin"
+    with pytest.raises(A2AClientHTTPError) as info:
+        asyncio.run(client.download_blob(f"http://server.test/blobs/{stored.digest}", target))
+    assert info.value.args[0] == 502
+    assert os.listdir(tmp_path) == ["blobs"]  # No partial or unverified file left behind
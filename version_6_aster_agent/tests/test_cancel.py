@@ -0,0 +1,114 @@
+# =============================================================================
+# tests/test_cancel.py
+# =============================================================================
+# tasks/cancel: stops the running agent job, marks the task CANCELED, and
+# AgentConnector forwards the cancellation to a delegated remote sub-task.
+# =============================================================================
+
+import asyncio
+
+from models.json_rpc import TaskNotCancelableError, TaskNotFoundError
+from models.request import CancelTaskRequest, SendTaskRequest
+from models.task import Message, TaskIdParams, TaskSendParams, TaskState, TextPart
+from server.task_manager import InMemoryTaskManager
+from utilities.a2a.agent_connect import AgentConnector
+
+
+class SlowTaskManager(InMemoryTaskManager):
+    """Works until cancelled (or until `done` is set); records whether it saw the cancellation."""
+
+    def __init__(self):
+        super().__init__()
+        self.started = asyncio.Event()
+        self.done = asyncio.Event()
+        self.interrupted = False
+
+    async def process_task(self, request, task):
+        await self.update_status(task, TaskState.WORKING)
+        self.started.set()
+        try:
+            await self.done.wait()  # Stands in for an LLM call or a delegated sub-task
+        except asyncio.CancelledError:
+            self.interrupted = True
+            raise
+        await self.update_status(task, TaskState.COMPLETED, Message(role="agent", parts=[TextPart(text="done")]))
+
+
+def _send(task_id: str = "t1", blocking: bool = False) -> SendTaskRequest:
+    return SendTaskRequest(params=TaskSendParams(
+        id=task_id, message=Message(role="user", parts=[TextPart(text="work")]), blocking=blocking,
+    ))
+
+
+def _cancel(task_id: str = "t1") -> CancelTaskRequest:
+    return CancelTaskRequest(params=TaskIdParams(id=task_id))
+
+
+def test_cancel_stops_the_running_job():
+    async def scenario():
+        manager = SlowTaskManager()
+        await manager.on_send_task(_send())
+        await manager.started.wait()
+        response = await manager.on_cancel_task(_cancel())
+        return manager, response
+
+    manager, response = asyncio.run(scenario())
+    assert manager.interrupted
+    assert response.error is None
+    assert response.result.status.state == TaskState.CANCELED
+    assert manager.tasks["t1"].state == TaskState.CANCELED
+    assert "t1" not in manager.running_tasks
+
+
+def test_cancel_unblocks_a_blocking_send():
+    async def scenario():
+        manager = SlowTaskManager()
+        send = asyncio.create_task(manager.on_send_task(_send(blocking=True)))
+        await manager.started.wait()
+        await manager.on_cancel_task(_cancel())
+        return await send
+
+    assert asyncio.run(scenario()).result.status.state == TaskState.CANCELED
+
+
+def test_cancel_unknown_task():
+    response = asyncio.run(SlowTaskManager().on_cancel_task(_cancel("missing")))
+    assert isinstance(response.error, TaskNotFoundError)
+
+
+def test_finished_task_is_not_cancelable():
+    async def scenario():
+        manager = SlowTaskManager()
+        manager.done.set()
+        await manager.on_send_task(_send(blocking=True))
+        return await manager.on_cancel_task(_cancel())
+
+    response = asyncio.run(scenario())
+    assert isinstance(response.error, TaskNotCancelableError)
+
+
+def test_cancelled_delegation_cancels_the_remote_task():
+    connector = AgentConnector("cancel_remote", "http://agent.test/")
+    started, cancelled = asyncio.Event(), []
+
+    async def send_task(payload):
+        started.set()
+        await asyncio.sleep(60)
+
+    async def cancel_task(payload):
+        cancelled.append(payload["id"])
+
+    connector.client.send_task = send_task
+    connector.client.cancel_task = cancel_task
+
+    async def scenario():
+        delegation = asyncio.create_task(connector.send_task("hi", "s1"))
+        await started.wait()
+        delegation.cancel()
+        await asyncio.wait({delegation})
+        return delegation
+
+    delegation = asyncio.run(scenario())
+    assert delegation.cancelled()
+    assert len(cancelled) == 1
+    assert connector.health.available  # A cancellation says nothing about the agent's health
@@ -0,0 +1,70 @@
+# =============================================================================
+# tests/test_discovery.py
+# =============================================================================
+# AgentRegistry: capability lookups (single, AND, OR) in registration
+# order, and copy-on-write snapshots that never change under a reader.
+# =============================================================================
+
+from types import SimpleNamespace
+
+from ADK.discovery import AgentRegistry
+
+
+def _agent(name: str, capabilities=(), tags=()):
+    return SimpleNamespace(name=name, capabilities=list(capabilities), tags=list(tags))
+
+
+def _names(agents) -> list:
+    return [agent.name for agent in agents]
+
+
+def _registry() -> AgentRegistry:
+    registry = AgentRegistry()
+    registry.register("weather", _agent("weather", ["forecast", "search"], ["outdoor"]))
+    registry.register("city", _agent("city", ["search"], ["travel"]))
+    registry.register("flights", _agent("flights", ["booking", "search"], ["travel"]))
+    return registry
+
+
+def test_discover_uses_capabilities_and_tags_in_registration_order():
+    registry = _registry()
+    assert _names(registry.discover("search")) == ["weather", "city", "flights"]
+    assert _names(registry.discover("travel")) == ["city", "flights"]
+    assert registry.discover("unknown") == []
+
+
+def test_discover_all_and_any():
+    registry = _registry()
+    assert _names(registry.discover_all("search", "travel")) == ["city", "flights"]
+    assert _names(registry.discover_all("search", "travel", "booking")) == ["flights"]
+    assert registry.discover_all("forecast", "booking") == []
+    assert registry.discover_all() == []
+    assert _names(registry.discover_any("forecast", "booking")) == ["weather", "flights"]
+
+
+def test_snapshots_are_immutable_versions():
+    registry = _registry()
+    before = registry.snapshot()
+    registry.unregister("city")
+    registry.register("hotels", _agent("hotels", ["booking"], ["travel"]))
+    assert registry.version == before.version + 2
+    assert _names(before.discover("travel")) == ["city", "flights"]
+    assert _names(registry.discover("travel")) == ["flights", "hotels"]
+    assert "city" not in registry.agents
+
+
+def test_re_registering_keeps_position_and_updates_capabilities():
+    registry = _registry()
+    registry.register("weather", _agent("weather", ["booking"]))
+    assert _names(registry.discover("booking")) == ["weather", "flights"]
+    assert "forecast" not in registry.snapshot().capabilities()
+    assert _names(registry.discover("search")) == ["city", "flights"]
+
+
+def test_register_many_publishes_one_version():
+    registry = AgentRegistry()
+    registry.register_many({"a": _agent("a", ["x"]), "b": _agent("b", ["x"])})
+    assert registry.version == 1
+    assert _names(registry.discover("x")) == ["a", "b"]
+    registry.unregister("missing")
+    assert _names(registry.discover("x")) == ["a", "b"]
@@ -0,0 +1,203 @@
+# =============================================================================
+# tests/test_health.py
+# =============================================================================
+# Circuit breakers: CLOSED → OPEN → HALF_OPEN → CLOSED transitions, probe
+# streaks, what counts as a failed call in AgentConnector, and the
+# circuit-state gauge (which must neither change the state nor keep a
+# breaker alive).
+# =============================================================================
+
+import gc
+import asyncio
+import weakref
+
+import httpx
+import pytest
+
+from client.client import A2AClientHTTPError
+from models.task import Task, TaskState, TaskStatus
+from utilities.a2a import health as health_module
+from utilities.a2a.agent_connect import AgentConnector
+from utilities.a2a.health import CLOSED, HALF_OPEN, OPEN, BreakerPolicy, CircuitBreaker, CircuitOpenError, circuit_state
+
+POLICY = BreakerPolicy(failure_threshold=3, reset_timeout=30, half_open_calls=1)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(health_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(breaker.policy.failure_threshold):
+        breaker.acquire()
+        breaker.record_failure("down")
+
+
+def _gauge_value(name: str) -> float | None:
+    for line in circuit_state.render():
+        if f'agent="{name}"' in line:
+            return float(line.rsplit(" ", 1)[1])
+    return None
+
+
+def test_consecutive_failures_open_the_circuit(clock):
+    breaker = CircuitBreaker("health_open", POLICY)
+    breaker.record_failure("1")
+    breaker.record_failure("2")
+    breaker.record_success()  # Resets the streak
+    breaker.record_failure("3")
+    breaker.record_failure("4")
+    assert breaker.state == CLOSED
+    breaker.record_failure("5")
+    assert breaker.state == OPEN
+    assert not breaker.available
+    with pytest.raises(CircuitOpenError, match="5"):
+        breaker.acquire()
+
+
+def test_half_open_trial_closes_or_reopens(clock):
+    breaker = CircuitBreaker("health_trial", POLICY)
+    _open(breaker)
+    clock[0] += 30
+    assert breaker.state == HALF_OPEN
+    breaker.acquire()  # The single trial slot
+    assert not breaker.available
+    with pytest.raises(CircuitOpenError):
+        breaker.acquire()
+    breaker.record_failure("still down")
+    assert breaker.state == OPEN
+
+    clock[0] += 30
+    breaker.acquire()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+def test_release_frees_a_trial_slot(clock):
+    breaker = CircuitBreaker("health_release", POLICY)
+    _open(breaker)
+    clock[0] += 30
+    breaker.acquire()
+    breaker.release()
+    assert breaker.available
+    assert breaker.state == HALF_OPEN
+
+
+def test_probe_streak_is_reset_by_a_successful_probe(clock):
+    breaker = CircuitBreaker("health_probe_streak", POLICY)
+    for _ in range(10):
+        breaker.probe_failed("timeout")
+        breaker.probe_failed("timeout")
+        breaker.probe_succeeded()
+    assert breaker.state == CLOSED
+    for _ in range(3):
+        breaker.probe_failed("timeout")
+    assert breaker.state == OPEN
+
+
+def test_probe_streak_is_separate_from_call_failures(clock):
+    breaker = CircuitBreaker("health_probe_separate", POLICY)
+    breaker.record_failure("call")
+    breaker.record_failure("call")
+    breaker.probe_failed("probe")
+    assert breaker.state == CLOSED
+
+
+def test_probe_only_closes_a_circuit_due_for_a_trial(clock):
+    breaker = CircuitBreaker("health_probe_close", POLICY)
+    _open(breaker)
+    breaker.probe_succeeded()
+    assert breaker.state == OPEN
+    clock[0] += 30
+    breaker.probe_succeeded()
+    assert breaker.state == CLOSED
+
+
+def test_scraping_the_gauge_does_not_move_open_to_half_open(clock):
+    breaker = CircuitBreaker("health_gauge_state", POLICY)
+    _open(breaker)
+    clock[0] += 60
+    assert _gauge_value("health_gauge_state") == 2
+    assert breaker._state == OPEN
+    assert breaker.state == HALF_OPEN
+    assert _gauge_value("health_gauge_state") == 1
+
+
+def test_gauge_does_not_keep_the_breaker_alive():
+    breaker = CircuitBreaker("health_gauge_weak", POLICY)
+    ref = weakref.ref(breaker)
+    del breaker
+    gc.collect()
+    assert ref() is None
+    assert _gauge_value("health_gauge_weak") == 0
+
+
+def test_discard_stops_exporting_the_breaker():
+    breaker = CircuitBreaker("health_discard", POLICY)
+    breaker.discard()
+    assert _gauge_value("health_discard") is None
+
+
+# -----------------------------------------------------------------------------
+# AgentConnector: what counts against an agent's health
+# -----------------------------------------------------------------------------
+def _connector(name: str, outcome) -> AgentConnector:
+    connector = AgentConnector(name, "http://agent.test/", BreakerPolicy(failure_threshold=2))
+
+    async def send_task(payload):
+        if isinstance(outcome, Exception):
+            raise outcome
+        return Task(id=payload["id"], status=TaskStatus(state=outcome), history=[])
+
+    connector.client.send_task = send_task
+    return connector
+
+
+def _send_twice(connector: AgentConnector) -> None:
+    async def scenario():
+        for _ in range(2):
+            try:
+                await connector.send_task("hi", "s1")
+            except Exception:
+                pass
+    asyncio.run(scenario())
+
+
+def test_failed_tasks_count_against_the_agent():
+    connector = _connector("health_failed_task", TaskState.FAILED)
+    _send_twice(connector)
+    assert connector.health.state == OPEN
+
+
+def test_server_errors_count_against_the_agent():
+    connector = _connector("health_5xx", A2AClientHTTPError(503, "unavailable"))
+    _send_twice(connector)
+    assert connector.health.state == OPEN
+
+
+def test_rejected_requests_do_not_count_against_the_agent():
+    connector = _connector("health_4xx", A2AClientHTTPError(400, "bad request"))
+    _send_twice(connector)
+    assert connector.health.state == CLOSED
+
+
+def test_completed_tasks_keep_the_circuit_closed():
+    connector = _connector("health_ok", TaskState.COMPLETED)
+    _send_twice(connector)
+    assert connector.health.state == CLOSED
+
+
+def test_probe_reports_to_the_breaker():
+    connector = AgentConnector("health_probe", "http://agent.test/", BreakerPolicy(failure_threshold=1))
+
+    async def probe(status):
+        transport = httpx.MockTransport(lambda request: httpx.Response(status, json={}))
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await connector.probe(client)
+
+    assert asyncio.run(probe(200))
+    assert asyncio.run(probe(503)) is False
+    assert connector.health.state == OPEN
@@ -0,0 +1,153 @@
+# =============================================================================
+# tests/test_hedging.py
+# =============================================================================
+# Hedged delegations: the latency percentile that sets the hedge delay, the
+# hedge budget, and ReplicaConnector racing a slow replica against another.
+# Replica calls are replaced by fakes, so no agent server is needed.
+# =============================================================================
+
+import asyncio
+
+import pytest
+
+from models.task import Task, TaskState, TaskStatus
+from utilities.a2a.hedging import HedgePolicy, LatencyHistogram
+from utilities.a2a.load_balancer import ReplicaConnector
+
+URLS = ["http://r1.test/", "http://r2.test/"]
+
+
+def _task(replica: str) -> Task:
+    return Task(id=replica, status=TaskStatus(state=TaskState.COMPLETED), history=[])
+
+
+def _fake_send(replica: str, delay: float, calls: list, cancelled: list | None = None, error: Exception | None = None):
+    async def send_task(message, session_id):
+        calls.append(replica)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            if cancelled is not None:
+                cancelled.append(replica)
+            raise
+        if error is not None:
+            raise error
+        return _task(replica)
+    return send_task
+
+
+def _connector(delays: dict, hedge: HedgePolicy | None, calls: list, cancelled: list | None = None,
+               errors: dict | None = None) -> ReplicaConnector:
+    connector = ReplicaConnector("hedged_agent", URLS, hedge=hedge)
+    for url, replica in connector._replicas.items():
+        replica.connector.send_task = _fake_send(url, delays[url], calls, cancelled, (errors or {}).get(url))
+    return connector
+
+
+def _warm(connector: ReplicaConnector, seconds: float, samples: int = 50) -> None:
+    for _ in range(samples):
+        connector.latency.observe(seconds)
+
+
+def test_histogram_percentile_is_within_one_bucket():
+    histogram = LatencyHistogram()
+    for i in range(1, 101):
+        histogram.observe(i / 1000)  # 1 ms .. 100 ms
+    assert 0.050 <= histogram.percentile(0.5) <= 0.050 * 1.1
+    assert 0.095 <= histogram.percentile(0.95) <= 0.095 * 1.1
+    assert LatencyHistogram().percentile(0.95) == 0.0
+
+
+def test_histogram_decay_follows_recent_latencies():
+    histogram = LatencyHistogram(half_life=100)
+    for _ in range(100):
+        histogram.observe(1.0)
+    for _ in range(400):
+        histogram.observe(0.01)
+    assert histogram.percentile(0.9) < 0.02
+
+
+def test_no_hedging_without_policy_or_enough_samples():
+    calls = []
+    assert _connector({URLS[0]: 0, URLS[1]: 0}, None, calls)._hedge_delay() is None
+    connector = _connector({URLS[0]: 0, URLS[1]: 0}, HedgePolicy(min_samples=20), calls)
+    _warm(connector, 0.1, samples=19)
+    assert connector._hedge_delay() is None
+    _warm(connector, 0.1, samples=1)
+    assert connector._hedge_delay() == pytest.approx(0.1, rel=0.1)
+
+
+def test_hedge_delay_is_clamped():
+    connector = _connector({URLS[0]: 0, URLS[1]: 0}, HedgePolicy(min_delay=0.05, max_delay=1.0), [])
+    _warm(connector, 0.001)
+    assert connector._hedge_delay() == 0.05
+    _warm(connector, 100.0, samples=500)
+    assert connector._hedge_delay() == 1.0
+
+
+def test_hedge_budget_starts_empty():
+    connector = _connector({URLS[0]: 0, URLS[1]: 0}, HedgePolicy(budget=0.5, burst=10), [])
+    assert connector._hedge_budget.tokens == 0
+    assert not connector._hedge_budget.spend()
+
+
+def test_slow_primary_is_hedged_and_the_hedge_wins():
+    async def scenario():
+        calls, cancelled = [], []
+        connector = _connector({URLS[0]: 1.0, URLS[1]: 0.0}, HedgePolicy(min_delay=0.01, budget=1.0), calls, cancelled)
+        _warm(connector, 0.01)
+        connector._hedge_budget.tokens = 1.0
+        connector._choose = lambda session_id: connector._replicas[URLS[0]]
+        task = await connector.send_task("hello", "s1")
+        await asyncio.sleep(0)  # Let the loser's cancellation run
+        return task, calls, cancelled, connector
+
+    task, calls, cancelled, connector = asyncio.run(scenario())
+    assert task.id == URLS[1]
+    assert calls == URLS
+    assert cancelled == [URLS[0]]
+    assert all(replica.in_flight == 0 for replica in connector._replicas.values())
+
+
+def test_fast_primary_is_not_hedged():
+    async def scenario():
+        calls = []
+        connector = _connector({URLS[0]: 0.0, URLS[1]: 0.0}, HedgePolicy(min_delay=0.5, budget=1.0), calls)
+        _warm(connector, 0.5)
+        connector._hedge_budget.tokens = 1.0
+        connector._choose = lambda session_id: connector._replicas[URLS[0]]
+        return await connector.send_task("hello", "s1"), calls
+
+    task, calls = asyncio.run(scenario())
+    assert task.id == URLS[0]
+    assert calls == [URLS[0]]
+
+
+def test_no_hedge_without_budget():
+    async def scenario():
+        calls = []
+        connector = _connector({URLS[0]: 0.05, URLS[1]: 0.0}, HedgePolicy(min_delay=0.01, budget=0.01), calls)
+        _warm(connector, 0.01)
+        connector._choose = lambda session_id: connector._replicas[URLS[0]]
+        return await connector.send_task("hello", "s1"), calls
+
+    task, calls = asyncio.run(scenario())
+    assert task.id == URLS[0]
+    assert calls == [URLS[0]]
+
+
+def test_failed_hedge_falls_back_to_the_primary():
+    async def scenario():
+        calls = []
+        connector = _connector(
+            {URLS[0]: 0.05, URLS[1]: 0.0}, HedgePolicy(min_delay=0.01, budget=1.0), calls,
+            errors={URLS[1]: RuntimeError("replica down")},
+        )
+        _warm(connector, 0.01)
+        connector._hedge_budget.tokens = 1.0
+        connector._choose = lambda session_id: connector._replicas[URLS[0]]
+        return await connector.send_task("hello", "s1"), calls
+
+    task, calls = asyncio.run(scenario())
+    assert task.id == URLS[0]
+    assert calls == URLS
@@ -0,0 +1,113 @@
+# =============================================================================
+# tests/test_load_balancer.py
+# =============================================================================
+# ReplicaConnector balancing: least-outstanding and EWMA choice, session
+# affinity on the hash ring, skipping open circuits, and replica set changes.
+# =============================================================================
+
+import asyncio
+
+import pytest
+
+from models.task import Task, TaskState, TaskStatus
+from utilities.a2a.health import BreakerPolicy, CircuitOpenError, circuit_state
+from utilities.a2a.load_balancer import EWMA, BalancerPolicy, ReplicaConnector, replica_count, replica_in_flight
+
+URLS = [f"http://r{i}.test/" for i in range(1, 5)]
+
+
+def _open_circuit(connector: ReplicaConnector, url: str) -> None:
+    breaker = connector._replicas[url].connector.health
+    for _ in range(breaker.policy.failure_threshold):
+        breaker.record_failure("down")
+
+
+def _labels(metric) -> list:
+    return [line for line in metric.render() if not line.startswith("#")]
+
+
+def test_least_outstanding_picks_the_idlest_replica():
+    connector = ReplicaConnector("lb_least", URLS[:3])
+    busy = connector._replicas
+    busy[URLS[0]].in_flight, busy[URLS[1]].in_flight, busy[URLS[2]].in_flight = 3, 1, 2
+    assert all(connector._choose(None).url == URLS[1] for _ in range(20))
+
+
+def test_ewma_prefers_fast_replicas_and_tries_untried_ones():
+    connector = ReplicaConnector("lb_ewma", URLS[:3], BalancerPolicy(strategy=EWMA))
+    replicas = connector._replicas
+    replicas[URLS[0]].ewma, replicas[URLS[1]].ewma = 0.5, 0.1
+    assert connector._choose(None).url == URLS[2]  # Untried: scores 0
+    replicas[URLS[2]].ewma = 0.3
+    assert connector._choose(None).url == URLS[1]
+    replicas[URLS[1]].in_flight = 4  # 0.1 × 5 > 0.3 × 1
+    assert connector._choose(None).url == URLS[2]
+
+
+def test_affinity_keeps_a_session_on_one_replica():
+    connector = ReplicaConnector("lb_affinity", URLS[:3], BalancerPolicy(affinity=True))
+    owners = {f"session-{i}": connector._choose(f"session-{i}").url for i in range(300)}
+    assert all(connector._choose(session).url == owner for session, owner in owners.items())
+    assert len(set(owners.values())) == 3
+
+
+def test_adding_a_replica_moves_only_some_sessions():
+    connector = ReplicaConnector("lb_ring", URLS[:3], BalancerPolicy(affinity=True))
+    sessions = [f"session-{i}" for i in range(1000)]
+    before = {session: connector._choose(session).url for session in sessions}
+    connector.set_replicas(URLS)
+    after = {session: connector._choose(session).url for session in sessions}
+    moved = [session for session in sessions if before[session] != after[session]]
+    assert all(after[session] == URLS[3] for session in moved)  # Only onto the new replica
+    assert 0.1 < len(moved) / len(sessions) < 0.45               # About 1/4 of sessions
+
+
+def test_open_circuits_are_skipped():
+    connector = ReplicaConnector("lb_skip", URLS[:2], BalancerPolicy(affinity=True))
+    session = "sticky"
+    owner = connector._choose(session).url
+    _open_circuit(connector, owner)
+    other = connector._choose(session).url
+    assert other != owner
+    assert all(connector._choose(None).url == other for _ in range(10))
+    _open_circuit(connector, other)
+    assert not connector.available
+    with pytest.raises(CircuitOpenError):
+        connector._choose(session)
+
+
+def test_set_replicas_keeps_stats_and_drops_removed_metrics():
+    connector = ReplicaConnector("lb_set", URLS[:2], breaker=BreakerPolicy())
+    kept = connector._replicas[URLS[1]]
+    kept.ewma = 0.2
+    replica_in_flight.labels(agent="lb_set", replica="r1.test").inc()
+    connector.set_replicas([URLS[1], URLS[2], URLS[2]])
+    assert connector.urls == [URLS[1], URLS[2]]
+    assert connector._replicas[URLS[1]] is kept
+    assert not any('replica="r1.test"' in line for line in _labels(replica_in_flight) if "lb_set" in line)
+    assert not any('agent="lb_set@r1.test"' in line for line in _labels(circuit_state))
+    assert 'a2a_connector_replicas{agent="lb_set"} 2.0' in _labels(replica_count)
+    with pytest.raises(ValueError):
+        connector.set_replicas([])
+
+
+def test_send_tracks_in_flight_and_latency():
+    async def scenario():
+        connector = ReplicaConnector("lb_send", URLS[:1])
+        replica = connector._replicas[URLS[0]]
+        seen = []
+
+        async def send_task(message, session_id):
+            seen.append(replica.in_flight)
+            await asyncio.sleep(0.01)
+            return Task(id="t", status=TaskStatus(state=TaskState.COMPLETED), history=[])
+
+        replica.connector.send_task = send_task
+        await connector.send_task("hi", "s1")
+        return replica, seen, connector
+
+    replica, seen, connector = asyncio.run(scenario())
+    assert seen == [1]
+    assert replica.in_flight == 0
+    assert replica.ewma >= 0.01
+    assert connector.latency.count == 1
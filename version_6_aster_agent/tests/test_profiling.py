@@ -0,0 +1,41 @@
+# =============================================================================
+# tests/test_profiling.py
+# =============================================================================
+# Profiling is opt-in: the event-loop lag monitor and /admin/profile only
+# exist when configured.
+# =============================================================================
+
+import pytest
+
+from server.server import A2AServer
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    monkeypatch.delenv("A2A_LOOP_LAG_THRESHOLD_MS", raising=False)
+    monkeypatch.delenv("A2A_ADMIN_TOKEN", raising=False)
+
+
+def _server(tmp_path, **options) -> A2AServer:
+    return A2AServer(port=0, warm_up=False, blob_dir=str(tmp_path), **options)
+
+
+def _paths(server: A2AServer) -> list:
+    return [route.path for route in server.app.routes]
+
+
+def test_off_by_default(tmp_path):
+    server = _server(tmp_path)
+    assert server.lag_monitor is None
+    assert "/admin/profile" not in _paths(server)
+
+
+def test_lag_monitor_from_parameter_or_environment(tmp_path, monkeypatch):
+    assert _server(tmp_path, loop_lag_threshold_ms=50).lag_monitor.threshold == 0.05
+    monkeypatch.setenv("A2A_LOOP_LAG_THRESHOLD_MS", "200")
+    assert _server(tmp_path).lag_monitor.threshold == 0.2
+    assert _server(tmp_path, loop_lag_threshold_ms=0).lag_monitor is None
+
+
+def test_profile_endpoint_needs_an_admin_token(tmp_path):
+    assert "/admin/profile" in _paths(_server(tmp_path, admin_token="secret"))
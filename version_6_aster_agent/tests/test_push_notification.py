@@ -0,0 +1,135 @@
+# =============================================================================
+# tests/test_push_notification.py
+# =============================================================================
+# Webhook delivery: batches posted to a local webhook stand-in, retries,
+# and deliveries that can never succeed (bad URLs) going to dead letters
+# without stopping the worker or the rest of their batch.
+# =============================================================================
+
+import os
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+
+from benchmarks.harness import ServerThread, free_port
+from models.request import SetTaskPushNotificationRequest
+from models.task import PushNotificationConfig
+from server.push_notification import PushDelivery, PushNotificationSender
+
+
+@pytest.fixture(scope="module")
+def webhook():
+    """A local webhook receiver: records (path, token, payload) of every POST; /flaky fails once."""
+    received, failed = [], set()  # Only touched on the server's event loop
+    app = Starlette()
+
+    async def hook(request):
+        path = request.url.path
+        if path.endswith("/flaky") and path not in failed:
+            failed.add(path)
+            return JSONResponse({}, status_code=503)
+        payload = await request.json()
+        received.append((path, request.headers.get(PushNotificationSender.TOKEN_HEADER), payload))
+        return JSONResponse({})
+
+    app.add_route("/{name:path}", hook, methods=["POST"])
+    with ServerThread(app, free_port()) as url:
+        yield url.rstrip("/"), received
+
+
+async def _drain(sender: PushNotificationSender, received: list, expected: int, timeout: float = 5.0) -> None:
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while len(received) < expected and loop.time() < deadline:
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.05)  # Let workers finish their spool bookkeeping
+
+
+def _sender(tmp_path, **options) -> PushNotificationSender:
+    return PushNotificationSender(spool_dir=str(tmp_path / "spool"), workers=1, backoff_base=0.01, **options)
+
+
+def _spooled(sender: PushNotificationSender, subdir: str = "") -> list:
+    directory = os.path.join(sender.spool_dir, subdir)
+    return sorted(name for name in os.listdir(directory) if name.endswith(".json")) if os.path.isdir(directory) else []
+
+
+def test_deliveries_are_posted_with_token_and_unspooled(webhook, tmp_path):
+    url, received = webhook
+    received.clear()
+
+    async def scenario():
+        sender = _sender(tmp_path)
+        for i in range(5):
+            await sender.enqueue(PushNotificationConfig(url=f"{url}/ok/{i}", token="secret"), {"n": i})
+        await _drain(sender, received, 5)
+        await sender.stop()
+        return sender
+
+    sender = asyncio.run(scenario())
+    assert sorted(payload["n"] for _, _, payload in received) == list(range(5))
+    assert {token for _, token, _ in received} == {"secret"}
+    assert _spooled(sender) == []
+
+
+def test_failed_delivery_is_retried(webhook, tmp_path):
+    url, received = webhook
+    received.clear()
+
+    async def scenario():
+        sender = _sender(tmp_path)
+        await sender.enqueue(PushNotificationConfig(url=f"{url}/retry/flaky"), {"n": 1})
+        await _drain(sender, received, 1)
+        await sender.stop()
+        return sender
+
+    sender = asyncio.run(scenario())
+    assert [path for path, _, _ in received] == ["/retry/flaky"]
+    assert _spooled(sender) == []
+
+
+def test_bad_url_in_a_batch_does_not_stop_the_others(webhook, tmp_path):
+    url, received = webhook
+    received.clear()
+
+    async def scenario():
+        sender = _sender(tmp_path)
+        await sender.start()
+        # Bad URLs can only arrive through an old spool file; registration rejects them
+        batch = [
+            PushDelivery(url=f"{url}/batch/1", payload={"n": 1}),
+            PushDelivery(url="https://xn--/", payload={"n": "idna"}),
+            PushDelivery(url="http://bad\x00host/", payload={"n": "nul"}),
+            PushDelivery(url=f"{url}/batch/2", payload={"n": 2}),
+        ]
+        for delivery in batch:
+            sender._write_spool(delivery)
+            sender._queue.put_nowait(delivery)
+        await _drain(sender, received, 2)
+        worker_alive = not sender._worker_tasks[0].done()
+
+        # The same worker still delivers afterwards
+        await sender.enqueue(PushNotificationConfig(url=f"{url}/batch/3"), {"n": 3})
+        await _drain(sender, received, 3)
+        await sender.stop()
+        return sender, batch, worker_alive
+
+    sender, batch, worker_alive = asyncio.run(scenario())
+    assert worker_alive
+    assert sorted(payload["n"] for _, _, payload in received) == [1, 2, 3]
+    assert _spooled(sender) == []
+    assert _spooled(sender, "dead") == sorted(f"{d.id}.json" for d in batch[1:3])
+
+    # A restart doesn't resume dead letters
+    assert _sender(tmp_path)._load_spool() == []
+
+
+@pytest.mark.parametrize("url", ["https://xn--/", "http://bad\x00host/", "ftp://example.com/hook", "/hook", "http:///hook"])
+def test_bad_webhook_urls_are_rejected_at_registration(url):
+    with pytest.raises(ValidationError):
+        PushNotificationConfig(url=url)
+    with pytest.raises(ValidationError):
+        SetTaskPushNotificationRequest(params={"id": "t1", "pushNotificationConfig": {"url": url}})
@@ -0,0 +1,44 @@
+# =============================================================================
+# tests/test_representation.py
+# =============================================================================
+# DataPart replies are rendered only where text is needed: formatted for
+# people (to_text), compact JSON for an orchestrating LLM (to_llm_text).
+# =============================================================================
+
+import json
+
+from models.task import DataPart, FileContent, FilePart, Message, TextPart
+from representation.text import to_llm_text, to_text
+
+WEATHER = {"data": [{"city": "Seoul", "temp": "21°C", "condition": "Sunny", "tip": "Sunscreen"}]}
+
+
+def _reply(*parts) -> Message:
+    return Message(role="agent", parts=list(parts))
+
+
+def test_known_schema_is_formatted_for_people():
+    text = to_text(_reply(DataPart(data=WEATHER, metadata={"schema": "weather"})))
+    assert text == "🌆 Seoul\n🌡️ Temp: 21°C\n🌤️ Condition: Sunny\n💡 Tip: Sunscreen"
+
+
+def test_empty_payload_has_a_message():
+    assert to_text(_reply(DataPart(data={"data": []}, metadata={"schema": "city"}))) == "No city information found."
+
+
+def test_unknown_schema_falls_back_to_compact_json():
+    text = to_text(_reply(DataPart(data={"b": 1, "a": "é"})))
+    assert text == '{"b":1,"a":"é"}'
+
+
+def test_llm_text_is_compact_json_even_for_known_schemas():
+    text = to_llm_text(_reply(TextPart(text="Here you go"), DataPart(data=WEATHER, metadata={"schema": "weather"})))
+    first, second = text.split("\n")
+    assert first == "Here you go"
+    assert second == json.dumps(WEATHER, ensure_ascii=False, separators=(",", ":"))
+
+
+def test_file_parts_and_missing_messages():
+    file = FilePart(file=FileContent(name="map.png", mimeType="image/png", uri="http://a.test/blobs/x"))
+    assert to_text(_reply(file)) == "[file map.png (image/png): http://a.test/blobs/x]"
+    assert to_text(None) == to_llm_text(None) == ""
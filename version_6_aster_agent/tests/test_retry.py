@@ -0,0 +1,157 @@
+# =============================================================================
+# tests/test_retry.py
+# =============================================================================
+# A2AClient retries: which failures are retried, the backoff between
+# attempts, Retry-After, and the retry budget (utilities/budget.py).
+# =============================================================================
+
+import asyncio
+
+import httpx
+import pytest
+
+from client import client as client_module
+from client.client import A2AClient, A2AClientHTTPError
+from client.retry import NO_RETRY, RetryPolicy
+from utilities.budget import TokenBudget
+
+
+class FlakyPost:
+    """Stands in for A2AClient._post_once: raises `errors` in order, then succeeds."""
+
+    def __init__(self, *errors: BaseException):
+        self.errors = list(errors)
+        self.calls = 0
+
+    async def __call__(self, body):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"jsonrpc": "2.0", "id": body["id"], "result": "ok"}
+
+
+def _http_error(status: int, retry_after: float | None = None) -> A2AClientHTTPError:
+    error = A2AClientHTTPError(status, f"HTTP {status}")
+    error.retry_after = retry_after
+    return error
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record backoff delays instead of sleeping."""
+    delays = []
+
+    async def fake_sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr(client_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def _client(monkeypatch, post: FlakyPost, retry: RetryPolicy | None = None) -> A2AClient:
+    client = A2AClient(url="http://agent.test/", retry=retry)
+    monkeypatch.setattr(client, "_post_once", post)
+    return client
+
+
+def test_backoff_is_full_jitter_capped_at_max_delay():
+    policy = RetryPolicy(base_delay=0.1, max_delay=0.5)
+    for attempt, bound in [(1, 0.1), (2, 0.2), (3, 0.4), (4, 0.5), (10, 0.5)]:
+        assert all(0 <= policy.backoff(attempt) <= bound for _ in range(200))
+
+
+def test_retry_after_overrides_backoff_but_is_capped():
+    policy = RetryPolicy(max_delay=2.0)
+    assert policy.backoff(1, retry_after=1.5) == 1.5
+    assert policy.backoff(1, retry_after=30) == 2.0
+
+
+def test_retryable_statuses_and_exceptions():
+    policy = RetryPolicy()
+    assert policy.retryable(_http_error(503), 503)
+    assert policy.retryable(_http_error(429), 429)
+    assert not policy.retryable(_http_error(500), 500)
+    assert not policy.retryable(_http_error(400), 400)
+    assert policy.retryable(httpx.ConnectError("refused"))
+    assert policy.retryable(httpx.ReadTimeout("slow"))
+    assert not policy.retryable(ValueError("bug"))
+
+
+def test_transient_failures_are_retried_until_success(monkeypatch, sleeps):
+    post = FlakyPost(_http_error(502), httpx.ConnectError("refused"))
+    client = _client(monkeypatch, post)
+    assert asyncio.run(client._post({"id": 1}))["result"] == "ok"
+    assert post.calls == 3
+    assert len(sleeps) == 2
+
+
+def test_gives_up_after_max_attempts(monkeypatch, sleeps):
+    post = FlakyPost(*[_http_error(503)] * 5)
+    client = _client(monkeypatch, post, RetryPolicy(max_attempts=3))
+    with pytest.raises(A2AClientHTTPError):
+        asyncio.run(client._post({"id": 1}))
+    assert post.calls == 3
+
+
+def test_non_retryable_errors_fail_at_once(monkeypatch, sleeps):
+    post = FlakyPost(_http_error(400))
+    with pytest.raises(A2AClientHTTPError):
+        asyncio.run(_client(monkeypatch, post)._post({"id": 1}))
+    assert post.calls == 1
+    assert not sleeps
+
+
+def test_no_retry_policy(monkeypatch, sleeps):
+    post = FlakyPost(_http_error(503))
+    with pytest.raises(A2AClientHTTPError):
+        asyncio.run(_client(monkeypatch, post, NO_RETRY)._post({"id": 1}))
+    assert post.calls == 1
+
+
+def test_server_retry_after_is_used(monkeypatch, sleeps):
+    post = FlakyPost(_http_error(429, retry_after=0.75))
+    asyncio.run(_client(monkeypatch, post)._post({"id": 1}))
+    assert sleeps == [0.75]
+
+
+def test_retries_stop_when_the_budget_is_spent(monkeypatch, sleeps):
+    # Burst of 2 retries, almost nothing earned back per request
+    post = FlakyPost(*[_http_error(503)] * 10)
+    client = _client(monkeypatch, post, RetryPolicy(max_attempts=10, budget=0.01, burst=2))
+    with pytest.raises(A2AClientHTTPError):
+        asyncio.run(client._post({"id": 1}))
+    assert post.calls == 3  # First try + the 2 retries the budget allowed
+
+
+def test_token_budget_earns_up_to_burst():
+    budget = TokenBudget(ratio=0.5, burst=1, tokens=0)
+    assert not budget.spend()
+    budget.earn()
+    assert not budget.spend()
+    budget.earn()
+    budget.earn()  # Capped at burst
+    assert budget.tokens == 1
+    assert budget.spend()
+    assert not budget.spend()
+
+
+def test_http_errors_carry_retry_after(monkeypatch):
+    def handler(request):
+        return httpx.Response(503, headers={"Retry-After": "3"})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        client_module.httpx, "AsyncClient",
+        lambda *args, **kwargs: real_client(*args, transport=httpx.MockTransport(handler), **kwargs),
+    )
+    with pytest.raises(A2AClientHTTPError) as info:
+        asyncio.run(A2AClient(url="http://agent.test/")._post_once({"id": 1}))
+    assert info.value.args[0] == 503
+    assert info.value.retry_after == 3.0
+
+
+def test_retry_after_header_forms():
+    assert client_module._retry_after(httpx.Response(503, headers={"Retry-After": "2.5"})) == 2.5
+    assert client_module._retry_after(httpx.Response(503, headers={"Retry-After": "-1"})) == 0.0
+    assert client_module._retry_after(httpx.Response(503, headers={"Retry-After": "Wed, 21 Oct 2026 07:28:00 GMT"})) is None
+    assert client_module._retry_after(httpx.Response(503)) is None
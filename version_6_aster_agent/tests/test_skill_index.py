@@ -0,0 +1,80 @@
+# =============================================================================
+# tests/test_skill_index.py
+# =============================================================================
+# SkillIndex: top-k agents for a query, and in-place row updates when agent
+# cards are added, changed or removed.
+# =============================================================================
+
+import pytest
+
+np = pytest.importorskip("numpy")  # SkillIndex is optional; the orchestrator runs without it
+
+from models.agent import AgentCapabilities, AgentCard, AgentSkill
+from utilities.a2a.skill_index import HashingVectorizer, SkillIndex
+
+
+def _card(name: str, description: str, tags: list) -> AgentCard:
+    return AgentCard(
+        name=name, description=description, url=f"http://{name.lower()}.test/", version="1.0.0",
+        capabilities=AgentCapabilities(), skills=[AgentSkill(id=name.lower(), name=name, tags=tags)],
+    )
+
+
+TOPICS = {
+    "weather_agent": ("Weather forecasts and temperature", ["weather", "forecast", "rain"]),
+    "city_agent": ("City population and attractions", ["population", "attractions", "landmarks"]),
+    "currency_agent": ("Currency exchange rates", ["currency", "exchange", "rates"]),
+    "flight_agent": ("Flight search and booking", ["flight", "airline", "booking"]),
+}
+
+
+def _index() -> SkillIndex:
+    return SkillIndex({agent_id: _card(agent_id, *topic) for agent_id, topic in TOPICS.items()})
+
+
+def test_vectors_are_normalized_and_stable():
+    vectorizer = HashingVectorizer(dim=256)
+    first, empty = vectorizer.encode(["weather in Seoul", "the"])
+    assert np.isclose(np.linalg.norm(first), 1.0)
+    assert not empty.any()
+    assert np.array_equal(first, HashingVectorizer(dim=256).encode(["weather in Seoul"])[0])
+
+
+def test_top_k_ranks_the_matching_agent_first():
+    index = _index()
+    assert index.top_k("will it rain tomorrow? weather forecast", k=1)[0][0] == "weather_agent"
+    assert index.top_k("exchange rates for the currency", k=1)[0][0] == "currency_agent"
+    ranked = index.top_k("book a flight", k=3)
+    assert ranked[0][0] == "flight_agent"
+    assert len(ranked) == 3
+    assert [score for _, score in ranked] == sorted((score for _, score in ranked), reverse=True)
+
+
+def test_k_larger_than_the_index():
+    assert len(_index().top_k("weather", k=50)) == len(TOPICS)
+    assert SkillIndex().top_k("weather") == []
+
+
+def test_upsert_replaces_a_row():
+    index = _index()
+    index.upsert("weather_agent", _card("weather_agent", "Hotel reservations", ["hotel", "rooms"]))
+    assert len(index) == len(TOPICS)
+    assert index.top_k("hotel rooms", k=1)[0][0] == "weather_agent"
+    assert dict(index.top_k("weather forecast", k=len(TOPICS)))["weather_agent"] == 0.0
+
+
+def test_remove_keeps_the_other_rows():
+    index = _index()
+    index.remove("weather_agent")
+    index.remove("missing_agent")
+    assert "weather_agent" not in index
+    assert len(index) == len(TOPICS) - 1
+    for agent_id, (description, tags) in TOPICS.items():
+        if agent_id != "weather_agent":
+            assert index.top_k(" ".join(tags), k=1)[0][0] == agent_id
+
+
+def test_index_grows_past_its_initial_capacity():
+    index = SkillIndex({f"agent_{i}": _card(f"agent_{i}", f"Skill number {i}", [f"topic{i}"]) for i in range(40)})
+    assert len(index) == 40
+    assert index.top_k("topic37", k=1)[0][0] == "agent_37"
@@ -0,0 +1,69 @@
+# =============================================================================
+# tests/test_skill_router.py
+# =============================================================================
+# SkillRouter: obvious queries go straight to one agent, anything ambiguous
+# or unmatched is left to the LLM.
+# =============================================================================
+
+from models.agent import AgentCapabilities, AgentCard, AgentSkill
+from utilities.a2a.skill_router import SkillRouter, router_decisions, tokenize
+
+
+def _card(name: str, description: str, tags: list, examples: list) -> AgentCard:
+    skill = AgentSkill(id=name.lower(), name=name, description=description, tags=tags, examples=examples)
+    return AgentCard(name=name, description=description, url=f"http://{name.lower()}.test/", version="1.0.0",
+                     capabilities=AgentCapabilities(), skills=[skill])
+
+
+CARDS = {
+    "weather_agent": _card("WeatherAgent", "Current weather and forecasts for a city",
+                           ["weather", "forecast", "temperature"], ["What's the weather in Seoul?"]),
+    "city_agent": _card("CityAgent", "Population and attractions of a city",
+                        ["population", "attractions", "landmarks"], ["Tell me about Paris"]),
+}
+
+
+def test_tokenize_drops_stopwords_and_numbers():
+    assert tokenize("What's the Weather in Seoul for 2024?") == ["weather", "seoul"]
+
+
+def test_obvious_queries_are_routed_directly():
+    router = SkillRouter(CARDS)
+    weather = router.route("weather forecast for Seoul tomorrow")
+    city = router.route("what are the attractions and population of Busan")
+    assert weather.agent_id == "weather_agent"
+    assert city.agent_id == "city_agent"
+    assert weather.score > weather.runner_up
+
+
+def test_queries_matching_two_agents_go_to_the_llm():
+    assert SkillRouter(CARDS).route("weather and attractions in Paris") is None
+
+
+def test_unrelated_queries_go_to_the_llm():
+    router = SkillRouter(CARDS)
+    assert router.route("translate this sentence to German") is None
+    assert router.route("") is None
+
+
+def test_terms_every_agent_shares_count_less():
+    scores = SkillRouter(CARDS).scores("city")  # In both descriptions
+    assert scores["weather_agent"] < 0.2 and scores["city_agent"] < 0.2
+
+
+def test_no_agents():
+    assert SkillRouter({}).route("weather") is None
+
+
+def test_decisions_are_counted():
+    router = SkillRouter(CARDS)
+
+    def count(route, agent):
+        line = f'a2a_router_decisions_total{{route="{route}",agent="{agent}"}}'
+        return next((float(sample.rsplit(" ", 1)[1]) for sample in router_decisions.render() if sample.startswith(line)), 0.0)
+
+    fast, llm = count("fast", "weather_agent"), count("llm", "")
+    router.record(router.route("weather forecast"))
+    router.record(router.route("something else entirely"))
+    assert count("fast", "weather_agent") == fast + 1
+    assert count("llm", "") == llm + 1
@@ -0,0 +1,79 @@
+# =============================================================================
+# tests/test_stored_task.py
+# =============================================================================
+# StoredTask / StoredMessage: the compact in-memory task representation and
+# its conversion to the API Task (built on demand, nothing cached).
+# =============================================================================
+
+from models import task as task_module
+from models.task import DataPart, Message, StoredMessage, StoredTask, TaskState, TextPart
+
+
+def _message(role: str, text: str) -> Message:
+    return Message(role=role, parts=[TextPart(text=text)])
+
+
+def test_stored_message_round_trips_all_part_types():
+    message = Message(role="agent", parts=[
+        TextPart(text="hello"), DataPart(data={"temp": 21}, metadata={"schema": "weather"}),
+    ])
+    stored = StoredMessage.from_message(message)
+    assert stored.parts[0] == "hello"
+    assert Message.model_validate(stored.to_dict()) == message
+
+
+def test_to_task_returns_snapshots():
+    task = StoredTask.create("t1", _message("user", "hi"))
+    first = task.to_task()
+    task.history.append(StoredMessage.from_message(_message("agent", "hello")))
+    task.set_state(TaskState.COMPLETED)
+    second = task.to_task()
+    assert [m.text() for m in first.history] == ["hi"]
+    assert first.status.state == TaskState.SUBMITTED
+    assert [m.text() for m in second.history] == ["hi", "hello"]
+    assert second.status.state == TaskState.COMPLETED
+
+
+def test_to_task_keeps_no_messages_on_the_task():
+    task = StoredTask.create("t1", _message("user", "hi"))
+    task.to_task()
+    assert list(StoredTask.__slots__) == ["id", "state", "timestamp", "history"]
+
+
+def test_to_task_reflects_edited_entries():
+    task = StoredTask.create("t1", _message("user", "one"))
+    task.to_task()
+    task.history[0] = StoredMessage.from_message(_message("user", "edited"))
+    assert [m.text() for m in task.to_task().history] == ["edited"]
+
+
+def test_to_task_rebuilds_after_truncation():
+    task = StoredTask.create("t1", _message("user", "one"))
+    task.history.append(StoredMessage.from_message(_message("agent", "two")))
+    task.to_task()
+    task.history[:] = [StoredMessage.from_message(_message("user", "three"))]
+    assert [m.text() for m in task.to_task().history] == ["three"]
+
+
+def test_history_length():
+    task = StoredTask.create("t1", _message("user", "one"))
+    task.history.append(StoredMessage.from_message(_message("agent", "two")))
+    assert [m.text() for m in task.to_task(1).history] == ["two"]
+    assert task.to_task(0).history == []
+    assert len(task.to_task(None).history) == 2
+
+
+def test_history_length_converts_only_the_tail(monkeypatch):
+    converted = []
+    adapter = task_module._HISTORY_ADAPTER
+
+    class Spy:
+        def validate_python(self, messages):
+            converted.append(len(messages))
+            return adapter.validate_python(messages)
+
+    monkeypatch.setattr(task_module, "_HISTORY_ADAPTER", Spy())
+    task = StoredTask.create("t1", _message("user", "0"))
+    task.history.extend(StoredMessage.from_message(_message("agent", str(i))) for i in range(1, 100))
+    assert [m.text() for m in task.to_task(2).history] == ["98", "99"]
+    assert converted == [2]
@@ -0,0 +1,149 @@
+# =============================================================================
+# tests/test_task_idempotency.py
+# =============================================================================
+# Idempotent tasks/send: sends are keyed on (task ID, message hash), so a
+# retried send never runs the agent twice or appends to history twice.
+# =============================================================================
+
+import asyncio
+
+from models.request import SendTaskRequest
+from models.task import Message, StoredMessage, TaskSendParams, TaskState, TextPart
+from server.task_manager import InMemoryTaskManager
+
+
+class CountingTaskManager(InMemoryTaskManager):
+    """Answers every message with "reply N"; `fail` makes the next run fail, `gate` holds runs."""
+
+    def __init__(self):
+        super().__init__()
+        self.runs = 0
+        self.fail = False
+        self.gate: asyncio.Event | None = None
+        self.final_state = TaskState.COMPLETED
+
+    async def process_task(self, request, task):
+        self.runs += 1
+        await self.update_status(task, TaskState.WORKING)
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            self.fail = False
+            raise RuntimeError("boom")
+        reply = Message(role="agent", parts=[TextPart(text=f"reply {self.runs}")])
+        await self.update_status(task, self.final_state, reply)
+
+
+def _send(text: str, task_id: str = "t1", blocking: bool = True) -> SendTaskRequest:
+    return SendTaskRequest(params=TaskSendParams(
+        id=task_id, message=Message(role="user", parts=[TextPart(text=text)]), blocking=blocking,
+    ))
+
+
+def _texts(task) -> list:
+    return [message.text() for message in task.history]
+
+
+def test_message_digest_depends_on_role_and_parts():
+    hello = StoredMessage.from_message(Message(role="user", parts=[TextPart(text="hello")]))
+    same = StoredMessage.from_message(Message(role="user", parts=[TextPart(text="hello")]))
+    other = StoredMessage.from_message(Message(role="agent", parts=[TextPart(text="hello")]))
+    assert hello.digest() == same.digest()
+    assert hello.digest() != other.digest()
+    assert len(hello.digest()) == 16
+
+
+def test_duplicate_send_replays_result_without_running_again():
+    async def scenario():
+        manager = CountingTaskManager()
+        first = await manager.on_send_task(_send("weather in Seoul"))
+        again = await manager.on_send_task(_send("weather in Seoul"))
+        return manager, first.result, again.result
+
+    manager, first, again = asyncio.run(scenario())
+    assert manager.runs == 1
+    assert _texts(again) == _texts(first) == ["weather in Seoul", "reply 1"]
+    assert again.status.state == TaskState.COMPLETED
+
+
+def test_new_message_on_same_task_is_a_new_turn():
+    async def scenario():
+        manager = CountingTaskManager()
+        await manager.on_send_task(_send("first"))
+        second = await manager.on_send_task(_send("second"))
+        return manager, second.result
+
+    manager, second = asyncio.run(scenario())
+    assert manager.runs == 2
+    assert _texts(second) == ["first", "reply 1", "second", "reply 2"]
+
+
+def test_concurrent_duplicates_share_one_run():
+    async def scenario():
+        manager = CountingTaskManager()
+        manager.gate = asyncio.Event()
+        sends = [asyncio.create_task(manager.on_send_task(_send("same"))) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        manager.gate.set()
+        return manager, await asyncio.gather(*sends)
+
+    manager, responses = asyncio.run(scenario())
+    assert manager.runs == 1
+    assert all(_texts(response.result) == ["same", "reply 1"] for response in responses)
+
+
+def test_replay_is_the_result_of_that_send_not_the_latest_turn():
+    async def scenario():
+        manager = CountingTaskManager()
+        await manager.on_send_task(_send("first"))
+        await manager.on_send_task(_send("second"))
+        return await manager.on_send_task(_send("first"))
+
+    replay = asyncio.run(scenario()).result
+    assert _texts(replay) == ["first", "reply 1"]
+
+
+def test_failed_run_is_retried_without_duplicating_the_message():
+    async def scenario():
+        manager = CountingTaskManager()
+        manager.fail = True
+        failed = await manager.on_send_task(_send("flaky"))
+        retried = await manager.on_send_task(_send("flaky"))
+        return manager, failed.result, retried.result
+
+    manager, failed, retried = asyncio.run(scenario())
+    assert failed.status.state == TaskState.FAILED
+    assert manager.runs == 2
+    assert retried.status.state == TaskState.COMPLETED
+    assert _texts(retried) == ["flaky", "reply 2"]
+
+
+def test_repeated_answer_while_input_required_is_a_new_turn():
+    async def scenario():
+        manager = CountingTaskManager()
+        manager.final_state = TaskState.INPUT_REQUIRED
+        await manager.on_send_task(_send("book a table"))
+        await manager.on_send_task(_send("yes"))
+        return manager, (await manager.on_send_task(_send("yes"))).result
+
+    manager, task = asyncio.run(scenario())
+    assert manager.runs == 3
+    assert _texts(task)[-2:] == ["yes", "reply 3"]
+
+
+def test_non_blocking_duplicate_returns_the_running_task():
+    async def scenario():
+        manager = CountingTaskManager()
+        manager.gate = asyncio.Event()
+        first = await manager.on_send_task(_send("slow", blocking=False))
+        await asyncio.sleep(0)
+        duplicate = await manager.on_send_task(_send("slow", blocking=False))
+        manager.gate.set()
+        await asyncio.wait(set(manager.running_tasks.values()))
+        return manager, first.result, duplicate.result
+
+    manager, first, duplicate = asyncio.run(scenario())
+    assert manager.runs == 1
+    assert first.status.state == TaskState.SUBMITTED
+    assert duplicate.status.state in (TaskState.SUBMITTED, TaskState.WORKING)
+    assert _texts(duplicate) == ["slow"]
@@ -0,0 +1,174 @@
+# =============================================================================
+# tests/test_tool_cache.py
+# =============================================================================
+# ToolResultCache: scope, TTL, failures and shared in-flight calls, plus the
+# CachePolicy built from AgentCard skills and MCP annotations.
+# =============================================================================
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from models.agent import AgentSkill
+from utilities import tool_cache as tool_cache_module
+from utilities.tool_cache import GLOBAL, SESSION, CachePolicy, ToolResultCache, fold_text, normalize_args
+
+
+class Tool:
+    """A tool call that counts how often it really runs."""
+
+    def __init__(self, result="result", error: Exception | None = None, delay: float = 0.0):
+        self.calls = 0
+        self.result, self.error, self.delay = result, error, delay
+
+    async def __call__(self):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error is not None:
+            raise self.error
+        return f"{self.result} {self.calls}"
+
+
+def _skill(ttl=None, scope=None) -> AgentSkill:
+    return AgentSkill(id="s", name="s", cacheTtl=ttl, cacheScope=scope)
+
+
+def test_session_scope_is_not_shared_between_sessions():
+    async def scenario():
+        cache, tool, policy = ToolResultCache(), Tool(), CachePolicy(ttl=60, scope=SESSION)
+        results = [
+            await cache.get_or_call("t", {"q": 1}, policy, tool, session_id="a"),
+            await cache.get_or_call("t", {"q": 1}, policy, tool, session_id="a"),
+            await cache.get_or_call("t", {"q": 1}, policy, tool, session_id="b"),
+        ]
+        return tool, results
+
+    tool, results = asyncio.run(scenario())
+    assert results == ["result 1", "result 1", "result 2"]
+    assert tool.calls == 2
+
+
+def test_session_scope_without_session_is_not_cached():
+    async def scenario():
+        cache, tool = ToolResultCache(), Tool()
+        for _ in range(2):
+            await cache.get_or_call("t", {}, CachePolicy(ttl=60, scope=SESSION), tool)
+        return tool
+
+    assert asyncio.run(scenario()).calls == 2
+
+
+def test_global_scope_is_shared_between_sessions():
+    async def scenario():
+        cache, tool, policy = ToolResultCache(), Tool(), CachePolicy(ttl=60, scope=GLOBAL)
+        await cache.get_or_call("t", {"q": 1}, policy, tool, session_id="a")
+        return tool, await cache.get_or_call("t", {"q": 1}, policy, tool, session_id="b")
+
+    tool, result = asyncio.run(scenario())
+    assert result == "result 1"
+    assert tool.calls == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(tool_cache_module.time, "monotonic", lambda: now[0])
+
+    async def call():
+        return await cache.get_or_call("t", {}, CachePolicy(ttl=10, scope=GLOBAL), tool)
+
+    cache, tool = ToolResultCache(), Tool()
+    assert asyncio.run(call()) == "result 1"
+    now[0] += 9.9
+    assert asyncio.run(call()) == "result 1"
+    now[0] += 0.2
+    assert asyncio.run(call()) == "result 2"
+
+
+def test_uncacheable_policy_always_calls():
+    async def scenario():
+        cache, tool = ToolResultCache(), Tool()
+        for _ in range(3):
+            await cache.get_or_call("t", {}, CachePolicy(), tool, session_id="a")
+        return cache, tool
+
+    cache, tool = asyncio.run(scenario())
+    assert tool.calls == 3
+    assert not cache._entries
+
+
+def test_failures_are_not_cached():
+    async def scenario():
+        cache, policy = ToolResultCache(), CachePolicy(ttl=60, scope=GLOBAL)
+        failing = Tool(error=RuntimeError("down"))
+        with pytest.raises(RuntimeError):
+            await cache.get_or_call("t", {}, policy, failing)
+        return await cache.get_or_call("t", {}, policy, Tool(result="recovered"))
+
+    assert asyncio.run(scenario()) == "recovered 1"
+
+
+def test_concurrent_identical_calls_share_one_execution():
+    async def scenario():
+        cache, tool, policy = ToolResultCache(), Tool(delay=0.02), CachePolicy(ttl=60, scope=GLOBAL)
+        results = await asyncio.gather(*(cache.get_or_call("t", {"q": 1}, policy, tool) for _ in range(5)))
+        return tool, results
+
+    tool, results = asyncio.run(scenario())
+    assert tool.calls == 1
+    assert results == ["result 1"] * 5
+
+
+def test_concurrent_waiters_get_the_same_error():
+    async def scenario():
+        cache, tool = ToolResultCache(), Tool(error=ValueError("bad"), delay=0.02)
+        policy = CachePolicy(ttl=60, scope=GLOBAL)
+        return tool, await asyncio.gather(
+            *(cache.get_or_call("t", {}, policy, tool) for _ in range(3)), return_exceptions=True,
+        )
+
+    tool, results = asyncio.run(scenario())
+    assert tool.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+def test_lru_eviction_and_invalidate():
+    async def scenario():
+        cache, policy = ToolResultCache(max_entries=2), CachePolicy(ttl=60, scope=SESSION)
+        for q in range(3):
+            await cache.get_or_call("t", {"q": q}, policy, Tool(), session_id="a")
+        await cache.get_or_call("t", {"q": 0}, policy, Tool(), session_id="b")
+        return cache
+
+    cache = asyncio.run(scenario())
+    assert [key[2] for key in cache._entries] == ['{"q":2}', '{"q":0}']
+    cache.invalidate("a")
+    assert [key[0] for key in cache._entries] == ["b"]
+    cache.invalidate()
+    assert not cache._entries
+
+
+def test_normalize_args_sorts_keys_but_keeps_values():
+    assert normalize_args({"b": 1, "a": 2}) == normalize_args({"a": 2, "b": 1})
+    assert normalize_args({"path": "/Tmp/A"}) != normalize_args({"path": "/tmp/a"})
+    assert normalize_args({"q": "a  b"}) != normalize_args({"q": "a b"})
+
+
+def test_fold_text_folds_case_and_whitespace():
+    assert fold_text("  Weather in \n Seoul ") == fold_text("weather in seoul") == "weather in seoul"
+
+
+def test_policy_from_skills():
+    assert not CachePolicy.from_skills([]).cacheable
+    assert not CachePolicy.from_skills([_skill(60), _skill()]).cacheable
+    assert CachePolicy.from_skills([_skill(60, GLOBAL), _skill(30, GLOBAL)]) == CachePolicy(30, GLOBAL)
+    assert CachePolicy.from_skills([_skill(60, GLOBAL), _skill(30)]) == CachePolicy(30, SESSION)
+
+
+def test_policy_from_mcp_annotations():
+    assert not CachePolicy.from_mcp_annotations(None).cacheable
+    assert not CachePolicy.from_mcp_annotations(SimpleNamespace(readOnlyHint=False)).cacheable
+    assert not CachePolicy.from_mcp_annotations(SimpleNamespace(readOnlyHint=True, openWorldHint=True)).cacheable
+    read_only = SimpleNamespace(readOnlyHint=True, openWorldHint=False, model_extra={"cacheTtl": 5})
+    assert CachePolicy.from_mcp_annotations(read_only) == CachePolicy(5.0, GLOBAL)
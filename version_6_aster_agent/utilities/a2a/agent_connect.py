@@ -5,15 +5,25 @@
 # Provides a simple wrapper (`AgentConnector`) around the A2AClient to send tasks
 # to any remote agent identified by a base URL. This decouples the Orchestrator
 # from low-level HTTP details and HTTP client setup.
+# Each connector owns a circuit breaker (see utilities/a2a/health.py), so a
+# dead agent fails fast instead of timing out on every task.
 # =============================================================================
 
 import uuid                           # Standard library for generating unique IDs
+import time                           # Standard library for timing delegated tasks
+import asyncio                        # Standard library for detecting and shielding cancellation
 import logging                        # Standard library for configurable logging
 
+import httpx                          # Async HTTP client, used for health probes
+
 # Import our custom A2AClient which handles JSON-RPC task requests
-from client.client import A2AClient
+from client.client import A2AClient, A2AClientHTTPError
 # Import Task model to represent the full task response
-from models.task import Task
+from models.task import Task, TaskState
+# Downstream latency histogram exported on /metrics
+from utilities.metrics import connector_request_duration
+# Per-agent health state: passive failure detection + active probes
+from utilities.a2a.health import BreakerPolicy, CircuitBreaker
 
 # Create a logger for this module using its namespace
 logger = logging.getLogger(__name__)
@@ -26,23 +36,35 @@ class AgentConnector:
     Attributes:
         name (str): Human-readable identifier of the remote agent.
         client (A2AClient): HTTP client pointing at the agent's URL.
+        health (CircuitBreaker): Whether the agent may be called right now.
     """
 
-    def __init__(self, name: str, base_url: str):
+    def __init__(self, name: str, base_url: str, breaker: BreakerPolicy | None = None, replica: str | None = None):
         """
         Initialize the connector for a specific remote agent.
 
         Args:
             name (str): Identifier for the agent (e.g., "TellTimeAgent").
             base_url (str): The HTTP endpoint (e.g., "http://localhost:10000").
+            breaker (BreakerPolicy, optional): Circuit breaker settings.
+            replica (str, optional): Replica label (e.g. "host:port") when the agent runs
+                as several replicas; each replica gets its own breaker.
         """
         # Store the agent’s name for logging and reference
         self.name = name
+        self.base_url = base_url
         # Instantiate an A2AClient bound to the agent’s base URL
         self.client = A2AClient(url=base_url)
+        # Opens after repeated failures; send_task then fails fast with CircuitOpenError
+        self.health = CircuitBreaker(f"{name}@{replica}" if replica else name, breaker)
         # Log that the connector is ready for use
         logger.info(f"AgentConnector: initialized for {self.name} at {base_url}")
 
+    @property
+    def available(self) -> bool:
+        """Whether the agent may be called now (its circuit is not open)."""
+        return self.health.available
+
     async def send_task(self, message: str, session_id: str) -> Task:
         """
         Send a text task to the remote agent and return its completed Task.
@@ -53,7 +75,13 @@ class AgentConnector:
 
         Returns:
             Task: The full Task object (including history) from the remote agent.
+
+        Raises:
+            CircuitOpenError: The agent failed recently and is not being called.
         """
+        # Fail fast (no HTTP request) while the agent's circuit is open
+        self.health.acquire()
+
         # Generate a unique ID for this task using uuid4, hex form
         task_id = uuid.uuid4().hex
         # Build the JSON-RPC payload matching TaskSendParams schema
@@ -69,8 +97,77 @@ class AgentConnector:
         }
 
         # Use the A2AClient to send the task asynchronously and await the response
-        task_result = await self.client.send_task(payload)
+        started = time.perf_counter()
+        try:
+            task_result = await self.client.send_task(payload)
+        except asyncio.CancelledError:
+            self._observe(started, "canceled")
+            self.health.release()  # Says nothing about the agent's health
+            # The caller (e.g. a canceled orchestrator task) gave up on this delegation:
+            # tell the remote agent to stop the sub-task too, then keep cancelling.
+            await asyncio.shield(self._cancel_remote_task(task_id))
+            raise
+        except Exception as e:
+            self._observe(started, "error")
+            if self._is_agent_failure(e):
+                self.health.record_failure(e)
+            else:
+                self.health.record_success()  # The agent answered; the request itself was rejected
+            raise
+        if task_result.status.state == TaskState.FAILED:
+            # The agent answered but couldn't do the work: count it against its health
+            self._observe(started, "failed")
+            self.health.record_failure(f"task {task_id} failed")
+        else:
+            self._observe(started, "ok")
+            self.health.record_success()
         # Log receipt of the completed task for debugging/tracing
         logger.info(f"AgentConnector: received response from {self.name} for task {task_id}")
         # Return the Task Pydantic model for further processing by the orchestrator
         return task_result
+
+    async def probe(self, client: httpx.AsyncClient) -> bool:
+        """
+        Active health check: fetch the agent's card and report the result to the breaker.
+        Probes keep their own failure streak in the breaker; a success resets it,
+        and only closes a circuit that is already due for a trial (HALF_OPEN).
+
+        Args:
+            client (httpx.AsyncClient): Shared client for one round of probes.
+
+        Returns:
+            bool: True if the agent answered.
+        """
+        url = self.base_url.rstrip("/") + "/.well-known/agent.json"
+        try:
+            response = await client.get(url, timeout=self.health.policy.probe_timeout)
+            response.raise_for_status()
+        except Exception as e:
+            self.health.probe_failed(e)
+            return False
+        self.health.probe_succeeded()
+        return True
+
+    @staticmethod
+    def _is_agent_failure(error: Exception) -> bool:
+        """Timeouts, connection errors and 5xx count against the agent; 4xx replies do not."""
+        if isinstance(error, A2AClientHTTPError) and error.args and isinstance(error.args[0], int):
+            return error.args[0] >= 500
+        return True
+
+    def _observe(self, started: float, outcome: str) -> None:
+        """Record how long a delegated task took, by outcome (ok / failed / error / canceled)."""
+        connector_request_duration.labels(agent=self.name, outcome=outcome).observe(time.perf_counter() - started)
+
+    async def _cancel_remote_task(self, task_id: str) -> None:
+        """
+        Best-effort `tasks/cancel` for a sub-task this connector started.
+
+        Args:
+            task_id (str): ID of the remote task to cancel.
+        """
+        try:
+            await self.client.cancel_task({"id": task_id})
+            logger.info(f"AgentConnector: canceled task {task_id} on {self.name}")
+        except Exception as e:
+            logger.warning(f"AgentConnector: failed to cancel task {task_id} on {self.name}: {e}")
@@ -10,7 +10,7 @@
 import os                            # os provides functions for interacting with the operating system, such as file paths
 import json                          # json allows encoding and decoding JSON data
 import logging                       # logging is used to record warning/error/info messages
-from typing import List             # List is a type hint for functions that return lists
+from typing import Dict, List, Tuple  # Type hints for the returned collections
 
 import httpx                         # httpx is an async HTTP client library for sending requests
 from models.agent import AgentCard   # AgentCard is a Pydantic model representing an agent's metadata
@@ -82,6 +82,27 @@ class DiscoveryClient:
         and parse the returned JSON into a dict of {agent_id: AgentCard}.
         """
         cards = {}
+        for agent_id, card in await self._fetch_cards():
+            cards[agent_id] = card
+        return cards
+
+    async def list_agent_replicas(self) -> Dict[str, List[AgentCard]]:
+        """
+        Like list_agent_cards, but keeps every card of an agent_id served by
+        several registry URLs (replicas of one agent), in registry order.
+
+        Returns:
+            dict: {agent_id: [AgentCard, ...]} — only URLs that answered are included.
+        """
+        replicas: Dict[str, List[AgentCard]] = {}
+        for agent_id, card in await self._fetch_cards():
+            replicas.setdefault(agent_id, []).append(card)
+        return replicas
+
+    async def _fetch_cards(self) -> List[Tuple[str, AgentCard]]:
+        """(agent_id, AgentCard) pairs from every registry URL that answered."""
+        cards = []
+        self.base_urls = self._load_registry()  # Re-read: replicas may have been added or removed
         async with httpx.AsyncClient() as client:
             for base in self.base_urls:
                 url = base.rstrip("/") + "/.well-known/agent.json"
@@ -93,12 +114,12 @@ class DiscoveryClient:
                     if isinstance(data, dict):
                         for agent_id, card_dict in data.items():
                             card = AgentCard.model_validate(card_dict)
-                            cards[agent_id] = card
+                            cards.append((agent_id, card))
                     # list 구조 (기존 단일 agent)
                     elif isinstance(data, list):
                         for card_dict in data:
                             card = AgentCard.model_validate(card_dict)
-                            cards[card.name] = card  # fallback: name 사용
+                            cards.append((card.name, card))  # fallback: name 사용
                 except Exception as e:
                     logger.warning(f"Failed to discover agent at {url}: {e}")
         return cards
@@ -0,0 +1,243 @@
+# =============================================================================
+# utilities/a2a/health.py
+# =============================================================================
+# 🎯 Purpose:
+# Tracks whether each remote agent is usable, so a dead agent costs one
+# fast error instead of a 30 s timeout per delegated task, and the
+# orchestrator stops offering it to the LLM.
+#
+# ✅ Includes:
+# - BreakerPolicy: failure threshold, open duration, trial calls, probe timeout
+# - CircuitBreaker: per-agent CLOSED → OPEN → HALF_OPEN → CLOSED state
+#     * passive detection: consecutive failed calls open the circuit
+#       (a task the agent ended FAILED counts as a failed call)
+#     * active probes keep their own failure streak, reset by a successful
+#       probe, so scattered probe timeouts can't open a healthy agent's circuit
+#     * while OPEN, calls fail fast with CircuitOpenError
+#     * after `reset_timeout`, a few trial calls (or a probe) decide
+#       whether to close it again or re-open it
+# - HealthMonitor: active probes (GET /.well-known/agent.json) of every
+#   connector on an interval, feeding the same breakers; optionally also
+#   refreshes agent membership (e.g. replicas from discovery) on its own interval
+# - Metrics: a2a_agent_circuit_state{agent} (0 closed, 1 half-open, 2 open)
+#   and a2a_agent_circuit_transitions_total{agent,state}
+# =============================================================================
+
+import time
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping
+
+import httpx
+
+from utilities.metrics import Counter, Gauge, weak_method
+
+logger = logging.getLogger(__name__)
+
+circuit_state = Gauge(
+    "a2a_agent_circuit_state", "Circuit breaker state per remote agent (0 closed, 1 half-open, 2 open)",
+    ["agent"],
+)
+circuit_transitions = Counter(
+    "a2a_agent_circuit_transitions_total", "Circuit breaker state changes per remote agent",
+    ["agent", "state"],
+)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling an agent whose circuit is open"""
+    pass
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ Configuration
+# -----------------------------------------------------------------------------
+@dataclass
+class BreakerPolicy:
+    failure_threshold: int = 3      # Consecutive failures that open the circuit
+    reset_timeout: float = 30.0     # Seconds to stay OPEN before allowing trial calls
+    half_open_calls: int = 1        # Concurrent trial calls while HALF_OPEN
+    probe_timeout: float = 2.0      # Timeout of one active probe request
+
+
+# -----------------------------------------------------------------------------
+# 🔌 CircuitBreaker
+# -----------------------------------------------------------------------------
+class CircuitBreaker:
+    """
+    Usage:
+        breaker = CircuitBreaker("city_agent")
+        breaker.acquire()              # Raises CircuitOpenError while OPEN
+        try:
+            result = await call()
+        except Exception:
+            breaker.record_failure()
+            raise
+        breaker.record_success()
+    """
+
+    def __init__(self, name: str, policy: BreakerPolicy | None = None):
+        self.name = name
+        self.policy = policy or BreakerPolicy()
+        self._state = CLOSED
+        self._failures = 0        # Consecutive failed calls while CLOSED
+        self._probe_failures = 0  # Consecutive failed probes while CLOSED
+        self._opened_at = 0.0
+        self._trials = 0          # Trial calls in flight while HALF_OPEN
+        self.last_error: str | None = None
+        circuit_state.labels(agent=name).set_function(weak_method(self._state_value))
+
+    def _state_value(self) -> float:
+        # Reads _state, not state: a scrape must not move OPEN to HALF_OPEN
+        return _STATE_VALUES[self._state]
+
+    def discard(self) -> None:
+        """Stop exporting this breaker's state (its agent / replica was removed)."""
+        circuit_state.remove(agent=self.name)
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and time.monotonic() - self._opened_at >= self.policy.reset_timeout:
+            self._transition(HALF_OPEN)
+        return self._state
+
+    @property
+    def available(self) -> bool:
+        """False while OPEN or while every HALF_OPEN trial slot is taken."""
+        state = self.state
+        return state == CLOSED or (state == HALF_OPEN and self._trials < self.policy.half_open_calls)
+
+    def acquire(self) -> None:
+        """Claim permission for one call; raise CircuitOpenError if the agent should not be called."""
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._trials < self.policy.half_open_calls:
+            self._trials += 1
+            return
+        raise CircuitOpenError(f"Agent {self.name} is unavailable (circuit {state}): {self.last_error}")
+
+    def release(self) -> None:
+        """Give back a call slot without a verdict (e.g. the caller was cancelled)."""
+        if self._state == HALF_OPEN and self._trials:
+            self._trials -= 1
+
+    def record_success(self) -> None:
+        self.release()
+        self._failures = 0
+        self._probe_failures = 0
+        if self._state != CLOSED:
+            self._transition(CLOSED)
+
+    def record_failure(self, error: BaseException | str | None = None) -> None:
+        self.release()
+        self.last_error = str(error) if error is not None else self.last_error
+        if self._state == HALF_OPEN:
+            self._transition(OPEN)  # The trial failed: wait another reset_timeout
+            return
+        self._failures += 1
+        if self._state == CLOSED and self._failures >= self.policy.failure_threshold:
+            self._transition(OPEN)
+
+    def probe_succeeded(self) -> None:
+        """A health probe answered: reset the probe streak; close a circuit that is due for a trial."""
+        self._probe_failures = 0
+        if self.state == HALF_OPEN:  # OPEN turns HALF_OPEN once reset_timeout has passed
+            self._transition(CLOSED)
+
+    def probe_failed(self, error: BaseException | str) -> None:
+        """A health probe failed; probes don't hold a trial slot, so nothing is released."""
+        self.last_error = f"health probe: {error!r}" if isinstance(error, BaseException) else str(error)
+        if self.state == HALF_OPEN:
+            self._transition(OPEN)
+            return
+        if self._state == CLOSED:
+            self._probe_failures += 1
+            if self._probe_failures >= self.policy.failure_threshold:
+                self._transition(OPEN)
+
+    def _transition(self, state: str) -> None:
+        if state == OPEN:
+            self._opened_at = time.monotonic()
+        self._state = state
+        self._trials = 0
+        self._failures = 0
+        self._probe_failures = 0
+        circuit_transitions.labels(agent=self.name, state=state).inc()
+        log = logger.warning if state == OPEN else logger.info
+        log(f"🔌 Circuit for {self.name} is now {state}" + (f" ({self.last_error})" if state == OPEN else ""))
+
+
+# -----------------------------------------------------------------------------
+# 🩺 HealthMonitor
+# -----------------------------------------------------------------------------
+class HealthMonitor:
+    """
+    Probes every connector in `connectors` (read on each round, so added and
+    removed agents are picked up) and reports the result to its breaker.
+
+    Usage:
+        monitor = HealthMonitor(aster_agent.connectors)
+        await monitor.start()
+        ...
+        await monitor.stop()
+    """
+
+    def __init__(
+        self,
+        connectors: Mapping[str, Any],
+        interval: float = 10.0,
+        refresh: Callable[[], Awaitable[None]] | None = None,
+        refresh_interval: float = 60.0,
+    ):
+        """
+        Args:
+            connectors: agent_id → AgentConnector (usually the orchestrator's own dict)
+            interval: Seconds between probe rounds (0 disables probing)
+            refresh: Coroutine function that updates `connectors` (e.g. re-runs discovery),
+                awaited before a probe round at most every `refresh_interval` seconds
+        """
+        self.connectors = connectors
+        self.interval = interval
+        self.refresh = refresh
+        self.refresh_interval = refresh_interval
+        self._refreshed_at = time.monotonic()  # Connectors were just built from discovery
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self._task is None and self.interval > 0:
+            self._task = asyncio.create_task(self._run(), name="a2a-health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def probe_all(self) -> None:
+        connectors = list(self.connectors.values())
+        async with httpx.AsyncClient() as client:
+            await asyncio.gather(*(connector.probe(client) for connector in connectors))
+
+    async def _run(self) -> None:
+        while True:
+            if self.refresh is not None and time.monotonic() - self._refreshed_at >= self.refresh_interval:
+                self._refreshed_at = time.monotonic()
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    logger.warning(f"🩺 Agent refresh failed: {e}")
+            try:
+                await self.probe_all()
+            except Exception as e:
+                logger.warning(f"🩺 Health probe round failed: {e}")
+            await asyncio.sleep(self.interval)
@@ -0,0 +1,86 @@
+# =============================================================================
+# utilities/a2a/hedging.py
+# =============================================================================
+# 🎯 Purpose:
+# Building blocks for hedged delegations: when a task to one replica takes
+# longer than the agent usually needs (its p95), send a duplicate to another
+# replica and use whichever answers first (see ReplicaConnector.send_task).
+#
+# ✅ Includes:
+# - HedgePolicy: percentile that triggers a hedge, extra-load budget, delay bounds
+# - LatencyHistogram: log-bucketed latencies with periodic decay, so the
+#   percentile follows the agent's recent behaviour (O(buckets) per query)
+# - Hedges are paid from a TokenBudget (utilities/budget.py): every request
+#   earns `budget` tokens and a hedge costs one, so hedges add at most
+#   `budget` × 100 % extra requests
+# - Metrics: a2a_connector_hedge_delay_seconds{agent} and
+#   a2a_connector_hedges_total{agent,outcome} (sent / won / over_budget)
+# =============================================================================
+
+import math
+from dataclasses import dataclass
+from typing import List
+
+from utilities.metrics import Counter, Gauge
+
+hedge_delay = Gauge(
+    "a2a_connector_hedge_delay_seconds", "Delay after which a delegated task is hedged to another replica",
+    ["agent"],
+)
+hedges = Counter(
+    "a2a_connector_hedges_total", "Hedged delegations: sent, won by the hedge, or skipped for lack of budget",
+    ["agent", "outcome"],
+)
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ Configuration
+# -----------------------------------------------------------------------------
+@dataclass
+class HedgePolicy:
+    percentile: float = 0.95    # Hedge once a task runs longer than this latency percentile
+    budget: float = 0.05        # Max extra requests from hedging, as a share of all requests
+    burst: float = 10.0         # Max hedges that can be sent back to back after a quiet period
+    min_delay: float = 0.05     # Never hedge sooner than this (seconds)
+    max_delay: float = 30.0     # Never wait longer than this before hedging (seconds)
+    min_samples: int = 20       # Latencies needed before the percentile is trusted
+
+
+# -----------------------------------------------------------------------------
+# 📊 LatencyHistogram
+# -----------------------------------------------------------------------------
+class LatencyHistogram:
+    """
+    Buckets grow by `growth` (10 % by default) from `smallest` seconds, so a
+    percentile is accurate to one bucket. Every `half_life` observations all
+    counts are halved, weighting recent latencies over old ones.
+    """
+
+    def __init__(self, smallest: float = 0.001, largest: float = 120.0, growth: float = 1.1, half_life: int = 500):
+        self._smallest = smallest
+        self._log_growth = math.log(growth)
+        size = int(math.log(largest / smallest) / self._log_growth) + 2
+        self._bounds: List[float] = [smallest * growth ** i for i in range(size)]  # Upper bound per bucket
+        self._counts: List[float] = [0.0] * size
+        self._half_life = half_life
+        self._since_decay = 0
+        self.count = 0.0  # Decayed number of observations
+
+    def observe(self, seconds: float) -> None:
+        index = 0 if seconds <= self._smallest else int(math.log(seconds / self._smallest) / self._log_growth) + 1
+        self._counts[min(index, len(self._counts) - 1)] += 1.0
+        self.count += 1.0
+        self._since_decay += 1
+        if self._since_decay >= self._half_life:
+            self._counts = [count / 2 for count in self._counts]
+            self.count /= 2
+            self._since_decay = 0
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the `q` quantile (0 when empty)."""
+        target, cumulative = q * self.count, 0.0
+        for bound, count in zip(self._bounds, self._counts):
+            cumulative += count
+            if count and cumulative >= target:
+                return bound
+        return self._bounds[-1] if self.count else 0.0
@@ -0,0 +1,282 @@
+# =============================================================================
+# utilities/a2a/load_balancer.py
+# =============================================================================
+# 🎯 Purpose:
+# Lets the orchestrator call an agent that runs as several replicas (e.g.
+# three WeatherAgent servers behind the same agent_id) and spread the load
+# across them.
+#
+# ✅ Includes:
+# - BalancerPolicy: balancing strategy and session affinity settings
+# - ReplicaConnector: the AgentConnector interface (send_task / probe) over
+#   one AgentConnector per replica URL, each with its own circuit breaker
+#     * "least_outstanding": the replica with the fewest requests in flight
+#     * "ewma": the lowest (latency EWMA × (in-flight + 1)), so a slow
+#       replica gets less traffic even when it is not busy
+#     * affinity: a consistent-hash ring on session_id keeps a session on
+#       one replica; adding/removing a replica moves only ~1/N of sessions
+#     * set_replicas(urls) swaps the replica set in place (in-flight calls
+#       on a removed replica finish normally)
+#     * hedging (optional, see utilities/a2a/hedging.py): a task still
+#       running after the agent's p95 latency is duplicated to another
+#       replica; the first answer wins and the other call is cancelled
+# - Metrics: a2a_connector_replicas{agent},
+#   a2a_connector_replica_in_flight{agent,replica} and
+#   a2a_connector_replica_requests_total{agent,replica}
+#
+# Unavailable replicas (open circuit) are skipped; with affinity the
+# session moves to the next replica on the ring until its own recovers.
+# =============================================================================
+
+import time
+import bisect
+import random
+import asyncio
+import hashlib
+import logging
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+from models.task import Task
+from utilities.metrics import Counter, Gauge, weak_method
+from utilities.a2a.agent_connect import AgentConnector
+from utilities.a2a.health import BreakerPolicy, CircuitOpenError
+from utilities.budget import TokenBudget
+from utilities.a2a.hedging import HedgePolicy, LatencyHistogram, hedge_delay, hedges
+
+logger = logging.getLogger(__name__)
+
+replica_count = Gauge(
+    "a2a_connector_replicas", "Replicas an orchestrator can delegate to, per agent",
+    ["agent"],
+)
+replica_in_flight = Gauge(
+    "a2a_connector_replica_in_flight", "Delegated tasks in flight per agent replica",
+    ["agent", "replica"],
+)
+replica_requests = Counter(
+    "a2a_connector_replica_requests_total", "Delegated tasks sent per agent replica",
+    ["agent", "replica"],
+)
+
+LEAST_OUTSTANDING = "least_outstanding"
+EWMA = "ewma"
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ Configuration
+# -----------------------------------------------------------------------------
+@dataclass
+class BalancerPolicy:
+    strategy: str = LEAST_OUTSTANDING   # LEAST_OUTSTANDING or EWMA
+    affinity: bool = False              # Pin each session_id to a replica (consistent hashing)
+    ewma_alpha: float = 0.3             # Weight of the newest latency sample in the EWMA
+    virtual_nodes: int = 64             # Ring points per replica (smooths the session split)
+
+
+def _hash(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class _Replica:
+    __slots__ = ("url", "label", "connector", "in_flight", "ewma")
+
+    def __init__(self, name: str, url: str, breaker: BreakerPolicy | None):
+        self.url = url
+        self.label = urlparse(url).netloc or url
+        self.connector = AgentConnector(name, url, breaker, replica=self.label)
+        self.in_flight = 0
+        self.ewma: float | None = None  # Seconds; None until the first success
+
+    @property
+    def available(self) -> bool:
+        return self.connector.available
+
+
+# -----------------------------------------------------------------------------
+# ⚖️ ReplicaConnector
+# -----------------------------------------------------------------------------
+class ReplicaConnector:
+    """
+    Usage:
+        connector = ReplicaConnector("weather_agent", ["http://w1:10022/", "http://w2:10022/"])
+        task = await connector.send_task("weather in Seoul", session_id)
+        connector.set_replicas(["http://w2:10022/", "http://w3:10022/"])  # Discovery refreshed
+    """
+
+    def __init__(
+        self,
+        name: str,
+        urls: Iterable[str],
+        policy: BalancerPolicy | None = None,
+        breaker: BreakerPolicy | None = None,
+        hedge: HedgePolicy | None = None,
+    ):
+        """
+        Args:
+            name: agent_id of the replicated agent
+            urls: Base URL of each replica
+            policy: Balancing strategy and affinity
+            breaker: Circuit breaker settings, applied to each replica separately
+            hedge: Hedging settings (None disables hedging)
+        """
+        self.name = name
+        self.policy = policy or BalancerPolicy()
+        self._breaker = breaker
+        self.hedge = hedge
+        self.latency = LatencyHistogram()  # All replicas of this agent; sets the hedge delay
+        self._hedge_budget = TokenBudget(hedge.budget, hedge.burst, tokens=0.0) if hedge else None  # Earned, not granted up front
+        if hedge:
+            hedge_delay.labels(agent=name).set_function(weak_method(self._hedge_delay_value))
+        self._replicas: Dict[str, _Replica] = {}
+        self._ring: List[Tuple[int, str]] = []  # Sorted (hash, url) points
+        self.set_replicas(urls)
+        replica_count.labels(agent=name).set_function(weak_method(self._replica_count))
+
+    @property
+    def urls(self) -> List[str]:
+        return list(self._replicas)
+
+    @property
+    def base_url(self) -> str:
+        """URL of the first replica (AgentConnector compatibility)."""
+        return next(iter(self._replicas), "")
+
+    @property
+    def available(self) -> bool:
+        """True if at least one replica can be called."""
+        return any(replica.available for replica in self._replicas.values())
+
+    def set_replicas(self, urls: Iterable[str]) -> None:
+        """Replace the replica set; existing replicas keep their health and latency stats."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            raise ValueError(f"Agent {self.name} needs at least one replica URL")
+        added = [url for url in urls if url not in self._replicas]
+        removed = [url for url in self._replicas if url not in urls]
+        old = self._replicas
+        self._replicas = {url: old.get(url) or _Replica(self.name, url, self._breaker) for url in urls}
+        self._ring = sorted(
+            (_hash(f"{url}#{i}"), url) for url in urls for i in range(self.policy.virtual_nodes)
+        )
+        for url in removed:
+            # In-flight calls on it finish normally; it just stops being exported
+            replica_in_flight.remove(agent=self.name, replica=old[url].label)
+            old[url].connector.health.discard()
+        if added or removed:
+            logger.info(f"⚖️ {self.name}: {len(urls)} replica(s) (+{len(added)} / -{len(removed)})")
+
+    async def send_task(self, message: str, session_id: str) -> Task:
+        """Send the task to the replica picked by the policy (see AgentConnector.send_task)."""
+        primary = self._choose(session_id)
+        delay = self._hedge_delay()
+        if delay is None:
+            return await self._send(primary, message, session_id)
+
+        # 🏁 Hedged: give the primary until the agent's p95, then race a duplicate on another replica
+        self._hedge_budget.earn()
+        calls = [asyncio.ensure_future(self._send(primary, message, session_id))]
+        try:
+            done, _ = await asyncio.wait(calls, timeout=delay)
+            if done:
+                return calls[0].result()
+            backup = self._least_loaded([r for r in self._replicas.values() if r is not primary and r.available])
+            if backup is None:
+                return await calls[0]
+            if not self._hedge_budget.spend():
+                hedges.labels(agent=self.name, outcome="over_budget").inc()
+                return await calls[0]
+            hedges.labels(agent=self.name, outcome="sent").inc()
+            calls.append(asyncio.ensure_future(self._send(backup, message, session_id)))
+            return await self._first_success(calls)
+        finally:
+            # The loser (or both, if we were cancelled) is cancelled; AgentConnector cancels its remote task
+            for call in calls:
+                if not call.done():
+                    call.cancel()
+
+    async def _send(self, replica: _Replica, message: str, session_id: str) -> Task:
+        replica.in_flight += 1
+        in_flight = replica_in_flight.labels(agent=self.name, replica=replica.label)
+        in_flight.inc()
+        replica_requests.labels(agent=self.name, replica=replica.label).inc()
+        started = time.perf_counter()
+        try:
+            task = await replica.connector.send_task(message, session_id)
+        except asyncio.CancelledError:
+            # A cancelled call (e.g. a hedge loser) took at least this long: keep the tail visible
+            self.latency.observe(time.perf_counter() - started)
+            raise
+        finally:
+            replica.in_flight -= 1
+            in_flight.dec()
+        elapsed = time.perf_counter() - started
+        self.latency.observe(elapsed)
+        alpha = self.policy.ewma_alpha
+        replica.ewma = elapsed if replica.ewma is None else alpha * elapsed + (1 - alpha) * replica.ewma
+        return task
+
+    async def _first_success(self, calls: List[asyncio.Future]) -> Task:
+        """Result of the first call that succeeds; if all fail, the last error."""
+        pending, error = set(calls), None
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for call in done:
+                if call.exception() is None:
+                    if call is calls[-1]:
+                        hedges.labels(agent=self.name, outcome="won").inc()
+                    return call.result()
+                error = call.exception()
+        raise error
+
+    def _replica_count(self) -> float:
+        return len(self._replicas)
+
+    def _hedge_delay_value(self) -> float:
+        return self._hedge_delay() or 0.0
+
+    def _hedge_delay(self) -> float | None:
+        """Seconds to wait before hedging, or None when hedging is off or latencies are still unknown."""
+        if self.hedge is None or len(self._replicas) < 2 or self.latency.count < self.hedge.min_samples:
+            return None
+        return min(max(self.latency.percentile(self.hedge.percentile), self.hedge.min_delay), self.hedge.max_delay)
+
+    async def probe(self, client: httpx.AsyncClient) -> bool:
+        """Probe every replica (see AgentConnector.probe); True if any answered."""
+        results = await asyncio.gather(*(replica.connector.probe(client) for replica in list(self._replicas.values())))
+        return any(results)
+
+    def _choose(self, session_id: str | None) -> _Replica:
+        candidates = [replica for replica in self._replicas.values() if replica.available]
+        if not candidates:
+            errors = {replica.label: replica.connector.health.last_error for replica in self._replicas.values()}
+            raise CircuitOpenError(f"Agent {self.name} is unavailable (no healthy replica): {errors}")
+        if len(candidates) == 1:
+            return candidates[0]
+        if self.policy.affinity and session_id:
+            return self._owner(session_id)
+        return self._least_loaded(candidates)
+
+    def _least_loaded(self, candidates: List[_Replica]) -> _Replica | None:
+        if not candidates:
+            return None
+        if self.policy.strategy == EWMA:
+            # Untried replicas score 0, so each one gets traffic (and a latency sample) early
+            score = lambda replica: (replica.ewma or 0.0) * (replica.in_flight + 1)
+        else:
+            score = lambda replica: replica.in_flight
+        best = min(score(replica) for replica in candidates)
+        return random.choice([replica for replica in candidates if score(replica) == best])
+
+    def _owner(self, session_id: str) -> _Replica:
+        """First available replica clockwise from the session's point on the ring."""
+        start = bisect.bisect(self._ring, (_hash(session_id), ""))
+        for offset in range(len(self._ring)):
+            _, url = self._ring[(start + offset) % len(self._ring)]
+            replica = self._replicas[url]
+            if replica.available:
+                return replica
+        raise CircuitOpenError(f"Agent {self.name} is unavailable (no healthy replica)")
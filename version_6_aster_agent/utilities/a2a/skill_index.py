@@ -0,0 +1,139 @@
+# =============================================================================
+# utilities/a2a/skill_index.py
+# =============================================================================
+# 🎯 Purpose:
+# Finds the few agents relevant to a query among hundreds, so the
+# orchestrator can show the LLM a short candidate list instead of every
+# registered agent.
+#
+# ✅ Includes:
+# - HashingVectorizer: dependency-free text embedding (hashed words and
+#   word pairs, signed, L2-normalized); any object with `dim` and
+#   `encode(texts)` (e.g. a local sentence-embedding model) can replace it
+# - SkillIndex: one NumPy row per agent, built from the AgentCard
+#   description and its skills (names, descriptions, tags, examples);
+#   upsert/remove update single rows, top_k() is one matrix-vector product
+# =============================================================================
+
+import zlib
+import threading
+from typing import Dict, List, Mapping, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from models.agent import AgentCard
+from utilities.a2a.skill_router import tokenize
+
+
+class Vectorizer(Protocol):
+    dim: int
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """One L2-normalized float32 row per text."""
+
+
+# -----------------------------------------------------------------------------
+# #️⃣ HashingVectorizer
+# -----------------------------------------------------------------------------
+class HashingVectorizer:
+    """Bag of words and word bigrams, hashed into `dim` signed buckets (no vocabulary to fit)."""
+
+    def __init__(self, dim: int = 1024):
+        self.dim = dim
+
+    def _features(self, text: str) -> List[str]:
+        words = tokenize(text)  # Lower-cased words without stopwords
+        return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                digest = zlib.crc32(feature.encode("utf-8"))  # Stable across processes, unlike hash()
+                matrix[row, digest % self.dim] += 1.0 if digest & 0x80000000 else -1.0
+        # Dampen repeated terms, then normalize so dot products are cosine similarities
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+        return matrix
+
+
+def card_text(card: AgentCard) -> str:
+    """Text that describes what an agent can do."""
+    parts = [card.name, card.description]
+    for skill in card.skills:
+        parts += [skill.name, skill.description or "", " ".join(skill.tags or []), *(skill.examples or [])]
+    return "\n".join(part for part in parts if part)
+
+
+# -----------------------------------------------------------------------------
+# 🗂️ SkillIndex
+# -----------------------------------------------------------------------------
+class SkillIndex:
+    """
+    Usage:
+        index = SkillIndex(agent_cards)
+        index.upsert("city_agent", new_card)       # Card changed: re-embed one row
+        index.top_k("weather in Seoul", k=5)       # [("weather_agent", 0.61), ...]
+    """
+
+    def __init__(self, agent_cards: Mapping[str, AgentCard] | None = None, vectorizer: Vectorizer | None = None):
+        self.vectorizer = vectorizer or HashingVectorizer()
+        self._matrix = np.zeros((16, self.vectorizer.dim), dtype=np.float32)
+        self._ids: List[str] = []          # Row → agent_id
+        self._rows: Dict[str, int] = {}    # agent_id → row
+        self._lock = threading.Lock()      # Writers may run in other threads than readers
+        if agent_cards:
+            self.upsert_many(agent_cards)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, agent_id: str) -> bool:
+        return agent_id in self._rows
+
+    def upsert(self, agent_id: str, card: AgentCard) -> None:
+        self.upsert_many({agent_id: card})
+
+    def upsert_many(self, agent_cards: Mapping[str, AgentCard]) -> None:
+        """Add or re-embed these agents; other rows are untouched."""
+        ids = list(agent_cards)
+        vectors = self.vectorizer.encode([card_text(agent_cards[agent_id]) for agent_id in ids])
+        with self._lock:
+            for agent_id, vector in zip(ids, vectors):
+                row = self._rows.get(agent_id)
+                if row is None:
+                    row = len(self._ids)
+                    if row == len(self._matrix):
+                        self._matrix = np.concatenate([self._matrix, np.zeros_like(self._matrix)])
+                    self._ids.append(agent_id)
+                    self._rows[agent_id] = row
+                self._matrix[row] = vector
+
+    def remove(self, agent_id: str) -> None:
+        """Drop an agent by moving the last row into its slot."""
+        with self._lock:
+            row = self._rows.pop(agent_id, None)
+            if row is None:
+                return
+            last = len(self._ids) - 1
+            if row != last:
+                moved = self._ids[last]
+                self._matrix[row] = self._matrix[last]
+                self._ids[row] = moved
+                self._rows[moved] = row
+            self._ids.pop()
+            self._matrix[last] = 0.0
+
+    def top_k(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """The `k` agents most similar to `query`, best first."""
+        vector = self.vectorizer.encode([query])[0]
+        with self._lock:
+            count = len(self._ids)
+            if count == 0:
+                return []
+            scores = self._matrix[:count] @ vector
+            k = min(k, count)
+            best = np.argpartition(-scores, k - 1)[:k]
+            best = best[np.argsort(-scores[best])]
+            return [(self._ids[i], float(scores[i])) for i in best]
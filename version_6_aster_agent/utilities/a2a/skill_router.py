@@ -0,0 +1,135 @@
+# =============================================================================
+# utilities/a2a/skill_router.py
+# =============================================================================
+# 🎯 Purpose:
+# A rule-based routing stage that picks the agent for a query without
+# asking the LLM, when the choice is obvious ("weather in Seoul" → the
+# weather agent). Anything ambiguous is left to the LLM.
+#
+# ✅ Includes:
+# - SkillRouter: a TF-IDF index over each agent card's skills (name,
+#   description, tags, examples), built once; `route(query)` returns a
+#   RouteDecision only when the best agent wins clearly
+# - Metric: a2a_router_decisions_total{route, agent}
+#
+# Tags are weighted above examples and descriptions, since they are the
+# agent author's own keywords for the skill.
+# =============================================================================
+
+import re
+import math
+import logging
+from dataclasses import dataclass
+from collections import Counter as TermCounter
+from typing import Dict, List, Mapping
+
+from models.agent import AgentCard
+from utilities.metrics import Counter
+
+logger = logging.getLogger(__name__)
+
+router_decisions = Counter(
+    "a2a_router_decisions_total", "Orchestrator routing decisions: fast (rule-based) or llm",
+    ["route", "agent"],
+)
+
+_TOKEN = re.compile(r"\w+")
+STOPWORDS = frozenset(
+    "a an and are about at be can could do does for from give how i in is it me my "
+    "of on or please s show tell that the this to what whats which with would you".split()
+)
+# Term weights by where the term appears in a skill
+FIELD_WEIGHTS = {"tags": 3.0, "name": 2.0, "examples": 1.0, "description": 1.0}
+
+
+def tokenize(text: str) -> List[str]:
+    return [token for token in _TOKEN.findall(text.casefold()) if token not in STOPWORDS and not token.isdigit()]
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    agent_id: str
+    score: float      # Cosine similarity of the query to the chosen agent
+    runner_up: float  # Score of the next best agent
+
+
+# -----------------------------------------------------------------------------
+# 🧭 SkillRouter
+# -----------------------------------------------------------------------------
+class SkillRouter:
+    """
+    Usage:
+        router = SkillRouter(agent_cards)
+        decision = router.route("weather in Seoul")
+        if decision:  # Confident: delegate to decision.agent_id directly
+            ...
+    """
+
+    def __init__(self, agent_cards: Mapping[str, AgentCard], min_score: float = 0.2, max_runner_up: float = 0.4):
+        """
+        Args:
+            agent_cards: agent_id → AgentCard
+            min_score: Lowest similarity accepted for a direct route
+            max_runner_up: The runner-up must score below this fraction of the best
+                agent (queries that match two agents well go to the LLM)
+        """
+        self.min_score = min_score
+        self.max_runner_up = max_runner_up
+        term_weights = {agent_id: self._skill_terms(card) for agent_id, card in agent_cards.items()}
+
+        # Inverse document frequency over agents: terms shared by every agent say little
+        document_frequency = TermCounter(term for terms in term_weights.values() for term in terms)
+        total = len(term_weights)
+        self._idf = {term: math.log((total + 1) / (count + 1)) + 1.0 for term, count in document_frequency.items()}
+        self._vectors = {agent_id: self._normalize(self._weigh(terms)) for agent_id, terms in term_weights.items()}
+
+    @staticmethod
+    def _skill_terms(card: AgentCard) -> Dict[str, float]:
+        terms: Dict[str, float] = TermCounter()
+        for skill in card.skills:
+            fields = {
+                "tags": skill.tags or [],
+                "name": [skill.name],
+                "examples": skill.examples or [],
+                "description": [skill.description or ""],
+            }
+            for field, texts in fields.items():
+                for text in texts:
+                    for token in tokenize(text):
+                        terms[token] += FIELD_WEIGHTS[field]
+        return terms
+
+    def _weigh(self, terms: Mapping[str, float]) -> Dict[str, float]:
+        return {term: (1.0 + math.log(weight)) * self._idf[term] for term, weight in terms.items() if term in self._idf}
+
+    @staticmethod
+    def _normalize(vector: Dict[str, float]) -> Dict[str, float]:
+        norm = math.sqrt(sum(value * value for value in vector.values()))
+        return {term: value / norm for term, value in vector.items()} if norm else {}
+
+    def scores(self, query: str) -> Dict[str, float]:
+        """Cosine similarity of `query` to every agent (0 for agents sharing no terms)."""
+        query_vector = self._normalize(self._weigh(TermCounter(tokenize(query))))
+        return {
+            agent_id: sum(weight * vector.get(term, 0.0) for term, weight in query_vector.items())
+            for agent_id, vector in self._vectors.items()
+        }
+
+    def route(self, query: str) -> RouteDecision | None:
+        """The agent to use for `query`, or None when the LLM should decide."""
+        ranked = sorted(self.scores(query).items(), key=lambda item: item[1], reverse=True)
+        if not ranked:
+            return None
+        agent_id, best = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if best < self.min_score or runner_up >= best * self.max_runner_up:
+            return None
+        return RouteDecision(agent_id=agent_id, score=best, runner_up=runner_up)
+
+    @staticmethod
+    def record(decision: RouteDecision | None) -> None:
+        """Count a routing decision (an LLM fallback when `decision` is None)."""
+        if decision is None:
+            router_decisions.labels(route="llm", agent="").inc()
+        else:
+            router_decisions.labels(route="fast", agent=decision.agent_id).inc()
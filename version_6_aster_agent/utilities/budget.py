@@ -0,0 +1,42 @@
+# =============================================================================
+# utilities/budget.py
+# =============================================================================
+# 🎯 Purpose:
+# A token bucket that caps extra requests (client retries, hedged
+# delegations) at a share of all requests, so a struggling agent doesn't
+# get hit with every request several times over.
+# =============================================================================
+
+
+class TokenBudget:
+    """
+    Each request earns `ratio` tokens (up to `burst`); each extra request
+    (a retry, a hedge) spends one.
+
+    Usage:
+        budget = TokenBudget(ratio=0.2, burst=10)
+        budget.earn()            # Once per request
+        if budget.spend():       # Before each retry
+            ...
+    """
+
+    def __init__(self, ratio: float, burst: float, tokens: float | None = None):
+        """
+        Args:
+            ratio: Extra requests allowed per request, on average
+            burst: Most extra requests available at once
+            tokens: Starting tokens (default: a full bucket)
+        """
+        self.ratio = ratio
+        self.burst = burst
+        self.tokens = burst if tokens is None else tokens
+
+    def earn(self) -> None:
+        self.tokens = min(self.burst, self.tokens + self.ratio)
+
+    def spend(self) -> bool:
+        """Take one token; False if the budget is used up."""
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        return True
@@ -0,0 +1,179 @@
+# =============================================================================
+# utilities/llm/context_window.py
+# =============================================================================
+# 🎯 Purpose:
+# Keeps the prompt of a long-running ADK session within a token budget.
+# ADK rebuilds the model request from the whole session on every call, so
+# without this the prompt (and latency) grows with every turn and every
+# delegated tool result.
+#
+# ✅ Includes:
+# - ContextPolicy: recent turns to keep, token budget, tool-result limits
+# - ContextWindow: a before_model_callback that, for each model call,
+#   * keeps the most recent user turns verbatim,
+#   * collapses older turns into one summary message (tool results there
+#     become short references),
+#   * truncates large results of the listed tools in the turns it keeps,
+#   * folds more turns into the summary until the estimate fits the budget
+# - Metrics: estimated prompt tokens per call and tokens saved
+#
+# Only the request sent to the model changes; the session keeps every event.
+# Tokens are estimated as characters / 4 (no tokenizer call per request).
+# =============================================================================
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from utilities.metrics import Counter, Histogram
+from utilities.llm.helpers import clip, recent_lines
+
+if TYPE_CHECKING:
+    from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+context_tokens = Histogram(
+    "a2a_llm_context_tokens", "Estimated prompt tokens sent per model call, after compaction",
+    ["agent"],
+    buckets=(250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000, 128000),
+)
+context_tokens_saved = Counter(
+    "a2a_llm_context_tokens_saved_total", "Estimated prompt tokens removed by context compaction",
+    ["agent"],
+)
+
+CHARS_PER_TOKEN = 4
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ Configuration
+# -----------------------------------------------------------------------------
+@dataclass
+class ContextPolicy:
+    keep_turns: int = 4                 # Most recent user turns sent verbatim
+    token_budget: int = 8000            # Max estimated tokens of conversation per model call
+    max_tool_result_chars: int = 2000   # Longer results of `tools` are truncated in kept turns
+    summary_chars: int = 2000           # Size cap for the summary of older turns
+    tools: Tuple[str, ...] = ("_delegate_task",)  # Tools whose results can be large
+
+
+# -----------------------------------------------------------------------------
+# 📏 Token estimates
+# -----------------------------------------------------------------------------
+def _part_chars(part: "types.Part") -> int:
+    if part.text:
+        return len(part.text)
+    if part.function_call is not None:
+        return len(part.function_call.name or "") + len(json.dumps(part.function_call.args or {}, default=str))
+    if part.function_response is not None:
+        return len(part.function_response.name or "") + len(json.dumps(part.function_response.response or {}, default=str))
+    return 0
+
+
+def estimate_tokens(contents: List["types.Content"]) -> int:
+    chars = sum(_part_chars(part) for content in contents for part in content.parts or [])
+    return chars // CHARS_PER_TOKEN + 1
+
+
+# -----------------------------------------------------------------------------
+# 🪟 ContextWindow
+# -----------------------------------------------------------------------------
+class ContextWindow:
+    """
+    Compacts each model request of one LlmAgent.
+
+    Usage:
+        window = ContextWindow("aster_orchestrator_agent")
+        LlmAgent(..., before_model_callback=window.before_model)
+    """
+
+    def __init__(self, agent_name: str, policy: ContextPolicy | None = None):
+        self.agent_name = agent_name
+        self.policy = policy or ContextPolicy()
+
+    def before_model(self, callback_context, llm_request) -> None:
+        contents = llm_request.contents or []
+        before = estimate_tokens(contents)
+        compacted = self.compact(contents)
+        after = estimate_tokens(compacted)
+
+        llm_request.contents = compacted
+        context_tokens.labels(agent=self.agent_name).observe(after)
+        if after < before:
+            context_tokens_saved.labels(agent=self.agent_name).inc(before - after)
+            logger.debug(f"🪟 {self.agent_name}: prompt ~{before} → ~{after} tokens")
+        return None  # Never replaces the model call
+
+    def compact(self, contents: List["types.Content"]) -> List["types.Content"]:
+        """Return a new contents list within the policy's limits (`contents` is not modified)."""
+        starts = [i for i, content in enumerate(contents) if self._is_user_turn(content)]
+        keep = max(1, self.policy.keep_turns)
+        split = starts[-keep] if len(starts) > keep else 0
+        tool_result_chars = self.policy.max_tool_result_chars
+
+        while True:
+            recent = [self._trim_tool_results(content, tool_result_chars) for content in contents[split:]]
+            compacted = ([self._summarize(contents[:split])] if split else []) + recent
+            if estimate_tokens(compacted) <= self.policy.token_budget:
+                return compacted
+            later = [i for i in starts if i > split]
+            if later:
+                split = later[0]  # Fold the oldest kept turn into the summary
+            elif tool_result_chars > 200:
+                tool_result_chars //= 4  # Only the current turn is left: shrink its tool results
+            else:
+                return compacted  # The current turn alone is over budget; send it as is
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _is_user_turn(content: "types.Content") -> bool:
+        """A user message (not a function response) starts a new turn."""
+        return content.role == "user" and any(part.text for part in content.parts or [])
+
+    def _trim_tool_results(self, content: "types.Content", limit: int) -> "types.Content":
+        from google.genai import types
+
+        parts, changed = [], False
+        for part in content.parts or []:
+            response = part.function_response
+            if response is not None and response.name in self.policy.tools:
+                payload = response.response or {}
+                text = payload["result"] if isinstance(payload.get("result"), str) else json.dumps(payload, default=str)
+                if len(text) > limit:
+                    part = types.Part(function_response=types.FunctionResponse(
+                        id=response.id,
+                        name=response.name,
+                        response={"result": text[:limit] + f"… [{len(text) - limit} more characters omitted]"},
+                    ))
+                    changed = True
+            parts.append(part)
+        return types.Content(role=content.role, parts=parts) if changed else content
+
+    def _summarize(self, contents: List["types.Content"]) -> "types.Content":
+        from google.genai import types
+
+        calls: Dict[str, Any] = {}  # function call ID -> args, to describe its response
+        lines = []
+        for content in contents:
+            for part in content.parts or []:
+                if part.text:
+                    lines.append(f"{content.role}: {clip(part.text, 200)}")
+                elif part.function_call is not None:
+                    call = part.function_call
+                    calls[call.id] = call.args or {}
+                    args = ", ".join(f"{k}={clip(str(v), 60)}" for k, v in (call.args or {}).items())
+                    lines.append(f"model called {call.name}({args})")
+                elif part.function_response is not None:
+                    response = part.function_response
+                    size = len(json.dumps(response.response or {}, default=str))
+                    target = calls.get(response.id, {}).get("agent_name")
+                    source = f"{response.name} ({target})" if target else response.name
+                    lines.append(f"{source} returned {size} characters (omitted)")
+
+        header = f"[Earlier conversation, summarized: {len(contents)} messages]"
+        summary = recent_lines(header, lines, self.policy.summary_chars)
+        return types.Content(role="user", parts=[types.Part.from_text(text=summary)])
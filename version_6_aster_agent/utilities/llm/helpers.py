@@ -0,0 +1,37 @@
+# =============================================================================
+# utilities/llm/helpers.py
+# =============================================================================
+# 🎯 Purpose:
+# Small helpers shared by the LLM utilities (runner_pool, session_manager,
+# context_window).
+#
+# ✅ Includes:
+# - maybe_await: call ADK session services whether they are sync or async
+# - clip: one-line, length-limited text for summaries
+# - recent_lines: a header plus the newest lines that fit in a char budget
+# =============================================================================
+
+import inspect
+from typing import Any, List
+
+
+async def maybe_await(value: Any) -> Any:
+    """ADK session services are sync in older releases and async in newer ones."""
+    return await value if inspect.isawaitable(value) else value
+
+
+def clip(text: str, limit: int) -> str:
+    """`text` with whitespace collapsed, cut to `limit` chars (plus "…")."""
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[:limit] + "…"
+
+
+def recent_lines(header: str, lines: List[str], limit: int) -> str:
+    """`header` followed by the most recent `lines` that fit in `limit` chars, oldest first."""
+    kept, total = [], len(header)
+    for line in reversed(lines):  # The most recent lines matter most
+        if total + len(line) + 1 > limit:
+            break
+        kept.append(line)
+        total += len(line) + 1
+    return "\n".join([header, *reversed(kept)])
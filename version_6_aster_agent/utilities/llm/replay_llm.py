@@ -0,0 +1,200 @@
+# =============================================================================
+# utilities/llm/replay_llm.py
+# =============================================================================
+# 🎯 Purpose:
+# A deterministic, offline stand-in for Gemini that plugs into ADK's LlmAgent.
+# It replays scripted responses (plain text or tool calls) from a recording
+# file and waits for a simulated model latency, so the whole agent stack
+# can be load-tested without network access or API quota.
+#
+# Enable it by pointing the environment at a recording:
+#
+#   A2A_LLM_REPLAY=utilities/llm/recordings/default.json python -m agents.aster_agent
+#
+# Use A2A_LLM_REPLAY=default for the bundled recording.
+# When A2A_LLM_REPLAY is unset, `resolve_model()` returns the real model name.
+#
+# Recording format:
+# {
+#   "seed": 42,
+#   "latency": {"distribution": "lognormal", "median_ms": 400, "sigma": 0.4},
+#   "agents": {
+#     "<LlmAgent name>": {
+#       "latency": {...},                      # optional per-agent override
+#       "scripts": [
+#         {"match": "weather|날씨",             # regex on the latest user text
+#          "steps": [                          # one step per model call in a turn
+#            {"function_call": {"name": "_delegate_task",
+#                               "args": {"agent_name": "weather_agent", "message": "{query}"}}},
+#            {"text": "{tool_result}"}
+#          ]},
+#         {"steps": [{"text": "..."}]}         # no "match" = fallback
+#       ]
+#     }
+#   }
+# }
+#
+# Placeholders: {query} = latest user text, {tool_result} = latest tool output.
+# Supported latency distributions: fixed, uniform, normal, lognormal.
+# =============================================================================
+
+import os
+import re
+import json
+import random
+import asyncio
+import logging
+from typing import Any, AsyncGenerator, Dict, List
+
+from pydantic import PrivateAttr
+
+from google.adk.models.base_llm import BaseLlm
+from google.adk.models.llm_request import LlmRequest
+from google.adk.models.llm_response import LlmResponse
+from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+REPLAY_ENV = "A2A_LLM_REPLAY"
+DEFAULT_RECORDING = os.path.join(os.path.dirname(__file__), "recordings", "default.json")
+
+
+# -----------------------------------------------------------------------------
+# ⏱️ Latency sampling
+# -----------------------------------------------------------------------------
+def sample_latency(spec: Dict[str, Any] | None, rng: random.Random) -> float:
+    """Draw one latency (seconds) from a distribution spec; 0 if none is given."""
+    if not spec:
+        return 0.0
+    kind = spec.get("distribution", "fixed")
+    if kind == "fixed":
+        ms = spec.get("ms", 0)
+    elif kind == "uniform":
+        ms = rng.uniform(spec["min_ms"], spec["max_ms"])
+    elif kind == "normal":
+        ms = rng.gauss(spec["mean_ms"], spec.get("stddev_ms", 0))
+    elif kind == "lognormal":
+        ms = spec["median_ms"] * rng.lognormvariate(0, spec.get("sigma", 0.5))
+    else:
+        raise ValueError(f"Unknown latency distribution: {kind}")
+    return max(0.0, ms) / 1000
+
+
+# -----------------------------------------------------------------------------
+# 📼 ReplayLlm
+# -----------------------------------------------------------------------------
+class ReplayLlm(BaseLlm):
+    """
+    📼 An ADK model that answers from a recording instead of calling Gemini.
+
+    The step to replay is the number of tool results seen since the latest
+    user message, so a script of [tool call, text] produces one delegation
+    followed by a final answer within a single turn.
+    """
+
+    agent_name: str
+    recording: Dict[str, Any]
+
+    _rng: random.Random = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        super().model_post_init(__context)
+        self._rng = random.Random(self.recording.get("seed", 0))
+
+    @classmethod
+    def supported_models(cls) -> list[str]:
+        return [r"replay/.*"]
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        query, tool_result, step = self._read_turn(llm_request.contents or [])
+        agent_recording = self.recording.get("agents", {}).get(self.agent_name, {})
+        steps = self._pick_script(agent_recording.get("scripts", []), query)
+
+        latency = sample_latency(agent_recording.get("latency", self.recording.get("latency")), self._rng)
+        if latency:
+            await asyncio.sleep(latency)
+
+        if step < len(steps):
+            part = self._build_part(steps[step], query, tool_result)
+        else:
+            # Script exhausted: answer with the last tool output (or nothing)
+            part = types.Part.from_text(text=tool_result or "")
+        yield LlmResponse(content=types.Content(role="model", parts=[part]))
+
+    # -------------------------------------------------------------------------
+    # Helpers
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _read_turn(contents: List[types.Content]) -> tuple[str, str, int]:
+        """Return (latest user text, latest tool output, tool results since that user text)."""
+        query, tool_result, step = "", "", 0
+        for content in contents:
+            for part in content.parts or []:
+                if part.function_response is not None:
+                    step += 1
+                    response = part.function_response.response or {}
+                    tool_result = str(response.get("result", response))
+                elif content.role == "user" and part.text:
+                    query, tool_result, step = part.text, "", 0
+        return query, tool_result, step
+
+    @staticmethod
+    def _pick_script(scripts: List[Dict[str, Any]], query: str) -> List[Dict[str, Any]]:
+        for script in scripts:
+            pattern = script.get("match")
+            if pattern is None or re.search(pattern, query, re.IGNORECASE):
+                return script.get("steps", [])
+        return []
+
+    @classmethod
+    def _fill(cls, value: Any, query: str, tool_result: str) -> Any:
+        if isinstance(value, str):
+            return value.replace("{query}", query).replace("{tool_result}", tool_result)
+        if isinstance(value, dict):
+            return {k: cls._fill(v, query, tool_result) for k, v in value.items()}
+        if isinstance(value, list):
+            return [cls._fill(v, query, tool_result) for v in value]
+        return value
+
+    @classmethod
+    def _build_part(cls, step: Dict[str, Any], query: str, tool_result: str) -> types.Part:
+        if "function_call" in step:
+            call = step["function_call"]
+            return types.Part.from_function_call(
+                name=call["name"],
+                args=cls._fill(call.get("args", {}), query, tool_result),
+            )
+        return types.Part.from_text(text=cls._fill(step.get("text", ""), query, tool_result))
+
+
+# -----------------------------------------------------------------------------
+# 🔌 resolve_model: Hook used by every agent's _build_agent()
+# -----------------------------------------------------------------------------
+_recording_cache: Dict[str, Dict[str, Any]] = {}
+
+
+def load_recording(path: str) -> Dict[str, Any]:
+    """Load (and cache) a recording file; "default" means the bundled one."""
+    path = DEFAULT_RECORDING if path == "default" else path
+    if path not in _recording_cache:
+        with open(path, "r", encoding="utf-8") as f:
+            _recording_cache[path] = json.load(f)
+    return _recording_cache[path]
+
+
+def resolve_model(model: str, agent_name: str) -> str | BaseLlm:
+    """
+    Return `model` unchanged, or a ReplayLlm for `agent_name` when the
+    A2A_LLM_REPLAY environment variable points at a recording.
+    """
+    recording_path = os.getenv(REPLAY_ENV)
+    if not recording_path:
+        return model
+    logger.info(f"Using replay LLM for {agent_name} ({recording_path})")
+    return ReplayLlm(
+        model=f"replay/{agent_name}",
+        agent_name=agent_name,
+        recording=load_recording(recording_path),
+    )
@@ -0,0 +1,194 @@
+# =============================================================================
+# utilities/llm/runner_pool.py
+# =============================================================================
+# 🎯 Purpose:
+# A per-agent pool of ADK Runners plus the warm-up that A2AServer runs at
+# startup, so the first real request doesn't pay for SDK imports, model
+# client creation or session setup.
+#
+# ✅ Includes:
+# - RunnerPoolConfig: per-agent pool size and warm-up settings
+# - RunnerPool: hands each concurrent request its own Runner (and LlmAgent);
+#   all Runners in a pool share one session/memory/artifact service, so any
+#   Runner can continue any session
+# - run_async(): runs one request on a borrowed Runner; sessions are created,
+#   evicted and compacted by the pool's SessionManager (see session_manager.py),
+#   which only calls get_session/create_session the first time it sees an ID
+# =============================================================================
+
+import uuid
+import asyncio
+import logging
+import contextlib
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List
+
+from utilities.llm.helpers import maybe_await
+from utilities.llm.session_manager import SessionManager, SessionPolicy
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+    from google.adk.runners import Runner
+    from google.genai import types
+
+logger = logging.getLogger(__name__)
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ Configuration
+# -----------------------------------------------------------------------------
+@dataclass
+class RunnerPoolConfig:
+    size: int = 1                   # Runners built during warm-up
+    max_size: int | None = None     # Cap when all are busy (None = build more as needed)
+    warm_up: bool = True            # Run warm_up() when the server starts
+    warmup_query: str | None = None # Synthetic request for warm-up (None = skip; it may call the LLM)
+    sessions: SessionPolicy = field(default_factory=SessionPolicy)  # Session eviction/compaction
+
+
+# -----------------------------------------------------------------------------
+# 🏊 RunnerPool
+# -----------------------------------------------------------------------------
+class RunnerPool:
+    """
+    Pool of Runners built by `factory()`.
+
+    Usage:
+        async for event in pool.run_async(user_id, session_id, content):
+            ...
+    """
+
+    def __init__(self, factory: Callable[[], "Runner"], config: RunnerPoolConfig | None = None):
+        self._factory = factory
+        self.config = config or RunnerPoolConfig()
+        self._runners: List["Runner"] = []
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self.sessions = SessionManager(self.config.sessions)
+
+    @property
+    def primary(self) -> "Runner":
+        """The first Runner (built on demand); used by sync code and for session access."""
+        if not self._runners:
+            self._add(self._factory())
+        return self._runners[0]
+
+    def _add(self, runner: "Runner") -> "Runner":
+        self.sessions.bind(runner.app_name)
+        self._runners.append(runner)
+        self._idle.put_nowait(runner)
+        return runner
+
+    def _can_grow(self) -> bool:
+        return self.config.max_size is None or len(self._runners) < self.config.max_size
+
+    @contextlib.asynccontextmanager
+    async def acquire(self) -> AsyncIterator["Runner"]:
+        """Borrow an idle Runner, building one if none is idle and the pool may grow."""
+        if self._idle.empty() and self._can_grow():
+            self._add(self._factory())
+        runner = await self._idle.get()
+        try:
+            yield runner
+        finally:
+            self._idle.put_nowait(runner)
+
+    async def run_async(
+        self, user_id: str, session_id: str, new_message: "types.Content"
+    ) -> AsyncIterator["Event"]:
+        """Run one request on a borrowed Runner, keeping the session's lifecycle up to date."""
+        entry = await self.sessions.begin(self.primary, user_id, session_id)
+        try:
+            self.sessions.record(entry, new_message)
+            async with self.acquire() as runner:
+                async for event in runner.run_async(user_id=user_id, session_id=session_id, new_message=new_message):
+                    self.sessions.record(entry, event)
+                    yield event
+        finally:
+            await self.sessions.end(self.primary, user_id, session_id, entry)
+
+    async def session_state(self, user_id: str, session_id: str) -> Dict[str, Any]:
+        """A copy of the session's state (creating the session if needed)."""
+        runner = self.primary
+        entry = await self.sessions.begin(runner, user_id, session_id)
+        try:
+            session = await maybe_await(runner.session_service.get_session(
+                app_name=runner.app_name, user_id=user_id, session_id=session_id
+            ))
+            return dict(session.state)
+        finally:
+            await self.sessions.end(runner, user_id, session_id, entry)
+
+    async def record_turn(
+        self,
+        user_id: str,
+        session_id: str,
+        new_message: "types.Content",
+        reply: "types.Content",
+        state_delta: Dict[str, Any] | None = None,
+    ) -> None:
+        """
+        Append a turn answered without running the agent (user message and
+        reply) to the session, so later model calls still see it.
+        """
+        from google.adk.events import Event, EventActions
+
+        runner = self.primary
+        entry = await self.sessions.begin(runner, user_id, session_id)
+        try:
+            session = await maybe_await(runner.session_service.get_session(
+                app_name=runner.app_name, user_id=user_id, session_id=session_id
+            ))
+            invocation_id = f"e-{uuid.uuid4()}"
+            events = [
+                Event(invocation_id=invocation_id, author="user", content=new_message),
+                Event(
+                    invocation_id=invocation_id,
+                    author=runner.agent.name,
+                    content=reply,
+                    actions=EventActions(state_delta=state_delta or {}),
+                ),
+            ]
+            for event in events:
+                await maybe_await(runner.session_service.append_event(session, event))
+                self.sessions.record(entry, event)
+        finally:
+            await self.sessions.end(runner, user_id, session_id, entry)
+
+    # -------------------------------------------------------------------------
+    # Warm-up
+    # -------------------------------------------------------------------------
+    async def warm_up(self, user_id: str) -> None:
+        """
+        Build `config.size` Runners, create each one's model client, and run
+        `config.warmup_query` once through a throwaway session.
+        """
+        while len(self._runners) < self.config.size:
+            # The first build imports Google ADK; keep that off the event loop
+            self._add(await asyncio.to_thread(self._factory))
+
+        for runner in self._runners:
+            _init_model_client(runner)
+
+        runner = self.primary
+        session_id = f"warmup-{uuid.uuid4().hex}"
+        if self.config.warmup_query:
+            from google.genai import types
+
+            content = types.Content(role="user", parts=[types.Part.from_text(text=self.config.warmup_query)])
+            async for _ in self.run_async(user_id, session_id, content):
+                pass
+        else:
+            entry = await self.sessions.begin(runner, user_id, session_id)
+            await self.sessions.end(runner, user_id, session_id, entry)
+        await maybe_await(runner.session_service.delete_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        ))
+        self.sessions.forget(user_id, session_id)
+        logger.info(f"🔥 Warmed up {len(self._runners)} runner(s) for {runner.app_name}")
+
+
+def _init_model_client(runner: "Runner") -> None:
+    """Resolve the agent's model and create its API client now rather than on the first request."""
+    model = getattr(runner.agent, "canonical_model", None)
+    if model is not None and hasattr(type(model), "api_client"):
+        model.api_client  # Lazily created (and cached) by ADK's Gemini model
@@ -0,0 +1,264 @@
+# =============================================================================
+# utilities/llm/session_manager.py
+# =============================================================================
+# 🎯 Purpose:
+# Keeps an agent's ADK sessions bounded. Without it, every session_id ever
+# seen (CityTaskManager uses one per task) stays in InMemorySessionService
+# forever, with its full event history.
+#
+# ✅ Includes:
+# - SessionPolicy: idle TTL, max sessions, and history compaction limits
+# - SessionManager: tracks sessions in LRU order, deletes idle/excess ones,
+#   and replaces long histories with a short summary plus the recent events
+# - Gauges per agent: sessions held, events stored, approximate bytes
+#
+# Eviction runs whenever the agent handles a request, so memory is bounded
+# by traffic without a background task. Sessions in use are never evicted
+# or compacted.
+# =============================================================================
+
+import time
+import uuid
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, List, Tuple
+
+from utilities import metrics
+from utilities.llm.helpers import clip, maybe_await, recent_lines
+
+if TYPE_CHECKING:
+    from google.adk.events import Event
+    from google.adk.runners import Runner
+
+logger = logging.getLogger(__name__)
+
+SessionKey = Tuple[str, str]  # (user_id, session_id)
+_SUMMARY_PREFIX = "compaction-"  # invocation_id of the summary events we insert
+
+
+def _size(model: Any) -> int:
+    """Approximate memory footprint: the length of the model's JSON form."""
+    return len(model.model_dump_json(exclude_none=True))
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ Configuration
+# -----------------------------------------------------------------------------
+@dataclass
+class SessionPolicy:
+    idle_ttl: float | None = 1800.0  # Delete sessions unused for this many seconds (None = never)
+    max_sessions: int | None = 1000  # Delete least recently used sessions beyond this (None = no cap)
+    max_events: int | None = 60      # Compact a session once it stores more events (None = never)
+    keep_events: int = 20            # Recent events kept verbatim when compacting
+    summary_chars: int = 2000        # Size cap for the summary of compacted events
+
+
+@dataclass(slots=True)
+class _Entry:
+    last_used: float
+    events: int = 0
+    bytes: int = 0
+    in_use: int = 0
+    compacting: asyncio.Future | None = None  # Set while the history is being rewritten
+
+
+# -----------------------------------------------------------------------------
+# 🗂️ SessionManager
+# -----------------------------------------------------------------------------
+class SessionManager:
+    """
+    Lifecycle of the sessions used through one agent's Runners.
+
+    Usage:
+        entry = await sessions.begin(runner, user_id, session_id)
+        try:
+            ...  # run the agent, calling sessions.record(entry, event) per event
+        finally:
+            await sessions.end(runner, user_id, session_id, entry)
+    """
+
+    def __init__(self, policy: SessionPolicy | None = None):
+        self.policy = policy or SessionPolicy()
+        self.name: str | None = None
+        self._entries: "OrderedDict[SessionKey, _Entry]" = OrderedDict()  # Least recently used first
+        self._lock = asyncio.Lock()  # Serializes creating and deleting sessions
+
+    def bind(self, name: str) -> None:
+        """Label this manager's gauges with the agent (ADK app) name."""
+        if self.name is not None:
+            return
+        self.name = name
+        entries = self._entries
+        metrics.agent_sessions.labels(agent=name).set_function(lambda: len(entries))
+        metrics.agent_session_events.labels(agent=name).set_function(lambda: sum(e.events for e in entries.values()))
+        metrics.agent_session_bytes.labels(agent=name).set_function(lambda: sum(e.bytes for e in entries.values()))
+
+    # -------------------------------------------------------------------------
+    # Request lifecycle
+    # -------------------------------------------------------------------------
+    async def begin(self, runner: "Runner", user_id: str, session_id: str) -> _Entry:
+        """Make sure the session exists and mark it in use. Evicts idle/excess sessions."""
+        key = (user_id, session_id)
+        while True:
+            entry = self._entries.get(key)
+            if entry is None:
+                async with self._lock:
+                    entry = self._entries.get(key)  # A concurrent request may have created it
+                    if entry is None:
+                        entry = await self._open(runner, key)
+            if entry.compacting is None:
+                break
+            await asyncio.shield(entry.compacting)  # Then look the entry up again
+
+        entry.in_use += 1
+        self._touch(key, entry)
+        await self._evict(runner)
+        return entry
+
+    def record(self, entry: _Entry, event: Any) -> None:
+        """Account for an event (or the user message) stored in the session."""
+        if not getattr(event, "partial", False):
+            entry.events += 1
+            entry.bytes += _size(event)
+
+    async def end(self, runner: "Runner", user_id: str, session_id: str, entry: _Entry) -> None:
+        """Mark the session idle again and compact its history if it grew too long."""
+        key = (user_id, session_id)
+        entry.in_use -= 1
+        if key in self._entries:
+            self._touch(key, entry)
+        max_events = self.policy.max_events
+        if max_events is not None and entry.events > max_events and entry.in_use == 0 and key in self._entries:
+            try:
+                await self._compact(runner, key, entry)
+            except Exception as e:
+                # Re-read the session on its next use (re-created if the failure left it deleted)
+                self._entries.pop(key, None)
+                logger.warning(f"⚠️ Could not compact session {session_id}: {e}")
+
+    def forget(self, user_id: str, session_id: str) -> None:
+        """Stop tracking a session deleted elsewhere (the next request re-creates it)."""
+        self._entries.pop((user_id, session_id), None)
+
+    # -------------------------------------------------------------------------
+    # Internals
+    # -------------------------------------------------------------------------
+    def _touch(self, key: SessionKey, entry: _Entry) -> None:
+        entry.last_used = time.monotonic()
+        self._entries.move_to_end(key)
+
+    async def _open(self, runner: "Runner", key: SessionKey) -> _Entry:
+        user_id, session_id = key
+        service = runner.session_service
+        session = await maybe_await(service.get_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        ))
+        if session is None:
+            await maybe_await(service.create_session(
+                app_name=runner.app_name, user_id=user_id, session_id=session_id, state={}
+            ))
+            entry = _Entry(last_used=time.monotonic())
+        else:
+            entry = _Entry(
+                last_used=time.monotonic(),
+                events=len(session.events),
+                bytes=sum(_size(event) for event in session.events),
+            )
+        self._entries[key] = entry
+        return entry
+
+    async def _evict(self, runner: "Runner") -> None:
+        ttl, max_sessions = self.policy.idle_ttl, self.policy.max_sessions
+        if ttl is None and max_sessions is None:
+            return
+        now = time.monotonic()
+        async with self._lock:
+            for key, entry in list(self._entries.items()):
+                over = max_sessions is not None and len(self._entries) > max_sessions
+                expired = ttl is not None and now - entry.last_used > ttl
+                if not (over or expired):
+                    break  # Entries are in LRU order, so the rest are newer
+                if entry.in_use or entry.compacting is not None:
+                    continue
+                del self._entries[key]
+                await self._delete(runner, key)
+                metrics.agent_session_evictions.labels(agent=self.name, reason="ttl" if expired else "lru").inc()
+
+    async def _delete(self, runner: "Runner", key: SessionKey) -> None:
+        user_id, session_id = key
+        await maybe_await(runner.session_service.delete_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        ))
+
+    async def _compact(self, runner: "Runner", key: SessionKey, entry: _Entry) -> None:
+        """
+        Re-create the session as [summary of older events] + recent events.
+        The cut is moved back to a user turn so function calls and their
+        responses are never separated.
+        """
+        user_id, session_id = key
+        service = runner.session_service
+        session = await maybe_await(service.get_session(
+            app_name=runner.app_name, user_id=user_id, session_id=session_id
+        ))
+        if session is None:
+            self._entries.pop(key, None)
+            return
+
+        events = session.events
+        cut = max(0, len(events) - self.policy.keep_events)
+        while cut > 0 and events[cut].author != "user":
+            cut -= 1
+        if cut == 0:
+            entry.events = len(events)  # One long turn; nothing to cut safely
+            return
+
+        from google.adk.events import Event
+        from google.genai import types
+
+        summary = Event(
+            invocation_id=f"{_SUMMARY_PREFIX}{uuid.uuid4().hex}",
+            author="user",
+            content=types.Content(role="user", parts=[types.Part.from_text(
+                text=_summarize(events[:cut], self.policy.summary_chars)
+            )]),
+        )
+        kept = [summary, *events[cut:]]
+        state = {k: v for k, v in session.state.items() if not k.startswith("temp:")}
+
+        entry.compacting = asyncio.get_running_loop().create_future()
+        try:
+            await self._delete(runner, key)
+            fresh = await maybe_await(service.create_session(
+                app_name=runner.app_name, user_id=user_id, session_id=session_id, state=state
+            ))
+            for event in kept:
+                await maybe_await(service.append_event(fresh, event))
+            entry.events = len(kept)
+            entry.bytes = sum(_size(event) for event in kept)
+            metrics.agent_session_compactions.labels(agent=self.name).inc()
+            logger.debug(f"🗜️ Compacted session {session_id}: {len(events)} → {len(kept)} events")
+        finally:
+            entry.compacting.set_result(None)
+            entry.compacting = None
+
+
+def _summarize(events: List["Event"], limit: int) -> str:
+    """Plain-text digest of `events`, keeping the most recent lines that fit in `limit` chars."""
+    lines = []
+    for event in events:
+        if not event.content or not event.content.parts:
+            continue
+        if event.invocation_id.startswith(_SUMMARY_PREFIX):
+            # An earlier summary: carry its lines over instead of summarizing it again
+            lines.extend(event.content.parts[0].text.splitlines()[1:])
+            continue
+        for part in event.content.parts:
+            if part.text:
+                lines.append(f"{event.author}: {clip(part.text, 200)}")
+            elif part.function_call:
+                lines.append(f"{event.author} called {part.function_call.name}")
+
+    return recent_lines(f"[Summary of {len(events)} earlier events in this conversation]", lines, limit)
@@ -19,6 +19,12 @@ from mcp.client.stdio import stdio_client
 # Local utility to read MCP server configuration
 from utilities.mcp.mcp_discovery import MCPDiscovery
 
+# Span around each tool invocation
+from utilities.tracing import tracer
+
+# Reuse results of read-only tools called again with the same arguments
+from utilities.tool_cache import CachePolicy, tool_cache
+
 # Load environment variables (e.g., API keys) from .env into os.environ
 load_dotenv()
 
@@ -36,6 +42,8 @@ class MCPTool:
         name (str): Identifier for the tool (e.g., "run_command").
         description (str): Human-readable description of the tool.
         input_schema (dict): JSON schema defining the tool's expected arguments.
+        cache_policy (CachePolicy): Whether/how long results may be reused,
+            from the tool's MCP annotations (read-only tools only).
         _params (StdioServerParameters): Command/args to start the MCP server.
     """
     def __init__(
@@ -44,20 +52,23 @@ class MCPTool:
         description: str,
         input_schema: dict,
         server_cmd: str,
-        server_args: list[str]
+        server_args: list[str],
+        annotations=None
     ):
         # Store the tool's name and description for later reference
         self.name = name
         self.description = description
         # Save the JSON schema to validate the `args` passed to run()
         self.input_schema = input_schema
+        # Decide cacheability from the hints the server declared for this tool
+        self.cache_policy = CachePolicy.from_mcp_annotations(annotations)
         # Prepare stdio connection params so we can spawn the server on each call
         self._params = StdioServerParameters(
             command=server_cmd,
             args=server_args
         )
 
-    async def run(self, args: dict) -> str:
+    async def run(self, args: dict, session_id: str = None) -> str:
         """
         Invoke the tool by:
           1. Spawning the MCP server via stdio
@@ -65,19 +76,32 @@ class MCPTool:
           3. Calling the named tool with provided arguments
           4. Closing the session automatically on exit
 
+        Cacheable tools (see `cache_policy`) skip all of this when the same
+        arguments were used recently.
+
+        Args:
+            args: Arguments for the tool
+            session_id: Scopes cached results to one conversation (session-scoped tools)
+
         Returns:
             The `content` from the tool's response, or the raw response if no content.
         """
-        # Create a stdio connection to the MCP server (ephemeral session)
-        async with stdio_client(self._params) as (read_stream, write_stream):
-            # Wrap the stdio streams in an MCP ClientSession
-            async with ClientSession(read_stream, write_stream) as sess:
-                # Perform any handshake or setup required by MCP
-                await sess.initialize()
-                # Call the tool on the server with given arguments
-                resp = await sess.call_tool(self.name, args)
-                # Return the `content` attribute if present, else string-ify the response
-                return getattr(resp, "content", str(resp))
+        return await tool_cache.get_or_call(
+            f"mcp:{self.name}", args, self.cache_policy, lambda: self._call(args), session_id=session_id
+        )
+
+    async def _call(self, args: dict) -> str:
+        with tracer.span("MCPTool.run", tool=self.name):
+            # Create a stdio connection to the MCP server (ephemeral session)
+            async with stdio_client(self._params) as (read_stream, write_stream):
+                # Wrap the stdio streams in an MCP ClientSession
+                async with ClientSession(read_stream, write_stream) as sess:
+                    # Perform any handshake or setup required by MCP
+                    await sess.initialize()
+                    # Call the tool on the server with given arguments
+                    resp = await sess.call_tool(self.name, args)
+                    # Return the `content` attribute if present, else string-ify the response
+                    return getattr(resp, "content", str(resp))
 
 
 class MCPConnector:
@@ -132,7 +156,8 @@ class MCPConnector:
                                         description=t.description,
                                         input_schema=t.inputSchema,
                                         server_cmd=cmd,
-                                        server_args=args
+                                        server_args=args,
+                                        annotations=getattr(t, "annotations", None)
                                     )
                                 )
                             logger.info(
@@ -0,0 +1,341 @@
+# =============================================================================
+# utilities/metrics.py
+# =============================================================================
+# 🎯 Purpose:
+# Low-overhead Prometheus metrics for the A2A stack, exposed by A2AServer
+# on GET /metrics in the Prometheus text format (version 0.0.4).
+#
+# ✅ Includes:
+# - Counter, Gauge and Histogram with labels
+# - Per-thread value cells: writers only touch their own thread's cell,
+#   so recording never takes a lock; /metrics sums the cells when scraped
+# - The metrics the A2A server, task managers, agents and connectors record
+# - LlmCallTimer: ADK model callbacks that time every LLM call
+# =============================================================================
+
+import math
+import time
+import bisect
+import threading
+import weakref
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Latency buckets (seconds), from fast in-process work to slow LLM calls
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+# -----------------------------------------------------------------------------
+# 🧮 Per-thread cells
+# -----------------------------------------------------------------------------
+class _Cells:
+    """
+    One list of numbers per writing thread.
+
+    A thread creates its cell once (under a lock) and afterwards updates it
+    without any synchronization. Readers add the cells up; a scrape may see
+    a write from another thread a moment late, which is fine for metrics.
+    """
+
+    __slots__ = ("_size", "_local", "_cells", "_lock")
+
+    def __init__(self, size: int):
+        self._size = size
+        self._local = threading.local()
+        self._cells: List[List[float]] = []
+        self._lock = threading.Lock()
+
+    def mine(self) -> List[float]:
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = [0.0] * self._size
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+        return cell
+
+    def total(self) -> List[float]:
+        with self._lock:
+            cells = list(self._cells)
+        return [sum(column) for column in zip(*cells)] if cells else [0.0] * self._size
+
+
+# -----------------------------------------------------------------------------
+# 📏 Metric children (one per label combination)
+# -----------------------------------------------------------------------------
+class _CounterChild:
+    __slots__ = ("_cells",)
+
+    def __init__(self, metric: "Counter"):
+        self._cells = _Cells(1)
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        self._cells.mine()[0] += amount
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        return [f"{name}{labels} {_format(self._cells.total()[0])}"]
+
+
+class _GaugeChild:
+    __slots__ = ("_cells", "_function")
+
+    def __init__(self, metric: "Gauge"):
+        self._cells = _Cells(1)
+        self._function: Callable[[], float] | None = None
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._cells.mine()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._cells.mine()[0] -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """
+        Read the value from `function()` at scrape time (e.g. a dict's size).
+        The child keeps `function` (and what it closes over) alive; for
+        objects that come and go, pass weak_method(obj.method).
+        """
+        self._function = function
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        value = self._function() if self._function is not None else self._cells.total()[0]
+        return [f"{name}{labels} {_format(value)}"]
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_cells")
+
+    def __init__(self, metric: "Histogram"):
+        self._bounds = metric.buckets
+        # Layout: one count per bucket, then +Inf, then sum
+        self._cells = _Cells(len(self._bounds) + 2)
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.mine()
+        cell[bisect.bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    def samples(self, name: str, labels: str) -> List[str]:
+        totals = self._cells.total()
+        lines, cumulative = [], 0.0
+        for bound, count in zip((*self._bounds, math.inf), totals):
+            cumulative += count
+            lines.append(f"{name}_bucket{_with_le(labels, bound)} {_format(cumulative)}")
+        lines.append(f"{name}_sum{labels} {_format(totals[-1])}")
+        lines.append(f"{name}_count{labels} {_format(cumulative)}")
+        return lines
+
+
+# -----------------------------------------------------------------------------
+# 📊 Metrics
+# -----------------------------------------------------------------------------
+class _Metric:
+    kind = ""
+    child_class: type = object
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry: "MetricsRegistry | None" = None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        (registry if registry is not None else REGISTRY).register(self)
+
+    def labels(self, **labelvalues: Any):
+        """Return the child for one label combination, creating it on first use."""
+        key = tuple(str(labelvalues[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children.setdefault(key, self.child_class(self))
+        return child
+
+    def remove(self, **labelvalues: Any) -> None:
+        """Drop the child for one label combination (e.g. a replica that went away)."""
+        self._children.pop(tuple(str(labelvalues[name]) for name in self.labelnames), None)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        for key, child in list(self._children.items()):
+            lines.extend(child.samples(self.name, _format_labels(self.labelnames, key)))
+        return lines
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, e.g. requests served (name it `..._total`)."""
+    kind = "counter"
+    child_class = _CounterChild
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, e.g. requests in flight or tasks stored."""
+    kind = "gauge"
+    child_class = _GaugeChild
+
+
+class Histogram(_Metric):
+    """Observations (e.g. durations in seconds) counted into cumulative buckets."""
+    kind = "histogram"
+    child_class = _HistogramChild
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS, registry: "MetricsRegistry | None" = None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+
+def weak_method(method: Callable[[], float], default: float = 0.0) -> Callable[[], float]:
+    """A set_function callable that doesn't keep `method`'s object alive (`default` once it's gone)."""
+    ref = weakref.WeakMethod(method)
+
+    def read() -> float:
+        bound = ref()
+        return bound() if bound is not None else default
+    return read
+
+
+class MetricsRegistry:
+    """Holds metrics and renders them for a /metrics scrape."""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> None:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# -----------------------------------------------------------------------------
+# 🔤 Text format helpers
+# -----------------------------------------------------------------------------
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _with_le(labels: str, bound: float) -> str:
+    le = f'le="{_format(bound)}"'
+    return "{" + le + "}" if not labels else labels[:-1] + "," + le + "}"
+
+
+# -----------------------------------------------------------------------------
+# 📈 A2A metrics
+# -----------------------------------------------------------------------------
+REGISTRY = MetricsRegistry()
+
+requests_total = Counter(
+    "a2a_requests_total", "JSON-RPC requests handled, by agent, method and outcome",
+    ["agent_id", "method", "outcome"],
+)
+request_duration = Histogram(
+    "a2a_request_duration_seconds", "Time to handle one JSON-RPC request",
+    ["agent_id", "method"],
+)
+requests_in_flight = Gauge(
+    "a2a_requests_in_flight", "JSON-RPC requests currently being handled",
+    ["agent_id"],
+)
+task_state_transitions = Counter(
+    "a2a_task_state_transitions_total", "Task status changes, by the state entered",
+    ["agent_id", "state"],
+)
+duplicate_sends = Counter(
+    "a2a_task_duplicate_sends_total", "Retried tasks/send requests answered without running the agent again",
+    ["agent_id"],
+)
+blob_bytes = Counter(
+    "a2a_blob_bytes_total", "Bytes uploaded to / downloaded from the server's blob store",
+    ["direction"],
+)
+tasks_stored = Gauge(
+    "a2a_tasks_stored", "Tasks held in the task manager's in-memory store",
+    ["agent_id"],
+)
+llm_call_duration = Histogram(
+    "a2a_llm_call_duration_seconds", "Duration of individual LLM calls made by ADK agents",
+    ["agent", "outcome"],
+)
+connector_request_duration = Histogram(
+    "a2a_connector_request_duration_seconds", "Latency of tasks delegated through AgentConnector",
+    ["agent", "outcome"],
+)
+agent_sessions = Gauge(
+    "a2a_agent_sessions", "ADK sessions an agent holds in memory",
+    ["agent"],
+)
+agent_session_events = Gauge(
+    "a2a_agent_session_events", "Events stored across an agent's ADK sessions",
+    ["agent"],
+)
+agent_session_bytes = Gauge(
+    "a2a_agent_session_bytes", "Approximate serialized size of an agent's ADK sessions",
+    ["agent"],
+)
+agent_session_evictions = Counter(
+    "a2a_agent_session_evictions_total", "ADK sessions deleted for being idle (ttl) or least recently used (lru)",
+    ["agent", "reason"],
+)
+agent_session_compactions = Counter(
+    "a2a_agent_session_compactions_total", "Times a session's event history was replaced by a summary",
+    ["agent"],
+)
+
+
+# -----------------------------------------------------------------------------
+# ⏱️ LlmCallTimer: ADK model callbacks feeding llm_call_duration
+# -----------------------------------------------------------------------------
+class LlmCallTimer:
+    """
+    Times each model call of an LlmAgent.
+
+    Usage:
+        LlmAgent(..., **LlmCallTimer("city_info_agent").callbacks())
+    """
+
+    def __init__(self, agent_name: str):
+        self.agent_name = agent_name
+        self._started: Dict[str, float] = {}  # invocation ID -> start of the current model call
+
+    def callbacks(self) -> Dict[str, Callable]:
+        return {
+            "before_model_callback": self.before_model,
+            "after_model_callback": self.after_model,
+            "on_model_error_callback": self.on_model_error,
+        }
+
+    def before_model(self, callback_context, llm_request) -> None:
+        self._started[callback_context.invocation_id] = time.perf_counter()
+        return None  # Never replaces the model call
+
+    def after_model(self, callback_context, llm_response) -> None:
+        outcome = "error" if getattr(llm_response, "error_code", None) else "ok"
+        self._record(callback_context.invocation_id, outcome)
+        return None
+
+    def on_model_error(self, callback_context, llm_request, error) -> None:
+        self._record(callback_context.invocation_id, "error")
+        return None  # Let ADK raise the original error
+
+    def _record(self, invocation_id: str, outcome: str) -> None:
+        started = self._started.pop(invocation_id, None)
+        if started is not None:
+            llm_call_duration.labels(agent=self.agent_name, outcome=outcome).observe(time.perf_counter() - started)
@@ -0,0 +1,205 @@
+# =============================================================================
+# utilities/profiling.py
+# =============================================================================
+# 🎯 Purpose:
+# Tools for finding where time goes inside a live A2A server.
+#
+# ✅ Includes:
+# - SamplingProfiler: samples the stacks of every thread (event loop and
+#   worker threads) for N seconds and returns collapsed stacks (for
+#   flamegraph.pl / speedscope) or a speedscope JSON file
+# - EventLoopLagMonitor: a heartbeat on the event loop plus a watchdog
+#   thread; when the loop is stuck longer than a threshold, the watchdog
+#   logs the stack of the blocking call while it is still running
+#
+# Sampling uses sys._current_frames() from a separate thread, so nothing
+# has to be instrumented and the overhead is only paid while profiling.
+# =============================================================================
+
+import sys
+import time
+import asyncio
+import logging
+import threading
+import traceback
+from collections import Counter
+from typing import Any, Dict, List, Tuple
+
+from utilities.metrics import Histogram
+
+logger = logging.getLogger(__name__)
+
+loop_lag = Histogram(
+    "a2a_event_loop_lag_seconds", "How late the event loop ran a scheduled heartbeat",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+# (file, line, function) identifies one frame
+FrameKey = Tuple[str, int, str]
+
+
+def _frame_key(frame) -> FrameKey:
+    code = frame.f_code
+    return (code.co_filename, code.co_firstlineno, getattr(code, "co_qualname", code.co_name))
+
+
+def _stack(frame) -> Tuple[FrameKey, ...]:
+    """Frames of one thread, outermost first."""
+    keys = []
+    while frame is not None:
+        keys.append(_frame_key(frame))
+        frame = frame.f_back
+    keys.reverse()
+    return tuple(keys)
+
+
+# -----------------------------------------------------------------------------
+# 🔬 SamplingProfiler
+# -----------------------------------------------------------------------------
+class SamplingProfiler:
+    """
+    Samples all thread stacks at a fixed interval.
+
+    Usage:
+        profiler = SamplingProfiler(interval=0.005)
+        profiler.run(seconds=10)          # blocking; call it from a worker thread
+        text = profiler.collapsed()
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.samples: Counter = Counter()   # (thread name, stack) -> times seen
+        self.duration = 0.0
+
+    def run(self, seconds: float) -> "SamplingProfiler":
+        """Sample for `seconds`, skipping the calling thread itself."""
+        me = threading.get_ident()
+        start = time.perf_counter()
+        deadline = start + seconds
+        while time.perf_counter() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id != me:
+                    self.samples[(names.get(thread_id, str(thread_id)), _stack(frame))] += 1
+            time.sleep(self.interval)
+        self.duration = time.perf_counter() - start
+        return self
+
+    # -------------------------------------------------------------------------
+    # Output formats
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _label(key: FrameKey) -> str:
+        filename, line, function = key
+        return f"{function} ({filename}:{line})".replace(";", ":")
+
+    def collapsed(self) -> str:
+        """One line per unique stack: "thread;outer;...;inner <count>"."""
+        lines = []
+        for (thread_name, stack), count in self.samples.most_common():
+            frames = ";".join(self._label(key) for key in stack)
+            lines.append(f"{thread_name};{frames} {count}")
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str = "a2a-server") -> Dict[str, Any]:
+        """A speedscope file (https://www.speedscope.app) with one sampled profile per thread."""
+        frame_index: Dict[FrameKey, int] = {}
+        frames: List[Dict[str, Any]] = []
+        profiles: Dict[str, Dict[str, Any]] = {}
+
+        for (thread_name, stack), count in self.samples.items():
+            indices = []
+            for key in stack:
+                if key not in frame_index:
+                    frame_index[key] = len(frames)
+                    frames.append({"name": key[2], "file": key[0], "line": key[1]})
+                indices.append(frame_index[key])
+            profile = profiles.setdefault(thread_name, {
+                "type": "sampled",
+                "name": thread_name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": round(self.duration, 6),
+                "samples": [],
+                "weights": [],
+            })
+            profile["samples"].append(indices)
+            profile["weights"].append(round(count * self.interval, 6))
+
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "a2a SamplingProfiler",
+            "activeProfileIndex": 0,
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
+
+
+# -----------------------------------------------------------------------------
+# 🐢 EventLoopLagMonitor
+# -----------------------------------------------------------------------------
+class EventLoopLagMonitor:
+    """
+    Detects blocking calls on the event loop.
+
+    A heartbeat coroutine wakes up every `interval` seconds and records how
+    late it ran (a2a_event_loop_lag_seconds). A watchdog thread checks the
+    heartbeat; if the loop has not run it for `threshold` seconds, the
+    watchdog logs the loop thread's current stack, which is the blocking call.
+    """
+
+    def __init__(self, threshold: float = 0.1, interval: float = 0.05):
+        self.threshold = threshold
+        self.interval = interval
+        self._last_beat = 0.0
+        self._loop_thread_id: int | None = None
+        self._heartbeat: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        """Start monitoring the running event loop (call from inside it)."""
+        if self._heartbeat is not None:
+            return
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._stopped.clear()
+        self._heartbeat = asyncio.create_task(self._beat())
+        self._watchdog = threading.Thread(target=self._watch, name="a2a-loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        if self._heartbeat is None:
+            return
+        self._stopped.set()
+        self._heartbeat.cancel()
+        await asyncio.gather(self._heartbeat, return_exceptions=True)
+        self._heartbeat = None
+        await asyncio.to_thread(self._watchdog.join)
+        self._watchdog = None
+
+    async def _beat(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            loop_lag.labels().observe(max(0.0, now - expected))
+            self._last_beat = now
+
+    def _watch(self) -> None:
+        reported_beat = None  # Log each stall once, not on every check
+        while not self._stopped.wait(self.interval):
+            beat = self._last_beat
+            stalled = time.perf_counter() - beat - self.interval
+            if stalled < self.threshold or beat == reported_beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            reported_beat = beat
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(
+                f"🐢 Event loop has been blocked for {stalled * 1000:.0f} ms "
+                f"(threshold {self.threshold * 1000:.0f} ms). Blocking call:\n{stack}"
+            )
@@ -0,0 +1,199 @@
+# =============================================================================
+# utilities/tool_cache.py
+# =============================================================================
+# 🎯 Purpose:
+# Reuse tool results within an orchestrator session (or across sessions)
+# instead of repeating the same A2A delegation or MCP call.
+#
+# ✅ Includes:
+# - CachePolicy: whether a tool's results may be cached, for how long, and
+#   in which scope ("session" or "global"); built from what the tool
+#   declares about itself:
+#     * A2A agents: `cacheTtl` / `cacheScope` on their AgentCard skills
+#     * MCP tools: readOnlyHint without openWorldHint (+ optional `cacheTtl`)
+# - ToolResultCache: TTL + LRU cache keyed on (scope, tool, args with
+#   sorted keys); identical concurrent calls share one execution
+# - fold_text(): case/whitespace folding for free-text arguments that
+#   callers opt into (A2A delegation messages)
+# - Metrics: a2a_tool_cache_requests_total{tool,result} and
+#   a2a_tool_cache_hit_ratio{tool}
+#
+# Tools that declare nothing are never cached.
+# =============================================================================
+
+import time
+import json
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Tuple
+
+from utilities.metrics import Counter, Gauge
+
+logger = logging.getLogger(__name__)
+
+tool_cache_requests = Counter(
+    "a2a_tool_cache_requests_total", "Tool calls looked up in the tool-result cache, by hit or miss",
+    ["tool", "result"],
+)
+tool_cache_hit_ratio = Gauge(
+    "a2a_tool_cache_hit_ratio", "Share of cacheable tool calls answered from the cache",
+    ["tool"],
+)
+
+SESSION = "session"
+GLOBAL = "global"
+
+
+# -----------------------------------------------------------------------------
+# ⚙️ CachePolicy
+# -----------------------------------------------------------------------------
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl: float = 0.0       # Seconds a result stays valid (0 = not cacheable)
+    scope: str = SESSION   # SESSION: reuse within one session only; GLOBAL: across sessions
+
+    @property
+    def cacheable(self) -> bool:
+        return self.ttl > 0
+
+    @classmethod
+    def from_skills(cls, skills: Iterable[Any]) -> "CachePolicy":
+        """
+        Policy for delegating to an A2A agent, from its AgentCard skills.
+        Results are cacheable only if every skill declares `cacheTtl`; the
+        shortest TTL wins, and any session-scoped skill makes it session-scoped.
+        """
+        skills = list(skills or [])
+        if not skills or any(not skill.cacheTtl for skill in skills):
+            return cls()
+        scope = GLOBAL if all(skill.cacheScope == GLOBAL for skill in skills) else SESSION
+        return cls(ttl=min(skill.cacheTtl for skill in skills), scope=scope)
+
+    @classmethod
+    def from_mcp_annotations(cls, annotations: Any, default_ttl: float = 60.0) -> "CachePolicy":
+        """
+        Policy for an MCP tool, from its ToolAnnotations. Only tools marked
+        read-only (and not open-world, i.e. not reading changing external
+        state) are cached; an extra `cacheTtl` annotation overrides the TTL.
+        """
+        if annotations is None or not getattr(annotations, "readOnlyHint", False):
+            return cls()
+        if getattr(annotations, "openWorldHint", None):
+            return cls()
+        extra = getattr(annotations, "model_extra", None) or {}
+        return cls(ttl=float(extra.get("cacheTtl", default_ttl)), scope=extra.get("cacheScope", GLOBAL))
+
+
+def normalize_args(args: Dict[str, Any]) -> str:
+    """Stable key for tool arguments: the JSON of `args` with sorted keys (values are kept as-is)."""
+    return json.dumps(args or {}, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def fold_text(text: str) -> str:
+    """
+    Case-folded, whitespace-collapsed text, for free-text arguments where
+    "Weather in  Seoul" and "weather in seoul" are the same query (e.g. a
+    delegation message). Not applied by normalize_args: paths, IDs or code
+    differ when their case or spacing does.
+    """
+    return " ".join(text.split()).casefold()
+
+
+# -----------------------------------------------------------------------------
+# 🗄️ ToolResultCache
+# -----------------------------------------------------------------------------
+class ToolResultCache:
+    """
+    Usage:
+        result = await tool_cache.get_or_call(
+            "_delegate_task:weather_agent", {"message": msg}, policy,
+            lambda: connector.send_task(msg, session_id), session_id=session_id,
+        )
+    """
+
+    def __init__(self, max_entries: int = 10_000):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Future] = {}
+        self._counts: Dict[str, list] = {}  # tool -> [hits, misses]
+
+    async def get_or_call(
+        self,
+        tool: str,
+        args: Dict[str, Any],
+        policy: CachePolicy,
+        call: Callable[[], Awaitable[Any]],
+        session_id: str | None = None,
+    ) -> Any:
+        """Return a cached result for (tool, args), or await `call()` and cache what it returns."""
+        if not policy.cacheable:
+            return await call()
+        if policy.scope == SESSION and session_id is None:
+            return await call()  # No session to scope the entry to
+
+        key = (session_id if policy.scope == SESSION else "", tool, normalize_args(args))
+        cached = self._entries.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self._count(tool, hit=True)
+            return cached[1]
+
+        # An identical call is already running: wait for its result instead
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self._count(tool, hit=True)
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # We were cancelled ourselves
+                return await self.get_or_call(tool, args, policy, call, session_id)  # Its caller was
+
+        self._count(tool, hit=False)
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            # Failures are not cached; waiters get the same error
+            future.set_exception(e)
+            future.exception()  # Mark retrieved, so an unawaited failure isn't logged
+            raise
+        finally:
+            self._in_flight.pop(key, None)
+        future.set_result(result)
+        self._put(key, result, policy.ttl)
+        return result
+
+    def invalidate(self, session_id: str | None = None) -> None:
+        """Drop the entries of one session (or everything when no session is given)."""
+        if session_id is None:
+            self._entries.clear()
+            return
+        for key in [key for key in self._entries if key[0] == session_id]:
+            del self._entries[key]
+
+    def _put(self, key: Tuple[str, str, str], result: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _count(self, tool: str, hit: bool) -> None:
+        counts = self._counts.get(tool)
+        if counts is None:
+            counts = self._counts[tool] = [0, 0]
+            tool_cache_hit_ratio.labels(tool=tool).set_function(
+                lambda: counts[0] / (counts[0] + counts[1]) if counts[0] + counts[1] else 0.0
+            )
+        counts[0 if hit else 1] += 1
+        tool_cache_requests.labels(tool=tool, result="hit" if hit else "miss").inc()
+
+
+# 🌍 Shared by every agent and MCP tool in this process
+tool_cache = ToolResultCache()
@@ -0,0 +1,299 @@
+# =============================================================================
+# utilities/tracing.py
+# =============================================================================
+# 🎯 Purpose:
+# Lightweight, OpenTelemetry-style tracing for the A2A stack.
+#
+# ✅ Includes:
+# - Spans with trace/span/parent IDs, timings, attributes and error status
+# - Context propagation with contextvars (works across awaits and tasks)
+# - W3C `traceparent` propagation through JSON-RPC `params.metadata`,
+#   so an orchestrator → domain agent hop shows up as one trace
+# - Background batch export to a JSON-lines file and/or an OTLP/HTTP (JSON)
+#   collector such as test_client/trace_collector.py
+#
+# ⚙️ Configuration (environment variables):
+# - A2A_TRACE_FILE=/tmp/a2a_spans.jsonl          → append spans to a file
+# - A2A_TRACE_OTLP_ENDPOINT=http://localhost:4318/v1/traces
+#                                                → POST spans in OTLP/JSON
+# - A2A_SERVICE_NAME=city-agent                  → service.name resource attribute
+# Tracing is disabled (near-zero overhead) when no exporter is configured.
+# =============================================================================
+
+import os
+import json
+import time
+import queue
+import atexit
+import logging
+import secrets
+import threading
+import contextvars
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+TRACEPARENT_KEY = "traceparent"
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar("a2a_current_span", default=None)
+
+
+# -----------------------------------------------------------------------------
+# 🧩 Span
+# -----------------------------------------------------------------------------
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = attributes
+        self.error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-01"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start_ns": self.start_ns,
+            "end_ns": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class _RemoteParent:
+    """Parent context received from another process via `traceparent`."""
+
+    __slots__ = ("trace_id", "span_id")
+
+    def __init__(self, trace_id: str, span_id: str):
+        self.trace_id = trace_id
+        self.span_id = span_id
+
+
+def parse_traceparent(value: str | None) -> _RemoteParent | None:
+    """Parse a W3C traceparent header value ("00-<trace>-<span>-<flags>")."""
+    if not value:
+        return None
+    parts = value.split("-")
+    if len(parts) != 4 or len(parts[1]) != 32 or len(parts[2]) != 16:
+        return None
+    return _RemoteParent(parts[1], parts[2])
+
+
+# -----------------------------------------------------------------------------
+# 📤 Exporters
+# -----------------------------------------------------------------------------
+class FileSpanExporter:
+    """Appends finished spans to a file, one JSON object per line."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, spans: List[Dict[str, Any]], service_name: str) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in spans:
+                f.write(json.dumps({"service": service_name, **span}, default=str) + "\n")
+
+
+class OTLPHttpSpanExporter:
+    """POSTs spans to an OTLP/HTTP collector using the OTLP JSON encoding."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.endpoint = endpoint
+        self._client = httpx.Client(timeout=timeout)
+
+    @staticmethod
+    def _attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+        encoded = []
+        for key, value in values.items():
+            if isinstance(value, bool):
+                encoded.append({"key": key, "value": {"boolValue": value}})
+            elif isinstance(value, int):
+                encoded.append({"key": key, "value": {"intValue": str(value)}})
+            elif isinstance(value, float):
+                encoded.append({"key": key, "value": {"doubleValue": value}})
+            else:
+                encoded.append({"key": key, "value": {"stringValue": str(value)}})
+        return encoded
+
+    def export(self, spans: List[Dict[str, Any]], service_name: str) -> None:
+        otlp_spans = []
+        for span in spans:
+            otlp_span = {
+                "traceId": span["trace_id"],
+                "spanId": span["span_id"],
+                "name": span["name"],
+                "kind": 1,
+                "startTimeUnixNano": str(span["start_ns"]),
+                "endTimeUnixNano": str(span["end_ns"]),
+                "attributes": self._attributes(span["attributes"]),
+                "status": {"code": 2, "message": span["error"]} if span["error"] else {"code": 1},
+            }
+            if span["parent_id"]:
+                otlp_span["parentSpanId"] = span["parent_id"]
+            otlp_spans.append(otlp_span)
+        body = {
+            "resourceSpans": [{
+                "resource": {"attributes": self._attributes({"service.name": service_name})},
+                "scopeSpans": [{"scope": {"name": "a2a"}, "spans": otlp_spans}],
+            }]
+        }
+        self._client.post(self.endpoint, json=body).raise_for_status()
+
+
+# -----------------------------------------------------------------------------
+# 🧭 Tracer
+# -----------------------------------------------------------------------------
+class Tracer:
+    """
+    Creates spans and hands finished ones to a background export thread.
+
+    Usage:
+        with tracer.span("agent.invoke", agent="city") as span:
+            ...
+    """
+
+    def __init__(
+        self,
+        exporters: List[Any] | None = None,
+        service_name: str | None = None,
+        max_batch: int = 512,
+        flush_interval: float = 1.0,
+    ):
+        self.exporters = exporters or []
+        self.service_name = service_name
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._thread_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        exporters: List[Any] = []
+        if os.getenv("A2A_TRACE_FILE"):
+            exporters.append(FileSpanExporter(os.environ["A2A_TRACE_FILE"]))
+        if os.getenv("A2A_TRACE_OTLP_ENDPOINT"):
+            exporters.append(OTLPHttpSpanExporter(os.environ["A2A_TRACE_OTLP_ENDPOINT"]))
+        return cls(exporters=exporters, service_name=os.getenv("A2A_SERVICE_NAME"))
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.exporters)
+
+    # -------------------------------------------------------------------------
+    # Spans
+    # -------------------------------------------------------------------------
+    @contextmanager
+    def span(self, name: str, traceparent: str | None = None, **attributes: Any) -> Iterator[Span | None]:
+        """
+        Time the enclosed block as a child of the current span.
+
+        Args:
+            name: Span name (e.g. "A2AServer._handle_request")
+            traceparent: Incoming W3C context; used as the parent when there
+                is no current span in this process
+            **attributes: Extra attributes recorded on the span
+        """
+        if not self.enabled:
+            yield None
+            return
+        parent = _current_span.get() or parse_traceparent(traceparent)
+        trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        span = Span(name, trace_id, parent.span_id if parent else None, attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end_ns = time.time_ns()
+            self._submit(span)
+
+    def current_traceparent(self) -> str | None:
+        span = _current_span.get()
+        return span.traceparent if span else None
+
+    def inject(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the current `traceparent` to a JSON-RPC request's params.metadata."""
+        traceparent = self.current_traceparent()
+        params = body.get("params")
+        if traceparent and isinstance(params, dict):
+            params["metadata"] = {**(params.get("metadata") or {}), TRACEPARENT_KEY: traceparent}
+        return body
+
+    @staticmethod
+    def extract(body: Any) -> str | None:
+        """Read `traceparent` from a JSON-RPC request's params.metadata, if present."""
+        if not isinstance(body, dict):
+            return None
+        params = body.get("params")
+        metadata = params.get("metadata") if isinstance(params, dict) else None
+        return metadata.get(TRACEPARENT_KEY) if isinstance(metadata, dict) else None
+
+    # -------------------------------------------------------------------------
+    # Export
+    # -------------------------------------------------------------------------
+    def _submit(self, span: Span) -> None:
+        self._queue.put(span.to_dict())
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._export_loop, name="a2a-trace-export", daemon=True)
+                    self._thread.start()
+                    atexit.register(self.flush)
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        batch = []
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _export(self, batch: List[Dict[str, Any]]) -> None:
+        service_name = self.service_name or "a2a-agent"
+        for exporter in self.exporters:
+            try:
+                exporter.export(batch, service_name)
+            except Exception as e:
+                logger.warning(f"Span export via {type(exporter).__name__} failed: {e}")
+
+    def _export_loop(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> None:
+        """Export everything queued so far."""
+        with self._flush_lock:
+            while batch := self._drain():
+                self._export(batch)
+
+
+# Process-wide tracer, configured from the environment
+tracer = Tracer.from_env()